@@ -35,12 +35,28 @@ def check_manifold(bm) -> bool:
     # Simple check for closed genus-0 mesh
     return (v - e + f) == 2
 
-def create_engineered_wall(name: str, length: float, seed: int = 0):
+def reset_scene():
+    """Remove all objects and data-blocks from the current file without reloading it.
+
+    Much cheaper than ``read_factory_settings`` and enough to isolate jobs in a
+    long-lived worker.
+    """
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for collection in (bpy.data.meshes, bpy.data.materials, bpy.data.images, bpy.data.collections):
+        for block in list(collection):
+            collection.remove(block)
+    bpy.data.orphans_purge(do_recursive=True)
+
+def create_engineered_wall(name: str, length: float, seed: int = 0, factory_reset: bool = True):
     """Create a wall with mathematically placed slots for openings."""
     rng = make_rng(seed, "wall_slots")
     
     # Clear existing data
-    bpy.ops.wm.read_factory_settings(use_empty=True)
+    if factory_reset:
+        bpy.ops.wm.read_factory_settings(use_empty=True)
+    else:
+        reset_scene()
     
     mesh = bpy.data.meshes.new(name)
     obj = bpy.data.objects.new(name, mesh)
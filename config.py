@@ -16,6 +16,18 @@ MAX_OBJECTS_PER_ROOM = 50
 MAX_LIBRARY_ASSETS = 10000
 MAX_RECURSIVE_DEPTH = 1
 BLENDER_MEMORY_WARN = 3000  # MB
+AABB_CACHE_SIZE = 65536  # Objects remembered by slot_engine.get_aabbs
+FIT_GRID_CELL = 0.25  # Meters; width/height bucket size of the asset index's slot-fit grid
+
+# Warm Blender workers (engine/worker_pool.py)
+WORKER_COUNT = int(os.environ.get("MF_WORKER_COUNT", "2"))
+WORKER_MAX_JOBS = 200  # Recycle a worker after this many jobs
+WORKER_MAX_RSS_MB = BLENDER_MEMORY_WARN  # ... or once its peak memory passes this
+WORKER_STARTUP_TIMEOUT = 60  # Seconds
+WORKER_JOB_TIMEOUT = 300  # Seconds
+
+# JSONL batch mode (run_command.py -- --batch)
+BATCH_REGISTER_CHUNK = 100  # Assets per locked inventory write
 
 # Validations
 ALLOWED_ROTATIONS = [0, 90, 180, 270]
@@ -30,6 +42,10 @@ REGISTRY_DIR = os.path.join(PROJECT_ROOT, "_registry")
 INVENTORY_FILE = os.path.join(REGISTRY_DIR, "inventory.json")
 SLOTS_FILE = os.path.join(REGISTRY_DIR, "slot_types.json")
 TAGS_FILE = os.path.join(REGISTRY_DIR, "tag_vocabulary.json")
+INVENTORY_DB = os.path.join(REGISTRY_DIR, "inventory.db")
+
+# Inventory storage: "json" (inventory.json) or "sqlite" (inventory.db in WAL mode)
+INVENTORY_BACKEND = os.environ.get("MF_INVENTORY_BACKEND", "json")
 
 # Blender Commands
 # IMPORTANT: This path needs to be configured for the specific OS and Blender installation.
@@ -0,0 +1,227 @@
+import heapq
+import json
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Use absolute import from the project root
+from config import FIT_GRID_CELL, INVENTORY_BACKEND, INVENTORY_DB, INVENTORY_FILE
+from engine.inventory_store import get_store
+from engine.locking import get_lock, lock_path_for
+
+# Bumped by in-process writers so readers reload even when mtime/size look unchanged
+_generation = 0
+
+
+def bump_generation():
+    global _generation
+    _generation += 1
+
+
+def _iter_bits(bits: int):
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+class AssetIndex:
+    """In-memory inverted tag index over one inventory file.
+
+    Each tag maps to an int bitset over asset positions, so a multi-tag query
+    is a chain of ``&`` operations instead of a scan over every asset. Assets
+    keep their file order, so the first match is the same one a linear scan
+    would find. The file is re-read only when its mtime/size or the module
+    generation counter changes. Returned dicts are shared; don't mutate them.
+
+    Assets with ``dimensions`` are also bucketed into a grid of
+    ``FIT_GRID_CELL`` sized width x height cells, each an int bitset like the
+    tag index, so slot-fit queries (:meth:`find_fitting`) only visit cells
+    that can fit and updates are a couple of bit operations.
+    """
+
+    def __init__(self, inventory_file: str):
+        self.inventory_file = inventory_file
+        self.assets: List[Dict] = []
+        self.positions: Dict[str, int] = {}
+        self.tag_bits: Dict[str, int] = {}
+        self.fit_cells: Dict[Tuple[int, int], int] = {}  # (width cell, height cell) -> position bitset
+        self._stamp: Optional[Tuple[int, int, int]] = None
+        self._lock = threading.Lock()
+
+    def _current_stamp(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(self.inventory_file)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, _generation)
+
+    def is_stale(self) -> bool:
+        """Whether the file changed, or was never read, since the index last loaded it."""
+        return self._stamp is None or self._stamp != self._current_stamp()
+
+    def refresh(self) -> "AssetIndex":
+        """Reload the inventory if it changed since the last load."""
+        stamp = self._current_stamp()
+        if stamp == self._stamp:
+            return self
+        with self._lock:
+            if stamp == self._stamp:
+                return self
+            inventory = {}
+            if stamp is not None:
+                # Shared lock: never read a file a writer is halfway through
+                with get_lock(lock_path_for(self.inventory_file)).shared():
+                    with open(self.inventory_file, "r") as f:
+                        inventory = json.load(f)
+            self._rebuild(inventory.get("assets", {}).values())
+            self._stamp = stamp
+        return self
+
+    def _rebuild(self, assets: Iterable[Dict]):
+        self.assets = []
+        self.positions = {}
+        self.tag_bits = {}
+        self.fit_cells = {}
+        for asset_data in assets:
+            self.add(asset_data)
+
+    def record_write(self, assets: Iterable[Dict]):
+        """Apply assets the caller just wrote, instead of reloading the whole file.
+
+        Only call this when :meth:`is_stale` was false before the write;
+        otherwise leave the index alone and the next :meth:`refresh` reloads.
+        """
+        with self._lock:
+            for asset_data in assets:
+                self.add(asset_data)
+            self._stamp = self._current_stamp()
+
+    @staticmethod
+    def _size(asset_data: Dict) -> Optional[Tuple[float, float]]:
+        dims = asset_data.get("dimensions") or {}
+        if "width" not in dims or "height" not in dims:
+            return None
+        return float(dims["width"]), float(dims["height"])
+
+    @staticmethod
+    def _cell(size: Tuple[float, float]) -> Tuple[int, int]:
+        return int(size[0] // FIT_GRID_CELL), int(size[1] // FIT_GRID_CELL)
+
+    def add(self, asset_data: Dict):
+        """Index one asset; replaces an existing entry with the same name in place."""
+        name = asset_data["name"]
+        pos = self.positions.get(name)
+        if pos is None:
+            pos = len(self.assets)
+            self.assets.append(asset_data)
+            self.positions[name] = pos
+        else:
+            old = self.assets[pos]
+            bit = 1 << pos
+            for tag in old.get("tags", []):
+                self.tag_bits[tag] &= ~bit
+            old_size = self._size(old)
+            if old_size is not None:
+                cell = self._cell(old_size)
+                self.fit_cells[cell] &= ~bit
+                if not self.fit_cells[cell]:
+                    del self.fit_cells[cell]
+            self.assets[pos] = asset_data
+        bit = 1 << pos
+        for tag in asset_data.get("tags", []):
+            self.tag_bits[tag] = self.tag_bits.get(tag, 0) | bit
+        size = self._size(asset_data)
+        if size is not None:
+            cell = self._cell(size)
+            self.fit_cells[cell] = self.fit_cells.get(cell, 0) | bit
+
+    def match_bits(self, tags: List[str]) -> int:
+        """Bitset of assets carrying every tag in ``tags``."""
+        bits = (1 << len(self.assets)) - 1
+        for tag in tags:
+            bits &= self.tag_bits.get(tag, 0)
+            if not bits:
+                break
+        return bits
+
+    def find_assets(self, tags: List[str], limit: Optional[int] = None) -> List[Dict]:
+        """All assets matching every tag, in inventory order, up to ``limit``."""
+        self.refresh()
+        matches = []
+        for pos in _iter_bits(self.match_bits(tags)):
+            if limit is not None and len(matches) >= limit:
+                break
+            matches.append(self.assets[pos])
+        return matches
+
+    def find_fitting(self, tags: List[str], width: float, height: float, limit: Optional[int] = None) -> List[Dict]:
+        """Assets with every tag whose width and height fit inside ``width`` x ``height``.
+
+        Results are ordered by leftover size ``(width - w) + (height - h)``,
+        tightest fit first. Only grid cells at or below the slot size in both
+        dimensions are visited, best possible leftover first; with a ``limit``
+        the walk stops once no remaining cell can beat the best found so far.
+        """
+        self.refresh()
+        bits = self.match_bits(tags)
+        keep = limit if limit is not None else len(self.assets)
+        if not bits or keep <= 0:
+            return []
+
+        max_cell = self._cell((width, height))
+        cells = []  # (smallest leftover any asset in the cell can have, matching bits)
+        for (cw, ch), cell_bits in self.fit_cells.items():
+            if cw > max_cell[0] or ch > max_cell[1]:
+                continue
+            cell_bits &= bits
+            if cell_bits:
+                bound = (width - min(width, (cw + 1) * FIT_GRID_CELL)) + (height - min(height, (ch + 1) * FIT_GRID_CELL))
+                cells.append((bound, cell_bits))
+        cells.sort(key=lambda c: c[0])
+
+        best: List[Tuple[float, int]] = []  # max-heap of (-leftover, -position)
+        for bound, cell_bits in cells:
+            if len(best) == keep and bound > -best[0][0]:
+                break
+            for pos in _iter_bits(cell_bits):
+                w, h = self._size(self.assets[pos])
+                if w > width or h > height:
+                    continue
+                entry = (-((width - w) + (height - h)), -pos)
+                if len(best) < keep:
+                    heapq.heappush(best, entry)
+                elif entry > best[0]:
+                    heapq.heapreplace(best, entry)
+        return [self.assets[-neg_pos] for _, neg_pos in sorted(best, reverse=True)]
+
+
+_indexes: Dict[str, AssetIndex] = {}
+
+
+def loaded_index(inventory_file: str = INVENTORY_FILE) -> Optional[AssetIndex]:
+    """The shared index for ``inventory_file`` if one exists, without refreshing it."""
+    return _indexes.get(inventory_file)
+
+
+def get_index(inventory_file: str = INVENTORY_FILE) -> AssetIndex:
+    """Process-wide shared index for ``inventory_file``."""
+    index = _indexes.get(inventory_file)
+    if index is None:
+        index = _indexes.setdefault(inventory_file, AssetIndex(inventory_file))
+    return index.refresh()
+
+
+def inventory_backend(backend: str = INVENTORY_BACKEND, inventory_file: str = INVENTORY_FILE, inventory_db: str = INVENTORY_DB):
+    """The store answering ``find_assets``/``find_fitting`` for ``backend``.
+
+    ``"sqlite"`` selects the SQLite store at ``inventory_db``; anything else
+    the shared JSON index over ``inventory_file``.
+    """
+    if backend == "sqlite":
+        return get_store(inventory_db)
+    return get_index(inventory_file)
+
+
+def find_assets(tags: List[str], limit: Optional[int] = None, inventory_file: str = INVENTORY_FILE) -> List[Dict]:
+    return get_index(inventory_file).find_assets(tags, limit)
@@ -3,54 +3,64 @@ import os
 import time
 from typing import List, Dict, Optional
 
-# Use absolute import from the project rootfrom config import INVENTORY_FILE, REGISTRY_DIR
+# Use absolute import from the project root
+from config import INVENTORY_BACKEND, INVENTORY_DB, INVENTORY_FILE, REGISTRY_DIR
+from engine.asset_index import bump_generation, inventory_backend, loaded_index
+from engine.inventory_store import get_store
+from engine.locking import LockStats, get_lock
 LOCK_FILE = os.path.join(REGISTRY_DIR, ".inventory.lock")
 
 class InventoryManager:
     @staticmethod
-    def acquire_lock(timeout=5):
-        """Acquire a simple file lock for inventory operations."""
-        start_time = time.time()
-        while os.path.exists(LOCK_FILE):
-            if time.time() - start_time > timeout:
-                raise TimeoutError("Could not acquire inventory lock")
-            time.sleep(0.1)
-        with open(LOCK_FILE, "w") as f:
-            f.write(str(os.getpid()))
+    def lock(exclusive: bool = True):
+        """Context manager holding the inventory lock (shared for reads, exclusive for writes)."""
+        return get_lock(LOCK_FILE).hold(exclusive)
 
     @staticmethod
-    def release_lock():
-        """Release the inventory file lock."""
-        if os.path.exists(LOCK_FILE):
-            os.remove(LOCK_FILE)
+    def lock_stats() -> LockStats:
+        """Wait/hold time metrics for the inventory lock in this process."""
+        return get_lock(LOCK_FILE).stats
 
     @staticmethod
     def find_asset(tags: List[str]) -> Optional[Dict]:
         """Find an asset matching all tags using the registry."""
-        if not os.path.exists(INVENTORY_FILE):
-            return None
-            
-        with open(INVENTORY_FILE, "r") as f:
-            inventory = json.load(f)
-            
-        for asset_name, asset_data in inventory.get("assets", {}).items():
-            asset_tags = asset_data.get("tags", [])
-            if all(tag in asset_tags for tag in tags):
-                return asset_data
-        return None
+        matches = InventoryManager.find_assets(tags, limit=1)
+        return matches[0] if matches else None
+
+    @staticmethod
+    def find_assets(tags: List[str], limit: Optional[int] = None) -> List[Dict]:
+        """Every asset matching all tags, in registry order."""
+        return inventory_backend(INVENTORY_BACKEND, INVENTORY_FILE, INVENTORY_DB).find_assets(tags, limit)
+
+    @staticmethod
+    def find_fitting_assets(tags: List[str], width: float, height: float, limit: Optional[int] = None) -> List[Dict]:
+        """Assets with all tags that fit a ``width`` x ``height`` slot, tightest fit first."""
+        return inventory_backend(INVENTORY_BACKEND, INVENTORY_FILE, INVENTORY_DB).find_fitting(tags, width, height, limit)
 
     @staticmethod
     def register_asset(asset_data: Dict):
         """Add or update an asset in the inventory with locking."""
-        InventoryManager.acquire_lock()
-        try:
+        InventoryManager.register_assets([asset_data])
+
+    @staticmethod
+    def register_assets(assets: List[Dict]):
+        """Add or update many assets with a single locked read-modify-write."""
+        if not assets:
+            return
+        if INVENTORY_BACKEND == "sqlite":
+            # WAL transactions replace the file lock and whole-file rewrite
+            get_store(INVENTORY_DB).upsert_assets(assets)
+            return
+        index = loaded_index(INVENTORY_FILE)
+        with InventoryManager.lock():
+            in_sync = index is not None and not index.is_stale()
             inventory = {"version": "1.0", "assets": {}}
             if os.path.exists(INVENTORY_FILE):
                 with open(INVENTORY_FILE, "r") as f:
                     inventory = json.load(f)
             
-            name = asset_data["name"]
-            inventory["assets"][name] = asset_data
+            for asset_data in assets:
+                inventory["assets"][asset_data["name"]] = asset_data
             inventory["last_updated"] = time.strftime("%Y-%m-%dT%H:%M:%S")
             
             # Ensure directory exists
@@ -58,5 +68,7 @@ class InventoryManager:
             
             with open(INVENTORY_FILE, "w") as f:
                 json.dump(inventory, f, indent=2)
-        finally:
-            InventoryManager.release_lock()
+            bump_generation()
+            if in_sync:
+                # Update the in-process index in place rather than re-reading the file
+                index.record_write(assets)
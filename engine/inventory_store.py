@@ -0,0 +1,186 @@
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+# Use absolute import from the project root
+from config import INVENTORY_DB
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS assets (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    width REAL,
+    height REAL,
+    depth REAL,
+    data TEXT NOT NULL,
+    updated TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tags (
+    asset_id INTEGER NOT NULL REFERENCES assets(id) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (asset_id, tag)
+);
+CREATE INDEX IF NOT EXISTS idx_tags_tag ON tags(tag, asset_id);
+CREATE INDEX IF NOT EXISTS idx_assets_size ON assets(width, height);
+CREATE TABLE IF NOT EXISTS slots (
+    asset_id INTEGER NOT NULL REFERENCES assets(id) ON DELETE CASCADE,
+    slot_id TEXT,
+    type TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_slots_type ON slots(type);
+CREATE INDEX IF NOT EXISTS idx_slots_asset ON slots(asset_id);
+"""
+
+
+class SqliteInventoryStore:
+    """Inventory registry in an SQLite database running in WAL mode.
+
+    WAL lets any number of readers run alongside one writer, so workers no
+    longer serialize on a whole-file rewrite. Each thread gets its own
+    connection. Assets keep the order they were first registered in, like
+    the keys of ``inventory.json``.
+    """
+
+    def __init__(self, path: str = INVENTORY_DB, timeout: float = 30.0):
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def upsert_assets(self, assets: Iterable[Dict]):
+        """Insert or replace many assets in one transaction."""
+        now = time.strftime("%Y-%m-%dT%H:%M:%S")
+        conn = self._connect()
+        with conn:
+            for asset_data in assets:
+                dims = asset_data.get("dimensions", {})
+                asset_id = conn.execute(
+                    "INSERT INTO assets (name, width, height, depth, data, updated) VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(name) DO UPDATE SET width=excluded.width, height=excluded.height, "
+                    "depth=excluded.depth, data=excluded.data, updated=excluded.updated RETURNING id",
+                    (asset_data["name"], dims.get("width"), dims.get("height"), dims.get("depth"),
+                     json.dumps(asset_data), now),
+                ).fetchone()[0]
+                conn.execute("DELETE FROM tags WHERE asset_id = ?", (asset_id,))
+                conn.execute("DELETE FROM slots WHERE asset_id = ?", (asset_id,))
+                conn.executemany(
+                    "INSERT OR IGNORE INTO tags (asset_id, tag) VALUES (?, ?)",
+                    [(asset_id, tag) for tag in asset_data.get("tags", [])],
+                )
+                conn.executemany(
+                    "INSERT INTO slots (asset_id, slot_id, type, data) VALUES (?, ?, ?, ?)",
+                    [(asset_id, s.get("id"), s.get("type"), json.dumps(s)) for s in asset_data.get("slots", [])],
+                )
+
+    def get_asset(self, name: str) -> Optional[Dict]:
+        row = self._connect().execute("SELECT data FROM assets WHERE name = ?", (name,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def find_assets(self, tags: List[str], limit: Optional[int] = None) -> List[Dict]:
+        """Assets carrying every tag in ``tags``, in registration order."""
+        tags = list(dict.fromkeys(tags))
+        if tags:
+            placeholders = ", ".join("?" * len(tags))
+            query = (
+                "SELECT data FROM assets WHERE id IN ("
+                f"SELECT asset_id FROM tags WHERE tag IN ({placeholders}) "
+                "GROUP BY asset_id HAVING COUNT(*) = ?) ORDER BY id"
+            )
+            params: list = [*tags, len(tags)]
+        else:
+            query, params = "SELECT data FROM assets ORDER BY id", []
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [json.loads(data) for (data,) in self._connect().execute(query, params)]
+
+    def find_fitting(self, tags: List[str], width: float, height: float, limit: Optional[int] = None) -> List[Dict]:
+        """Assets with every tag that fit ``width`` x ``height``, tightest fit first."""
+        tags = list(dict.fromkeys(tags))
+        query = "SELECT data FROM assets WHERE width <= ? AND height <= ?"
+        params: list = [width, height]
+        if tags:
+            placeholders = ", ".join("?" * len(tags))
+            query += (
+                f" AND id IN (SELECT asset_id FROM tags WHERE tag IN ({placeholders}) "
+                "GROUP BY asset_id HAVING COUNT(*) = ?)"
+            )
+            params += [*tags, len(tags)]
+        query += " ORDER BY (? - width) + (? - height), id"
+        params += [width, height]
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [json.loads(data) for (data,) in self._connect().execute(query, params)]
+
+    def find_slots(self, slot_type: str) -> List[Dict]:
+        """Every slot of ``slot_type`` with the name of the asset it belongs to."""
+        rows = self._connect().execute(
+            "SELECT assets.name, slots.data FROM slots JOIN assets ON assets.id = slots.asset_id "
+            "WHERE slots.type = ? ORDER BY assets.id", (slot_type,),
+        )
+        return [{"asset": name, **json.loads(data)} for name, data in rows]
+
+    def count(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM assets").fetchone()[0]
+
+    def import_json(self, inventory_file: str) -> int:
+        """Load every asset from an ``inventory.json`` file; returns how many."""
+        with open(inventory_file, "r") as f:
+            assets = list(json.load(f).get("assets", {}).values())
+        self.upsert_assets(assets)
+        return len(assets)
+
+    def export_json(self, inventory_file: str):
+        """Write the registry in the ``inventory.json`` format, atomically."""
+        inventory = {
+            "version": "1.0",
+            "last_updated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "assets": {a["name"]: a for a in self.find_assets([])},
+        }
+        directory = os.path.dirname(os.path.abspath(inventory_file))
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(inventory, f, indent=2)
+            os.replace(tmp, inventory_file)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+
+_stores: Dict[str, SqliteInventoryStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(path: str = INVENTORY_DB) -> SqliteInventoryStore:
+    """Process-wide store for ``path``."""
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = _stores[path] = SqliteInventoryStore(path)
+        return store
@@ -0,0 +1,120 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@dataclass
+class LockStats:
+    acquisitions: int = 0
+    contended: int = 0
+    wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    hold_seconds: float = 0.0
+    max_hold_seconds: float = 0.0
+
+    def record(self, waited: float, held: float, contended: bool):
+        self.acquisitions += 1
+        self.contended += contended
+        self.wait_seconds += waited
+        self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        self.hold_seconds += held
+        self.max_hold_seconds = max(self.max_hold_seconds, held)
+
+
+class FileLock:
+    """OS-level advisory lock on a lock file.
+
+    Uses ``fcntl.flock``: shared locks for readers, exclusive locks for
+    writers. Waiting blocks in the kernel instead of polling, and the lock
+    goes away with the process, so a crashed worker cannot leave it stale.
+    Every acquisition opens its own descriptor, so threads of one process
+    exclude each other too. On Windows ``msvcrt.locking`` is used and shared
+    requests are taken exclusively.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.stats = LockStats()
+        self._stats_lock = threading.Lock()
+
+    def _open(self) -> int:
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        return os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+
+    def _lock(self, fd: int, exclusive: bool) -> bool:
+        """Take the lock on ``fd``, blocking if needed; returns whether it was contended."""
+        if fcntl is not None:
+            mode = fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+            try:
+                fcntl.flock(fd, mode | fcntl.LOCK_NB)
+                return False
+            except BlockingIOError:
+                fcntl.flock(fd, mode)
+                return True
+        try:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            return False
+        except OSError:
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            return True
+
+    def _unlock(self, fd: int):
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+    @contextmanager
+    def hold(self, exclusive: bool = True):
+        fd = self._open()
+        start = time.perf_counter()
+        try:
+            contended = self._lock(fd, exclusive)
+            acquired = time.perf_counter()
+            try:
+                yield self
+            finally:
+                self._unlock(fd)
+                released = time.perf_counter()
+                with self._stats_lock:
+                    self.stats.record(acquired - start, released - acquired, contended)
+        finally:
+            os.close(fd)
+
+    def shared(self):
+        """Context manager holding a shared (read) lock."""
+        return self.hold(exclusive=False)
+
+    def exclusive(self):
+        """Context manager holding an exclusive (write) lock."""
+        return self.hold(exclusive=True)
+
+
+_locks: Dict[str, FileLock] = {}
+_locks_guard = threading.Lock()
+
+
+def get_lock(path: str) -> FileLock:
+    """Process-wide :class:`FileLock` for ``path``, shared so its stats add up."""
+    path = os.path.abspath(path)
+    with _locks_guard:
+        lock = _locks.get(path)
+        if lock is None:
+            lock = _locks[path] = FileLock(path)
+        return lock
+
+
+def lock_path_for(data_file: str) -> str:
+    """Lock file guarding ``data_file`` (``.inventory.lock`` next to ``inventory.json``)."""
+    stem = os.path.splitext(os.path.basename(data_file))[0]
+    return os.path.join(os.path.dirname(os.path.abspath(data_file)), f".{stem}.lock")
@@ -1,42 +1,89 @@
-import json
-import os
 from typing import List, Dict, Optional, Tuple
 
 # Use absolute import from the project root
-from config import INVENTORY_FILE
+from config import AABB_CACHE_SIZE, INVENTORY_BACKEND, INVENTORY_DB, INVENTORY_FILE
+from engine.asset_index import inventory_backend
+
+# name -> (matrix/dimension key, min, max) of objects already measured
+_aabb_cache: Dict[str, Tuple[bytes, object, object]] = {}
+
+def clear_aabb_cache():
+    _aabb_cache.clear()
+
+def get_aabbs(objects) -> Tuple["np.ndarray", "np.ndarray"]:
+    """World-space AABBs of many Blender objects as ``(N, 3)`` min and max arrays.
+
+    Bound-box corners of all changed objects are stacked into one
+    ``(N, 8, 4)`` array and transformed by their ``(N, 4, 4)`` world matrices
+    in a single einsum. Objects whose name, world matrix and dimensions are
+    unchanged since the last call are served from a cache.
+    """
+    import numpy as np
+
+    n = len(objects)
+    mins = np.empty((n, 3))
+    maxs = np.empty((n, 3))
+    if n == 0:
+        return mins, maxs
+
+    matrices = np.array([obj.matrix_world for obj in objects], dtype=np.float64).reshape(n, 4, 4)
+    dims = np.array([obj.dimensions for obj in objects], dtype=np.float64).reshape(n, 3)
+    keys = [matrices[i].tobytes() + dims[i].tobytes() for i in range(n)]
+
+    stale = []
+    for i, obj in enumerate(objects):
+        cached = _aabb_cache.get(obj.name)
+        if cached is not None and cached[0] == keys[i]:
+            mins[i], maxs[i] = cached[1], cached[2]
+        else:
+            stale.append(i)
+
+    if stale:
+        corners = np.ones((len(stale), 8, 4))
+        corners[:, :, :3] = np.array([objects[i].bound_box for i in stale], dtype=np.float64).reshape(-1, 8, 3)
+        world = np.einsum("nij,nkj->nki", matrices[stale], corners)[:, :, :3]
+        mins[stale] = world.min(axis=1)
+        maxs[stale] = world.max(axis=1)
+        if len(_aabb_cache) + len(stale) > AABB_CACHE_SIZE:
+            _aabb_cache.clear()
+        for i in stale:
+            _aabb_cache[objects[i].name] = (keys[i], mins[i].copy(), maxs[i].copy())
+
+    return mins, maxs
 
 def get_aabb(obj) -> Dict[str, List[float]]:
     """Calculate Axis-Aligned Bounding Box for a Blender object."""
-    import numpy as np
-    # Local coordinates of the bounding box corners
-    bbox_corners = [obj.matrix_world @ np.array(v) for v in obj.bound_box]
-    bbox_corners = np.array(bbox_corners)
-    
-    min_coords = bbox_corners.min(axis=0).tolist()
-    max_coords = bbox_corners.max(axis=0).tolist()
-    
+    mins, maxs = get_aabbs([obj])
     return {
-        "min": min_coords,
-        "max": max_coords
+        "min": mins[0].tolist(),
+        "max": maxs[0].tolist()
     }
 
 def find_asset(tags: List[str]) -> Optional[Dict]:
     """Find an asset in the inventory that matches all provided tags."""
-    if not os.path.exists(INVENTORY_FILE):
-        return None
-        
-    with open(INVENTORY_FILE, "r") as f:
-        inventory = json.load(f)
-        
-    for asset_id, asset_data in inventory.get("assets", {}).items():
-        if all(tag in asset_data.get("tags", []) for tag in tags):
-            return asset_data
-            
-    return None
+    matches = find_assets(tags, limit=1)
+    return matches[0] if matches else None
+
+def find_assets(tags: List[str], limit: Optional[int] = None) -> List[Dict]:
+    """Every asset in the inventory that matches all provided tags."""
+    return inventory_backend(INVENTORY_BACKEND, INVENTORY_FILE, INVENTORY_DB).find_assets(tags, limit)
+
+def find_fitting_assets(tags: List[str], width: float, height: float, limit: Optional[int] = None) -> List[Dict]:
+    """Assets matching all tags that fit a ``width`` x ``height`` slot, tightest fit first."""
+    return inventory_backend(INVENTORY_BACKEND, INVENTORY_FILE, INVENTORY_DB).find_fitting(tags, width, height, limit)
 
 def place_on_slot(parent_obj, slot_data: Dict, asset_tags: List[str]):
-    """Place a matching asset on a specific slot of a parent object."""
-    asset_data = find_asset(asset_tags)
+    """Place a matching asset on a specific slot of a parent object.
+
+    When the slot has a ``size`` ([width, height]) the tightest-fitting asset
+    is chosen; otherwise the first asset with the tags.
+    """
+    size = slot_data.get("size")
+    if size:
+        matches = find_fitting_assets(asset_tags, size[0], size[1], limit=1)
+        asset_data = matches[0] if matches else None
+    else:
+        asset_data = find_asset(asset_tags)
     if not asset_data:
         return {"status": "error", "message": f"Asset not found for tags: {asset_tags}"}
         
@@ -0,0 +1,189 @@
+import json
+import os
+import queue
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set
+
+# Use absolute import from the project root
+from config import (
+    BLENDER_PATH, HEADLESS_ARGS, PROJECT_ROOT, WORKER_COUNT, WORKER_JOB_TIMEOUT,
+    WORKER_MAX_JOBS, WORKER_MAX_RSS_MB, WORKER_STARTUP_TIMEOUT,
+)
+
+RESULT_PREFIX = "@@MF_RESULT "
+_EOF = object()
+
+
+def default_worker_command() -> List[str]:
+    """Headless Blender running ``run_command.py`` in worker mode."""
+    return [BLENDER_PATH, *HEADLESS_ARGS, os.path.join(PROJECT_ROOT, "run_command.py"), "--", "--worker"]
+
+
+class WorkerCrashed(RuntimeError):
+    """The worker process exited or stopped answering mid-job."""
+
+
+class _Worker:
+    """One warm worker process and the thread that reads its result lines."""
+
+    def __init__(self, command: List[str]):
+        self.proc = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+            cwd=PROJECT_ROOT,
+        )
+        self.jobs = 0
+        self.rss_mb = 0.0
+        self.ready = False
+        self._results: "queue.Queue" = queue.Queue()
+        threading.Thread(target=self._read, daemon=True).start()
+
+    def _read(self):
+        for line in self.proc.stdout:
+            # Anything without the prefix is Blender's own logging
+            if line.startswith(RESULT_PREFIX):
+                self._results.put(json.loads(line[len(RESULT_PREFIX):]))
+        self._results.put(_EOF)
+
+    def _next(self, timeout: float) -> Dict:
+        try:
+            message = self._results.get(timeout=timeout)
+        except queue.Empty:
+            raise WorkerCrashed(f"Worker {self.proc.pid} timed out after {timeout}s")
+        if message is _EOF:
+            raise WorkerCrashed(f"Worker {self.proc.pid} exited with code {self.proc.wait()}")
+        return message
+
+    def request(self, command_data: Dict, timeout: float, startup_timeout: float) -> Dict:
+        if not self.ready:
+            self._next(startup_timeout)
+            self.ready = True
+        try:
+            self.proc.stdin.write(json.dumps(command_data) + "\n")
+            self.proc.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            raise WorkerCrashed(f"Worker {self.proc.pid} is gone: {e}")
+        result = self._next(timeout)
+        self.jobs += 1
+        self.rss_mb = result.get("rss_mb", 0.0)
+        return result
+
+    def stop(self, timeout: float = 5.0):
+        if self.proc.poll() is None:
+            try:
+                self.proc.stdin.write(json.dumps({"command": "shutdown"}) + "\n")
+                self.proc.stdin.close()
+                self.proc.wait(timeout)
+            except (OSError, subprocess.TimeoutExpired):
+                self.proc.kill()
+                self.proc.wait()
+
+
+class WorkerPool:
+    """Supervisor keeping ``size`` warm Blender workers.
+
+    Workers are started up front so Blender's startup cost is paid once per
+    worker rather than once per command. A worker is replaced after
+    ``max_jobs`` jobs, once its peak memory passes ``max_rss_mb``, or when it
+    crashes or times out; the affected job reports an error instead of
+    taking the pool down. If a replacement cannot be started, its slot is
+    dropped and ``size`` shrinks.
+    """
+
+    def __init__(
+        self,
+        size: int = WORKER_COUNT,
+        command: Optional[List[str]] = None,
+        max_jobs: int = WORKER_MAX_JOBS,
+        max_rss_mb: float = WORKER_MAX_RSS_MB,
+        job_timeout: float = WORKER_JOB_TIMEOUT,
+        startup_timeout: float = WORKER_STARTUP_TIMEOUT,
+    ):
+        self.size = size
+        self.command = command or default_worker_command()
+        self.max_jobs = max_jobs
+        self.max_rss_mb = max_rss_mb
+        self.job_timeout = job_timeout
+        self.startup_timeout = startup_timeout
+        self.stats = {"jobs": 0, "recycled": 0, "crashed": 0}
+        self._lock = threading.Lock()
+        # Idle workers; None once every slot is gone, so waiting submits fail instead of blocking
+        self._idle: "queue.Queue[Optional[_Worker]]" = queue.Queue()
+        self._workers: Set[_Worker] = set()  # Idle and checked out, so close() reaches all of them
+        self._closed = False
+        for _ in range(size):
+            worker = _Worker(self.command)
+            self._workers.add(worker)
+            self._idle.put(worker)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _replace(self, worker: _Worker, reason: str) -> Optional[_Worker]:
+        """Stop ``worker`` and start its successor, or drop the slot if that fails."""
+        if reason == "crashed":
+            # It may be hung; don't wait for a graceful shutdown
+            worker.proc.kill()
+        worker.stop()
+        with self._lock:
+            self.stats[reason] += 1
+            self._workers.discard(worker)
+            if self._closed:
+                return None
+            try:
+                successor = _Worker(self.command)
+            except OSError:
+                self.size -= 1
+                if not self.size:
+                    self._idle.put(None)
+                return None
+            self._workers.add(successor)
+            return successor
+
+    def submit(self, command_data: Dict) -> Dict:
+        """Run one command on the next idle worker and return its result."""
+        if self._closed:
+            raise RuntimeError("WorkerPool is closed")
+        worker = self._idle.get()
+        if worker is None:
+            self._idle.put(None)
+            raise RuntimeError("WorkerPool has no workers left")
+        start = time.perf_counter()
+        try:
+            result = worker.request(command_data, self.job_timeout, self.startup_timeout)
+            if worker.jobs >= self.max_jobs or worker.rss_mb >= self.max_rss_mb:
+                worker = self._replace(worker, "recycled")
+        except WorkerCrashed as e:
+            result = {"status": "error", "message": str(e), "id": command_data.get("id")}
+            worker = self._replace(worker, "crashed")
+        finally:
+            if worker is not None:
+                self._idle.put(worker)
+        with self._lock:
+            self.stats["jobs"] += 1
+        result["duration_ms"] = round((time.perf_counter() - start) * 1000, 3)
+        return result
+
+    def map(self, commands: Iterable[Dict]) -> List[Dict]:
+        """Run ``commands`` across all workers; results keep the input order."""
+        with ThreadPoolExecutor(max_workers=max(self.size, 1)) as executor:
+            return list(executor.map(self.submit, commands))
+
+    def close(self):
+        """Stop every worker, including ones still running a job."""
+        with self._lock:
+            self._closed = True
+            workers = list(self._workers)
+            self._workers.clear()
+        for worker in workers:
+            worker.stop()
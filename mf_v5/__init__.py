@@ -1,4 +1,5 @@
 from .datamodel import BuildingSpec, RoofType
 from .engine import generate
+from .batch import BatchResult, generate_batch
 
-__all__ = ["BuildingSpec", "RoofType", "generate"]
+__all__ = ["BuildingSpec", "RoofType", "generate", "generate_batch", "BatchResult"]
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Callable, DefaultDict, Dict, List, Optional, Tuple
 
-from .config import EPSILON
+from .config import EPSILON, GRID
 from .datamodel import AdjacencyMap, Corridor, Rect, Room
 
 
@@ -31,7 +33,8 @@ def _touches_west(a: Rect, b: Rect) -> bool:
     return abs(a.min_x - b.max_x) <= EPSILON and _overlap_1d(a.min_y, a.max_y, b.min_y, b.max_y) > EPSILON
 
 
-def build_adjacency(rooms: List[Room]) -> AdjacencyMap:
+def build_adjacency_pairwise(rooms: List[Room]) -> AdjacencyMap:
+    """Reference O(n²) implementation; kept for equivalence tests and benchmarks."""
     adjacency: AdjacencyMap = {room.id: {side: None for side in SIDES} for room in rooms}
 
     for i, room_a in enumerate(rooms):
@@ -54,6 +57,102 @@ def build_adjacency(rooms: List[Room]) -> AdjacencyMap:
     return adjacency
 
 
+def _bucket(value: float) -> int:
+    return round(value / GRID)
+
+
+class _EdgeLine:
+    """Rooms whose edge lies on one grid line, sorted along the line.
+
+    ``ends_max[i]`` is the largest interval end among the first ``i + 1``
+    entries, which lets a query stop scanning as soon as nothing further
+    back can overlap it.
+    """
+
+    __slots__ = ("starts", "ends_max", "positions")
+
+    def __init__(self, entries: List[Tuple[float, float, int]]):
+        entries.sort()
+        self.starts = [start for start, _, _ in entries]
+        self.positions = [pos for _, _, pos in entries]
+        self.ends_max = []
+        running = float("-inf")
+        for _, end, _ in entries:
+            running = max(running, end)
+            self.ends_max.append(running)
+
+    def candidates(self, lo: float, hi: float):
+        i = bisect_left(self.starts, hi - EPSILON) - 1
+        while i >= 0 and self.ends_max[i] > lo + EPSILON:
+            yield self.positions[i]
+            i -= 1
+
+
+def _edge_lines(rooms: List[Room], edge: Callable[[Rect], float], interval: Callable[[Rect], Tuple[float, float]]) -> Dict[int, _EdgeLine]:
+    grouped: DefaultDict[int, List[Tuple[float, float, int]]] = defaultdict(list)
+    for pos, room in enumerate(rooms):
+        start, end = interval(room.rect)
+        grouped[_bucket(edge(room.rect))].append((start, end, pos))
+    return {key: _EdgeLine(entries) for key, entries in grouped.items()}
+
+
+def _x_span(r: Rect) -> Tuple[float, float]:
+    return r.min_x, r.max_x
+
+
+def _y_span(r: Rect) -> Tuple[float, float]:
+    return r.min_y, r.max_y
+
+
+def _neighbour(
+    rooms: List[Room],
+    pos: int,
+    lines: Dict[int, _EdgeLine],
+    coord: float,
+    span: Tuple[float, float],
+    touches: Callable[[Rect, Rect], bool],
+) -> Optional[int]:
+    """Highest-positioned room on the line at ``coord`` that ``touches`` rooms[pos]."""
+    key = _bucket(coord)
+    best = -1
+    rect = rooms[pos].rect
+    # Coordinates within EPSILON of each other can straddle a bucket boundary
+    for k in (key - 1, key, key + 1):
+        line = lines.get(k)
+        if line is None:
+            continue
+        for other in line.candidates(*span):
+            if other != pos and other > best and touches(rect, rooms[other].rect):
+                best = other
+    return rooms[best].id if best >= 0 else None
+
+
+def build_adjacency(rooms: List[Room]) -> AdjacencyMap:
+    """Side-by-side neighbours of every room.
+
+    Room edges are bucketed by their grid-snapped coordinate and sorted along
+    that line, so each side is only tested against rooms whose opposite edge
+    lies on the same line and whose extent can overlap it. The result matches
+    :func:`build_adjacency_pairwise`, including which neighbour wins when
+    several touch one side (the one latest in ``rooms``).
+    """
+    by_min_x = _edge_lines(rooms, lambda r: r.min_x, _y_span)
+    by_max_x = _edge_lines(rooms, lambda r: r.max_x, _y_span)
+    by_min_y = _edge_lines(rooms, lambda r: r.min_y, _x_span)
+    by_max_y = _edge_lines(rooms, lambda r: r.max_y, _x_span)
+
+    adjacency: AdjacencyMap = {room.id: {side: None for side in SIDES} for room in rooms}
+    for pos, room in enumerate(rooms):
+        r = room.rect
+        sides = adjacency[room.id]
+        sides["north"] = _neighbour(rooms, pos, by_min_y, r.max_y, _x_span(r), _touches_north)
+        sides["south"] = _neighbour(rooms, pos, by_max_y, r.min_y, _x_span(r), _touches_south)
+        sides["east"] = _neighbour(rooms, pos, by_min_x, r.max_x, _y_span(r), _touches_east)
+        sides["west"] = _neighbour(rooms, pos, by_max_x, r.min_x, _y_span(r), _touches_west)
+
+    return adjacency
+
+
 def corridor_facing_walls(rooms: List[Room], corridor: Corridor) -> Dict[int, List[str]]:
     facing: Dict[int, List[str]] = {room.id: [] for room in rooms}
     c = corridor.rect
@@ -0,0 +1,182 @@
+"""Content-addressed cache of finished building exports.
+
+An entry holds ``Building.glb``, the collider file, any LOD GLBs, the export
+manifest and a ``result.json`` summary, all stored under a key that hashes the spec, every
+generation constant in :mod:`mf_v5.config`, the export settings and
+:data:`CODE_VERSION`. A hit rebuilds the :class:`GenerationOutput` from disk
+without planning, meshing or touching ``bpy``.
+
+Entries are assembled in a private staging directory and published with a
+single directory rename, so readers only ever see complete entries. Eviction
+renames an entry away before deleting it for the same reason.
+
+Stores keep a running size total instead of re-measuring the whole cache; the
+full scan only runs when that total passes the budget, or every
+``rescan_every`` stores to pick up entries written by other processes.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from . import config
+from .cache import CacheStats, fingerprint
+from .config import logger
+from .datamodel import BuildingSpec
+from .export import ExportSettings, collider_filename, lod_filename, navmesh_filenames
+
+# Bump whenever generated geometry changes without a spec/config/settings change
+CODE_VERSION = "5.1-artifacts-4"
+
+# Config values that only tune caching or logging, not the geometry
+_RUNTIME_SETTINGS = {
+    "DEBUG_MODE",
+    "FLOORPLAN_CACHE_SIZE",
+    "FLOORPLAN_CACHE_DIR",
+    "ARTIFACT_CACHE_DIR",
+    "ARTIFACT_CACHE_MAX_BYTES",
+}
+
+RESULT_FILE = "result.json"
+MANIFEST_FILE = "export_manifest.json"
+
+
+def config_constants() -> Dict[str, object]:
+    """Every upper-case constant in :mod:`mf_v5.config` that affects output."""
+    return {
+        name: value
+        for name, value in sorted(vars(config).items())
+        if name.isupper() and name not in _RUNTIME_SETTINGS and isinstance(value, (int, float, str, bool))
+    }
+
+
+def artifact_key(spec: BuildingSpec, settings: ExportSettings) -> str:
+    return fingerprint(CODE_VERSION, spec, config_constants(), settings)
+
+
+def artifact_names(settings: ExportSettings, building_name: str = "Building") -> List[str]:
+    lods = [lod_filename(building_name, level) for level in settings.reduced_lods]
+    return [f"{building_name}.glb", collider_filename(building_name, settings), MANIFEST_FILE, *lods, *navmesh_filenames(building_name)]
+
+
+class ArtifactCache:
+    """Directory of published entries, bounded by total size in bytes."""
+
+    def __init__(self, root: Path, max_bytes: int = config.ARTIFACT_CACHE_MAX_BYTES, rescan_every: int = 64):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.rescan_every = rescan_every
+        self.stats = CacheStats()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._total: Optional[int] = None  # Bytes at the last scan plus this process's stores since
+        self._stores_since_scan = 0
+
+    def _entry(self, key: str) -> Path:
+        return self.root / key
+
+    def lookup(self, key: str) -> Optional[Path]:
+        """Path of the published entry for ``key``, or ``None`` on a miss."""
+        entry = self._entry(key)
+        if not (entry / RESULT_FILE).is_file():
+            self.stats.misses += 1
+            return None
+        try:
+            # Access time drives eviction order
+            os.utime(entry)
+        except OSError:
+            # Evicted between the check and the touch
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return entry
+
+    def store(self, key: str, files: List[Path], result: Dict[str, object]) -> Path:
+        """Copy ``files`` plus ``result`` into a new entry and publish it atomically."""
+        staging = Path(tempfile.mkdtemp(dir=self.root, prefix=".staging-"))
+        try:
+            for path in files:
+                shutil.copy2(path, staging / path.name)
+            (staging / RESULT_FILE).write_text(json.dumps(result, indent=2), encoding="utf-8")
+            size = sum(f.stat().st_size for f in staging.iterdir())
+            try:
+                os.rename(staging, self._entry(key))
+            except OSError:
+                # Another writer published the same key first; its entry is equivalent
+                shutil.rmtree(staging, ignore_errors=True)
+                size = 0
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        self._stores_since_scan += 1
+        if self._total is not None:
+            self._total += size
+        if self._total is None or self._total > self.max_bytes or self._stores_since_scan >= self.rescan_every:
+            self.evict()
+        return self._entry(key)
+
+    def materialize(self, entry: Path, output_dir: Path) -> None:
+        """Copy an entry's artifacts into ``output_dir``.
+
+        Files are copied rather than hard-linked: exporters rewrite their
+        outputs in place, which would otherwise write through into the entry.
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for src in entry.iterdir():
+            if src.name == RESULT_FILE:
+                continue
+            shutil.copy2(src, output_dir / src.name)
+
+    def size_bytes(self) -> int:
+        return sum(size for _, _, size in self._entries())
+
+    def _entries(self):
+        entries = []
+        for entry in self.root.iterdir():
+            if entry.name.startswith(".") or not entry.is_dir():
+                continue
+            try:
+                size = sum(f.stat().st_size for f in entry.iterdir())
+                entries.append((entry.stat().st_mtime, entry, size))
+            except OSError:
+                continue
+        return entries
+
+    def evict(self) -> int:
+        """Drop least recently used entries until the cache fits ``max_bytes``."""
+        entries = sorted(self._entries(), key=lambda e: e[0])
+        total = sum(size for _, _, size in entries)
+        evicted = 0
+        for _, entry, size in entries:
+            if total <= self.max_bytes:
+                break
+            doomed = self.root / f".evicted-{entry.name}-{os.getpid()}-{time.monotonic_ns()}"
+            try:
+                os.rename(entry, doomed)
+            except OSError:
+                continue
+            shutil.rmtree(doomed, ignore_errors=True)
+            total -= size
+            evicted += 1
+        self._total, self._stores_since_scan = total, 0
+        self.stats.evictions += evicted
+        if evicted:
+            logger.debug(f"Artifact cache evicted {evicted} entries ({total} bytes left)")
+        return evicted
+
+    def clear(self) -> None:
+        for entry in self.root.iterdir():
+            shutil.rmtree(entry, ignore_errors=True)
+        self._total = None
+
+
+def default_artifact_cache() -> Optional[ArtifactCache]:
+    """Cache configured through ``MF_ARTIFACT_CACHE_DIR``, if any."""
+    if not config.ARTIFACT_CACHE_DIR:
+        return None
+    return ArtifactCache(Path(config.ARTIFACT_CACHE_DIR))
@@ -0,0 +1,144 @@
+"""Batch generation of many buildings with process-parallel planning."""
+
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from .artifacts import ArtifactCache, artifact_key, default_artifact_cache
+from .config import logger
+from .datamodel import BuildingSpec
+from .engine import GenerationOutput, cached_output, realize_plan, store_artifacts
+from .export import ExportSettings
+from .incremental import null_session
+from .planning import BuildingPlan, plan_building
+from .tracing import Span, Tracer, null_tracer
+
+
+@dataclass
+class BatchResult:
+    index: int
+    spec: BuildingSpec
+    output: Optional[GenerationOutput] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def batch_output_dir(output_dir: Path, index: int) -> Path:
+    """Per-spec output directory inside a batch output root."""
+    return output_dir / f"building_{index:04d}"
+
+
+def _plan_traced(spec: BuildingSpec, traced: bool) -> Tuple[BuildingPlan, List[Span]]:
+    """Plan one spec, returning the planning spans recorded in this process."""
+    tracer = Tracer() if traced else null_tracer()
+    return plan_building(spec, null_session(tracer)), tracer.spans
+
+
+def _iter_plans(specs: Sequence[BuildingSpec], workers: Optional[int], traced: bool = False) -> Iterator[object]:
+    """Plan specs in order, yielding a ``(BuildingPlan, spans)`` pair or the raised exception for each.
+
+    At most two specs per worker are in flight, so plans are consumed as they
+    finish instead of piling up, and the pool keeps planning while the caller
+    realizes the plan just yielded.
+    """
+    if workers is not None and workers <= 1:
+        for spec in specs:
+            try:
+                yield _plan_traced(spec, traced)
+            except Exception as e:
+                yield e
+        return
+
+    window = 2 * (workers or os.cpu_count() or 1)
+    queued = iter(specs)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque(pool.submit(_plan_traced, spec, traced) for _, spec in zip(range(window), queued))
+        while pending:
+            future = pending.popleft()
+            try:
+                planned = future.result()
+            except Exception as e:
+                planned = e
+            spec = next(queued, None)
+            if spec is not None:
+                pending.append(pool.submit(_plan_traced, spec, traced))
+            yield planned
+
+
+def generate_batch(
+    specs: Sequence[BuildingSpec],
+    output_dir: Path,
+    workers: Optional[int] = None,
+    tracer: Optional[Tracer] = None,
+    *,
+    settings: Optional[ExportSettings] = None,
+    artifact_cache: Optional[ArtifactCache] = None,
+) -> List[BatchResult]:
+    """Generate many buildings, planning them in parallel worker processes.
+
+    The CPU-bound planning stages (floorplan, adjacency, walls, carving, slabs,
+    roof) run in a process pool of ``workers`` processes (``None`` uses the
+    executor default, ``1`` plans inline). Mesh construction and export then
+    run in this process, since ``bpy`` cannot be shared across processes.
+
+    Results are returned in spec order. A failing spec is reported through
+    :attr:`BatchResult.error` and does not abort the rest of the batch.
+    Each building is written to ``output_dir/building_NNNN``. Buildings are
+    realized as their plans arrive, while later specs are still planning.
+
+    ``settings`` and ``artifact_cache`` (or ``MF_ARTIFACT_CACHE_DIR``) work as
+    in :func:`mf_v5.engine.generate`: cached specs are copied out without
+    being planned, and newly built ones are stored.
+
+    With a :class:`Tracer`, every span is tagged with its building index, so
+    one Chrome trace covers the batch, including the planning done in the
+    worker processes.
+    """
+    specs = list(specs)
+    tracer = tracer or null_tracer()
+    settings = settings or ExportSettings()
+    artifact_cache = artifact_cache or default_artifact_cache()
+    logger.info(f"Starting batch generation of {len(specs)} buildings")
+
+    results = [BatchResult(index=index, spec=spec) for index, spec in enumerate(specs)]
+    misses: List[BatchResult] = []
+    for result in results:
+        if artifact_cache:
+            building = tracer.child(building=result.index)
+            with building.span("artifact_cache"):
+                key = artifact_key(result.spec, settings)
+                result.output = cached_output(artifact_cache, key, batch_output_dir(output_dir, result.index), settings)
+            if result.output is not None:
+                result.output.timings = building.timings()
+                continue
+        misses.append(result)
+
+    for result, planned in zip(misses, _iter_plans([r.spec for r in misses], workers, tracer.enabled)):
+        if isinstance(planned, tuple):
+            plan, spans = planned
+            building = tracer.child(building=result.index)
+            building.add([replace(span, tags=building.tags) for span in spans])
+            building_dir = batch_output_dir(output_dir, result.index)
+            try:
+                result.output = realize_plan(plan, building_dir, null_session(building), settings)
+                if artifact_cache:
+                    store_artifacts(artifact_cache, artifact_key(result.spec, settings), result.output, building_dir, settings)
+            except Exception as e:
+                result.error = f"{type(e).__name__}: {e}"
+        else:
+            result.error = f"{type(planned).__name__}: {planned}"
+
+        if result.error:
+            logger.error(f"Batch item {result.index} failed: {result.error}")
+
+    failed = sum(1 for r in results if not r.ok)
+    logger.info(f"Batch finished: {len(results) - failed} succeeded, {failed} failed")
+    return results
@@ -2,117 +2,72 @@
 
 import bpy
 import bmesh
+import numpy as np
 from typing import List, Iterable, Optional
-from .datamodel import WallSegment, Rect
+from .datamodel import WallSegment
 from .slabs import Slab
 from .roof import RoofGeometry
-from .config import TEXTURE_TILE_SIZE
+from .mesh_arrays import (
+    MeshArrays, MeshInstances, PolygonBuffers, box_polygon_buffers, polygon_buffers, slab_boxes, wall_boxes,
+)
 
-def _add_box_with_uv(bm: bmesh.types.BMesh, x1, y1, z1, x2, y2, z2, uv_layer):
-    """Helper to add a box with world-space UV projection."""
-    v = []
-    for z in [z1, z2]:
-        v.append(bm.verts.new((x1, y1, z)))
-        v.append(bm.verts.new((x2, y1, z)))
-        v.append(bm.verts.new((x2, y2, z)))
-        v.append(bm.verts.new((x1, y2, z)))
-    
-    faces = []
-    try:
-        faces.append(bm.faces.new(v[0:4])) # bottom
-        faces.append(bm.faces.new(v[4:8])) # top
-        faces.append(bm.faces.new((v[0], v[1], v[5], v[4]))) # front
-        faces.append(bm.faces.new((v[1], v[2], v[6], v[5]))) # right
-        faces.append(bm.faces.new((v[2], v[3], v[7], v[6]))) # back
-        faces.append(bm.faces.new((v[3], v[0], v[4], v[7]))) # left
-    except ValueError:
-        pass
-    
-    for f in faces:
-        for loop in f.loops:
-            co = loop.vert.co
-            if abs(f.normal.y) > 0.5:
-                loop[uv_layer].uv = (co.x / TEXTURE_TILE_SIZE, co.z / TEXTURE_TILE_SIZE)
-            else:
-                loop[uv_layer].uv = (co.y / TEXTURE_TILE_SIZE, co.z / TEXTURE_TILE_SIZE)
-
-def create_wall_mesh(segments: Iterable[WallSegment], name: str = "Walls", material: Optional[bpy.types.Material] = None):
+def _new_mesh_object(name: str, material: Optional[bpy.types.Material] = None):
     mesh = bpy.data.meshes.new(name)
     obj = bpy.data.objects.new(name, mesh)
     bpy.context.scene.collection.objects.link(obj)
     if material: obj.data.materials.append(material)
-    
-    bm = bmesh.new()
-    uv_layer = bm.loops.layers.uv.new("UVMap")
-    
-    for s in segments:
-        half_t = s.thickness / 2
-        dx, dy = s.x2 - s.x1, s.y2 - s.y1
-        length = (dx**2 + dy**2)**0.5
-        if length < 1e-4: continue
-        ux, uy = dx / length, dy / length
-        nx, ny = -uy, ux
-        
-        window = getattr(s, 'window_opening', None)
-        if window:
-            _add_box_with_uv(bm, s.x1 - nx * half_t, s.y1 - ny * half_t, 0, s.x2 + nx * half_t, s.y2 + ny * half_t, window.sill_height, uv_layer)
-            _add_box_with_uv(bm, s.x1 - nx * half_t, s.y1 - ny * half_t, window.sill_height + window.height, s.x2 + nx * half_t, s.y2 + ny * half_t, s.height, uv_layer)
-        else:
-            _add_box_with_uv(bm, s.x1 - nx * half_t, s.y1 - ny * half_t, 0, s.x2 + nx * half_t, s.y2 + ny * half_t, s.height, uv_layer)
+    return obj
 
-    bm.to_mesh(mesh)
-    bm.free()
+def _fill_mesh(mesh: bpy.types.Mesh, buffers: PolygonBuffers):
+    """Push flat buffers into an empty mesh with bulk ``foreach_set`` calls."""
+    mesh.vertices.add(len(buffers.positions))
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(buffers.positions, np.float32).ravel())
+    mesh.loops.add(len(buffers.loops))
+    mesh.loops.foreach_set("vertex_index", np.ascontiguousarray(buffers.loops, np.int32))
+    # Blender 4.x derives each polygon's loop_total from the next loop_start
+    mesh.polygons.add(buffers.face_count)
+    mesh.polygons.foreach_set("loop_start", np.ascontiguousarray(buffers.loop_starts, np.int32))
+    if buffers.uvs is not None:
+        uv_layer = mesh.uv_layers.new(name="UVMap")
+        uv_layer.data.foreach_set("uv", np.ascontiguousarray(buffers.uvs, np.float32).ravel())
+    mesh.update(calc_edges=True)
+
+def create_wall_mesh(segments: Iterable[WallSegment], name: str = "Walls", material: Optional[bpy.types.Material] = None, z_offset: float = 0.0):
+    obj = _new_mesh_object(name, material)
+    _fill_mesh(obj.data, box_polygon_buffers(*wall_boxes(segments, z_offset)))
     return obj
 
 def create_slab_mesh(slabs: Iterable[Slab], name: str = "Slabs", material: Optional[bpy.types.Material] = None):
-    mesh = bpy.data.meshes.new(name)
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.scene.collection.objects.link(obj)
-    if material: obj.data.materials.append(material)
-        
-    bm = bmesh.new()
-    uv_layer = bm.loops.layers.uv.new("UVMap")
-    
-    for s in slabs:
-        r = s.rect
-        if s.hole_rect:
-            # Create slab with hole using 4 boxes around the hole
-            h = s.hole_rect
-            # Left box
-            _add_box_with_uv(bm, r.min_x, r.min_y, s.z, h.min_x, r.max_y, s.z + s.thickness, uv_layer)
-            # Right box
-            _add_box_with_uv(bm, h.max_x, r.min_y, s.z, r.max_x, r.max_y, s.z + s.thickness, uv_layer)
-            # Top box (middle part)
-            _add_box_with_uv(bm, h.min_x, h.max_y, s.z, h.max_x, r.max_y, s.z + s.thickness, uv_layer)
-            # Bottom box (middle part)
-            _add_box_with_uv(bm, h.min_x, r.min_y, s.z, h.max_x, h.min_y, s.z + s.thickness, uv_layer)
-        else:
-            _add_box_with_uv(bm, r.min_x, r.min_y, s.z, r.max_x, r.max_y, s.z + s.thickness, uv_layer)
-        
-    bm.to_mesh(mesh)
-    bm.free()
+    obj = _new_mesh_object(name, material)
+    _fill_mesh(obj.data, box_polygon_buffers(*slab_boxes(slabs)))
     return obj
 
 def create_roof_mesh(roof_geo: RoofGeometry, name: str = "Roof", material: Optional[bpy.types.Material] = None):
-    mesh = bpy.data.meshes.new(name)
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.scene.collection.objects.link(obj)
-    if material: obj.data.materials.append(material)
-    
-    bm = bmesh.new()
-    uv_layer = bm.loops.layers.uv.new("UVMap")
-    for face in roof_geo.faces:
-        verts = [bm.verts.new(v) for v in face.vertices]
-        try:
-            f = bm.faces.new(verts)
-            for loop in f.loops:
-                co = loop.vert.co
-                loop[uv_layer].uv = (co.x / TEXTURE_TILE_SIZE, co.y / TEXTURE_TILE_SIZE)
-        except ValueError: pass
-    bm.to_mesh(mesh)
-    bm.free()
+    obj = _new_mesh_object(name, material)
+    _fill_mesh(obj.data, polygon_buffers((face.vertices for face in roof_geo.faces), uv_axes=(0, 1)))
+    return obj
+
+def create_mesh_object(arrays: MeshArrays, name: str, material: Optional[bpy.types.Material] = None):
+    """Create a linked mesh object from NumPy vertex/index buffers."""
+    obj = _new_mesh_object(name, material)
+    _fill_mesh(obj.data, arrays.polygon_buffers())
     return obj
 
+def create_instance_objects(instances: MeshInstances, name: str, material: Optional[bpy.types.Material] = None) -> List[bpy.types.Object]:
+    """Linked duplicates: one mesh datablock per shape, one object per placement."""
+    shape_objects = [create_mesh_object(shape, f"{name}Shape_{i}", material) for i, shape in enumerate(instances.shapes)]
+    shape_meshes = [obj.data for obj in shape_objects]
+    for obj in shape_objects:
+        bpy.data.objects.remove(obj, do_unlink=True)
+
+    objects = []
+    for i, (shape, translation) in enumerate(instances.placements):
+        obj = bpy.data.objects.new(f"{name}_{i}", shape_meshes[shape])
+        obj.location = translation
+        bpy.context.scene.collection.objects.link(obj)
+        objects.append(obj)
+    return objects
+
 def final_merge_and_cleanup(objects: List[bpy.types.Object], merge_distance: float = 0.0005):
     if not objects: return None
     bpy.ops.object.select_all(action='DESELECT')
@@ -120,9 +75,9 @@ def final_merge_and_cleanup(objects: List[bpy.types.Object], merge_distance: flo
     if not valid_objs: return None
     for obj in valid_objs: obj.select_set(True)
     bpy.context.view_layer.objects.active = valid_objs[0]
-        # Ensure the object is in the scene collection before joining
-        if valid_objs[0].name not in bpy.context.scene.collection.objects:
-            bpy.context.scene.collection.objects.link(valid_objs[0])
+    # Ensure the object is in the scene collection before joining
+    if valid_objs[0].name not in bpy.context.scene.collection.objects:
+        bpy.context.scene.collection.objects.link(valid_objs[0])
     bpy.ops.object.join()
     merged_obj = bpy.context.active_object
     merged_obj.name = "Building_Final"
@@ -0,0 +1,110 @@
+"""Small caching primitives: an in-memory LRU and an optional on-disk tier."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Hashable, Optional
+
+
+_MISSING = object()
+
+
+def fingerprint(*values: Any) -> str:
+    """Stable short hash of the ``repr`` of ``values``."""
+    return hashlib.sha256(repr(values).encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.disk_hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return (self.hits + self.disk_hits) / self.lookups if self.lookups else 0.0
+
+
+class LRUCache:
+    """Bounded mapping that evicts the least recently used entry."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = _MISSING) -> Any:
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            return default
+        return self._data[key]
+
+    def put(self, key: Hashable, value: Any) -> int:
+        """Store ``value`` and return how many entries were evicted."""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        evicted = 0
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            evicted += 1
+        return evicted
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class DiskTier:
+    """Pickle-per-key directory store, safe to share between processes.
+
+    Entries are written to a temporary file and published with an atomic
+    rename, so concurrent readers never observe a partial entry.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: Hashable) -> Path:
+        return self.root / f"{fingerprint(key)}.pkl"
+
+    def get(self, key: Hashable, default: Any = _MISSING) -> Any:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                stored_key, value = pickle.load(f)
+        except FileNotFoundError:
+            return default
+        except Exception:
+            # Truncated, or pickled from classes that have since changed; drop it
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return default
+        # Guard against fingerprint collisions
+        return value if stored_key == key else default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((key, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
@@ -2,13 +2,24 @@
 
 from __future__ import annotations
 
-from typing import Iterable, List, Tuple
+from collections import defaultdict
+from dataclasses import replace
+from typing import DefaultDict, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
 
 from .config import EPSILON
-from .datamodel import WallSegment
+from .datamodel import SIDE_CODES, SIDE_NAMES, AdjacencyMap, Opening, WallSegment, WallSegmentTable
+
+Segments = Union[Iterable[WallSegment], WallSegmentTable]
 
 
-def remove_zero_length_segments(segments: Iterable[WallSegment]) -> List[WallSegment]:
+def remove_zero_length_segments(segments: Segments) -> Union[List[WallSegment], WallSegmentTable]:
+    if isinstance(segments, WallSegmentTable):
+        t = segments
+        degenerate = (np.abs(t.x1 - t.x2) <= EPSILON) & (np.abs(t.y1 - t.y2) <= EPSILON)
+        return t[~degenerate]
+
     out = []
     for s in segments:
         if abs(s.x1 - s.x2) <= EPSILON and abs(s.y1 - s.y2) <= EPSILON:
@@ -17,7 +28,15 @@ def remove_zero_length_segments(segments: Iterable[WallSegment]) -> List[WallSeg
     return out
 
 
-def dedupe_segments(segments: Iterable[WallSegment]) -> List[WallSegment]:
+def dedupe_segments(segments: Segments) -> Union[List[WallSegment], WallSegmentTable]:
+    if isinstance(segments, WallSegmentTable):
+        t = segments
+        if not len(t):
+            return t
+        keys = np.column_stack([t.room_id, t.side, *(np.round(c, 5) for c in (t.x1, t.y1, t.x2, t.y2))])
+        _, first = np.unique(keys, axis=0, return_index=True)
+        return t[np.sort(first)]
+
     seen = set()
     out: List[WallSegment] = []
     for s in segments:
@@ -27,3 +46,175 @@ def dedupe_segments(segments: Iterable[WallSegment]) -> List[WallSegment]:
         seen.add(key)
         out.append(s)
     return out
+
+
+def _line_key(seg: WallSegment) -> Tuple[bool, float, float, float]:
+    horizontal = seg.side in ("north", "south")
+    coord = seg.y1 if horizontal else seg.x1
+    return horizontal, round(coord, 5), round(seg.height, 5), round(seg.thickness, 5)
+
+
+def _extent(seg: WallSegment, horizontal: bool) -> Tuple[float, float]:
+    return tuple(sorted((seg.x1, seg.x2) if horizontal else (seg.y1, seg.y2)))
+
+
+def _line_runs(faces: List[WallSegment], horizontal: bool) -> List[Tuple[WallSegment, float, float]]:
+    """Sweep one wall line and return ``(owner face, start, end)`` runs covering it once.
+
+    Faces are visited in order of their start; overlapping or touching
+    faces (the two sides of a shared wall, or collinear walls of rooms in a
+    row) extend the current run, and a gap starts a new one. Each run is
+    owned by the face with the lowest room id in it.
+    """
+    order = sorted(range(len(faces)), key=lambda i: _extent(faces[i], horizontal))
+    runs: List[List] = []
+    for i in order:
+        lo, hi = _extent(faces[i], horizontal)
+        last = runs[-1] if runs else None
+        if last is not None and lo <= last[2] + EPSILON:
+            last[2] = max(last[2], hi)
+            if faces[i].room_id < faces[last[0]].room_id:
+                last[0] = i
+        else:
+            runs.append([i, lo, hi])
+    return [(faces[i], lo, hi) for i, lo, hi in runs]
+
+
+def _run_piece(face: WallSegment, horizontal: bool, start: float, end: float) -> WallSegment:
+    if horizontal:
+        return WallSegment(face.room_id, face.side, start, face.y1, end, face.y2, face.height, face.thickness)
+    return WallSegment(face.room_id, face.side, face.x1, start, face.x2, end, face.height, face.thickness)
+
+
+def fuse_shared_walls(
+    wall_segments: Union[Dict[int, List[WallSegment]], WallSegmentTable],
+    openings: Iterable[Opening] = (),
+    adjacency: Optional[AdjacencyMap] = None,
+) -> Tuple[Union[Dict[int, List[WallSegment]], WallSegmentTable], List[Opening]]:
+    """Build each wall shared by two rooms once, before carving.
+
+    Neighbouring rooms both emit the wall between them, facing opposite
+    ways. Walls on the same line are swept together (see :func:`_line_runs`)
+    and replaced by the longest continuous runs, each owned by one room. Openings are moved onto the
+    run that now carries their centre, so both rooms' doors and windows are
+    still carved. With ``adjacency``, sides that have no neighbour skip the
+    sweep; it only records one neighbour per side, so the overlap itself is
+    found geometrically.
+
+    Returns the fused walls, in the same form as ``wall_segments``, and the
+    re-targeted openings.
+    """
+    if isinstance(wall_segments, WallSegmentTable):
+        return _fuse_table(wall_segments, openings, adjacency)
+
+    lines: DefaultDict[tuple, List[WallSegment]] = defaultdict(list)
+    for room_id, segments in wall_segments.items():
+        for seg in segments:
+            if adjacency is not None and adjacency.get(room_id, {}).get(seg.side) is None:
+                continue
+            lines[_line_key(seg)].append(seg)
+
+    runs_by_face: DefaultDict[Tuple[int, str], List[WallSegment]] = defaultdict(list)
+    line_of_face: Dict[Tuple[int, str], tuple] = {}
+    runs_by_line: Dict[tuple, List[Tuple[WallSegment, float, float]]] = {}
+    for key, faces in lines.items():
+        runs = runs_by_line[key] = _line_runs(faces, key[0])
+        for face in faces:
+            line_of_face[(face.room_id, face.side)] = key
+        for face, start, end in runs:
+            runs_by_face[(face.room_id, face.side)].append(_run_piece(face, key[0], start, end))
+
+    fused: Dict[int, List[WallSegment]] = {}
+    for room_id, segments in wall_segments.items():
+        out: List[WallSegment] = []
+        for seg in segments:
+            if (room_id, seg.side) in line_of_face:
+                out.extend(runs_by_face.pop((room_id, seg.side), ()))
+            else:
+                out.append(seg)
+        fused[room_id] = out
+
+    moved: List[Opening] = []
+    for opening in openings:
+        key = line_of_face.get((opening.room_id, opening.side))
+        if key is not None:
+            along = opening.center[0] if key[0] else opening.center[1]
+            for face, start, end in runs_by_line[key]:
+                if start - EPSILON <= along <= end + EPSILON:
+                    if (face.room_id, face.side) != (opening.room_id, opening.side):
+                        opening = replace(opening, room_id=face.room_id, side=face.side)
+                    break
+        moved.append(opening)
+    return fused, moved
+
+
+def _fuse_table(
+    table: WallSegmentTable,
+    openings: Iterable[Opening],
+    adjacency: Optional[AdjacencyMap],
+) -> Tuple[WallSegmentTable, List[Opening]]:
+    """Columnar :func:`fuse_shared_walls`: same runs and row order, without per-row objects."""
+    horizontal = np.isin(table.side, (SIDE_CODES["north"], SIDE_CODES["south"]))
+    lo = np.where(horizontal, np.minimum(table.x1, table.x2), np.minimum(table.y1, table.y2))
+    hi = np.where(horizontal, np.maximum(table.x1, table.x2), np.maximum(table.y1, table.y2))
+    room_ids, sides = table.room_id.tolist(), table.side.tolist()
+    if adjacency is None:
+        swept = np.ones(len(table), bool)
+    else:
+        swept = np.array([adjacency.get(r, {}).get(SIDE_NAMES[c]) is not None for r, c in zip(room_ids, sides)], bool)
+
+    # Rows sharing (orientation, line coordinate, height, thickness) lie on one wall line
+    keys = np.column_stack([
+        horizontal, *(np.round(c, 5) for c in (np.where(horizontal, table.y1, table.x1), table.height, table.thickness))
+    ])
+    line = np.unique(keys, axis=0, return_inverse=True)[1].ravel() if len(table) else np.zeros(0, np.int64)
+    order = np.lexsort((hi, lo, line))
+
+    # Sweep each line in order of extent, as _line_runs does: [owner row, start, end]
+    runs_by_line: Dict[int, List[List]] = defaultdict(list)
+    lo_list, hi_list, line_list = lo.tolist(), hi.tolist(), line.tolist()
+    for i in order[swept[order]].tolist():
+        runs = runs_by_line[line_list[i]]
+        if runs and lo_list[i] <= runs[-1][2] + EPSILON:
+            runs[-1][2] = max(runs[-1][2], hi_list[i])
+            if room_ids[i] < room_ids[runs[-1][0]]:
+                runs[-1][0] = i
+        else:
+            runs.append([i, lo_list[i], hi_list[i]])
+    runs_by_owner: DefaultDict[int, List[Tuple[float, float]]] = defaultdict(list)
+    for runs in runs_by_line.values():
+        for owner, start, end in runs:
+            runs_by_owner[owner].append((start, end))
+
+    rows: List[int] = []
+    starts: List[float] = []
+    ends: List[float] = []
+    for i in range(len(table)):
+        pieces = runs_by_owner.get(i, ()) if swept[i] else ((lo_list[i], hi_list[i]),)
+        for start, end in pieces:
+            rows.append(i)
+            starts.append(start)
+            ends.append(end)
+    rows_arr = np.asarray(rows, np.int64)
+    start_arr, end_arr = np.asarray(starts, np.float64), np.asarray(ends, np.float64)
+    horiz = horizontal[rows_arr]
+    fused = WallSegmentTable(
+        table.room_id[rows_arr], table.side[rows_arr],
+        np.where(horiz, start_arr, table.x1[rows_arr]), np.where(horiz, table.y1[rows_arr], start_arr),
+        np.where(horiz, end_arr, table.x2[rows_arr]), np.where(horiz, table.y2[rows_arr], end_arr),
+        table.height[rows_arr], table.thickness[rows_arr],
+    )
+
+    row_of_face = {(r, c): i for i, (r, c) in enumerate(zip(room_ids, sides))}
+    moved: List[Opening] = []
+    for opening in openings:
+        i = row_of_face.get((opening.room_id, SIDE_CODES[opening.side]))
+        if i is not None and swept[i]:
+            along = opening.center[0] if horizontal[i] else opening.center[1]
+            for owner, start, end in runs_by_line[line_list[i]]:
+                if start - EPSILON <= along <= end + EPSILON:
+                    if owner != i:
+                        opening = replace(opening, room_id=room_ids[owner], side=SIDE_NAMES[sides[owner]])
+                    break
+        moved.append(opening)
+    return fused, moved
@@ -1,7 +1,256 @@
-"""Simplified collider generation for procedural buildings."""
+"""Simplified collider generation for procedural buildings.
+
+:func:`collider_arrays` builds the collision trimesh straight from the
+abstract building model (carved walls, slabs, stairs and roof faces), so it
+does not need the visual mesh or Blender. :func:`collider_shapes` describes
+the same building as boxes and convex hulls for engines that simulate many
+buildings at once. :func:`create_simplified_collider` is the older path that
+simplifies a finished Blender mesh.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import DefaultDict, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+try:
+    import bpy
+    import bmesh
+except ImportError:
+    bpy = None
+    bmesh = None
+
+from .config import COLLIDER_MIN_SPAN, EPSILON, STORY_HEIGHT
+from .datamodel import WallSegment
+from .export import GlbNode
+from .mesh_arrays import (
+    MeshArrays, box_polygon_buffers, merge_arrays, roof_arrays, slab_boxes, stair_arrays, stair_hulls, wall_extent,
+    wall_spans,
+)
+from .planning import BuildingPlan
+
+
+def _merge_intervals(intervals: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+    runs: List[List[float]] = []
+    for lo, hi in sorted(intervals):
+        if runs and lo <= runs[-1][1] + EPSILON:
+            runs[-1][1] = max(runs[-1][1], hi)
+        else:
+            runs.append([lo, hi])
+    return [(lo, hi) for lo, hi in runs]
+
+
+def collider_wall_boxes(
+    floors: Iterable[Tuple[Iterable[WallSegment], float]],
+    min_span: float = COLLIDER_MIN_SPAN,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Min/max corners of merged collision boxes for ``(segments, z_offset)`` pairs.
+
+    Pieces on one wall line are cut into horizontal bands at every span
+    boundary. Within a band, touching pieces merge into one run, and runs
+    with the same extent in consecutive bands are stacked into one box. A
+    wall without openings becomes one box, and a row of windows becomes a
+    continuous sill band, a continuous lintel band, and the piers between
+    them. Sill and lintel spans shorter than ``min_span`` are dropped.
+    """
+    lines: DefaultDict[tuple, List[Tuple[float, float, float, float]]] = defaultdict(list)
+    for segments, z_offset in floors:
+        for s in segments:
+            extent = wall_extent(s)
+            if extent is None:
+                continue
+            ax, ay, bx, by = extent
+            horizontal = bx - ax >= by - ay
+            key = (horizontal, round(ay, 5), round(by, 5)) if horizontal else (horizontal, round(ax, 5), round(bx, 5))
+            lo, hi = (ax, bx) if horizontal else (ay, by)
+            for z0, z1 in wall_spans(s):
+                if s.opening is not None and z1 - z0 < min_span:
+                    continue
+                lines[key].append((lo, hi, z_offset + z0, z_offset + z1))
+
+    mins: List[Tuple[float, float, float]] = []
+    maxs: List[Tuple[float, float, float]] = []
+    for (horizontal, c0, c1), pieces in lines.items():
+        boxes: List[List[float]] = []  # [lo, hi, z0, z1]
+        stacked = {}  # (lo, hi) -> box whose top is the current band's bottom
+        bands = sorted({round(z, 5) for *_, z0, z1 in pieces for z in (z0, z1)})
+        for za, zb in zip(bands, bands[1:]):
+            covering = [(lo, hi) for lo, hi, z0, z1 in pieces if z0 <= za + EPSILON and z1 >= zb - EPSILON]
+            next_stacked = {}
+            for lo, hi in _merge_intervals(covering):
+                key = (round(lo, 5), round(hi, 5))
+                box = stacked.get(key)
+                if box is None:
+                    box = [lo, hi, za, zb]
+                    boxes.append(box)
+                else:
+                    box[3] = zb
+                next_stacked[key] = box
+            stacked = next_stacked
+        for lo, hi, z0, z1 in boxes:
+            if horizontal:
+                mins.append((lo, c0, z0))
+                maxs.append((hi, c1, z1))
+            else:
+                mins.append((c0, lo, z0))
+                maxs.append((c1, hi, z1))
+    return np.array(mins, np.float32).reshape(-1, 3), np.array(maxs, np.float32).reshape(-1, 3)
+
+
+def merge_boxes(mins: np.ndarray, maxs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Join boxes that share a full face (or overlap with the same cross-section).
+
+    Sweeps each axis in turn, merging touching boxes whose extents on the
+    other two axes match, until a full round merges nothing.
+    """
+    boxes = [list(lo) + list(hi) for lo, hi in zip(np.asarray(mins, np.float64), np.asarray(maxs, np.float64))]
+    merged = True
+    while merged and boxes:
+        merged = False
+        for axis in range(3):
+            others = [a for a in range(3) if a != axis]
+            groups: DefaultDict[tuple, List[List[float]]] = defaultdict(list)
+            for box in boxes:
+                groups[tuple(round(box[a + k], 5) for a in others for k in (0, 3))].append(box)
+            out: List[List[float]] = []
+            for group in groups.values():
+                group.sort(key=lambda b: b[axis])
+                current = group[0]
+                for box in group[1:]:
+                    if box[axis] <= current[axis + 3] + EPSILON:
+                        current[axis + 3] = max(current[axis + 3], box[axis + 3])
+                    else:
+                        out.append(current)
+                        current = box
+                out.append(current)
+            merged |= len(out) < len(boxes)
+            boxes = out
+    array = np.array(boxes, np.float32).reshape(-1, 6)
+    return array[:, :3], array[:, 3:]
+
+
+def collider_boxes(plan: BuildingPlan, min_span: float = COLLIDER_MIN_SPAN) -> Tuple[np.ndarray, np.ndarray]:
+    """Merged wall and slab boxes of ``plan`` (see :func:`collider_wall_boxes`)."""
+    wall_mins, wall_maxs = collider_wall_boxes(((f.walls, f.z_offset) for f in plan.floors), min_span)
+    slab_mins, slab_maxs = slab_boxes(s for f in plan.floors for s in f.slabs)
+    return merge_boxes(np.concatenate([wall_mins, slab_mins]), np.concatenate([wall_maxs, slab_maxs]))
+
+
+def _box_trimesh(mins: np.ndarray, maxs: np.ndarray) -> MeshArrays:
+    """Boxes as 8 shared corners and 12 triangles each, positions only."""
+    buffers = box_polygon_buffers(mins, maxs)
+    quads = buffers.loops.reshape(-1, 4)
+    empty = MeshArrays.empty()
+    return MeshArrays(buffers.positions, empty.normals, empty.uvs, quads[:, [0, 1, 2, 0, 2, 3]].ravel().astype(np.uint32))
+
+
+def collider_arrays(plan: BuildingPlan, min_span: float = COLLIDER_MIN_SPAN) -> MeshArrays:
+    """Collision trimesh for ``plan``, built without the visual mesh."""
+    parts = [_box_trimesh(*collider_boxes(plan, min_span))]
+    if plan.stairwell and plan.spec.floors > 1:
+        parts.append(stair_arrays(plan.stairwell, plan.spec.floors, welded=True))
+    if plan.roof:
+        parts.append(roof_arrays(plan.roof).positions_only())
+    return merge_arrays(parts)
+
+
+# Godot import hint: the node becomes a static body with a convex shape and no mesh
+CONVEX_COLLIDER_SUFFIX = "-convcolonly"
+
+
+@dataclass
+class ColliderShapes:
+    """A building's collision as axis-aligned boxes plus convex hulls.
+
+    ``hulls`` are convex meshes (stair flights, the roof) placed by
+    ``(hull index, translation)`` entries in ``placements``.
+    """
+
+    box_mins: np.ndarray  # (N, 3) float32
+    box_maxs: np.ndarray  # (N, 3) float32
+    hulls: List[Tuple[str, MeshArrays]] = field(default_factory=list)
+    placements: List[Tuple[int, Tuple[float, float, float]]] = field(default_factory=list)
+
+    @property
+    def shape_count(self) -> int:
+        return len(self.box_mins) + len(self.placements)
+
+    def glb_parts(self) -> Tuple[List[Tuple[str, MeshArrays]], List[GlbNode]]:
+        """Meshes and ``-convcolonly`` nodes; boxes of equal size share one mesh.
+
+        Boxes are placed by translation only, since physics engines handle
+        non-uniformly scaled shapes poorly.
+        """
+        meshes: List[Tuple[str, MeshArrays]] = []
+        nodes: List[GlbNode] = []
+        by_size: Dict[tuple, int] = {}
+        for i, (lo, hi) in enumerate(zip(self.box_mins, self.box_maxs)):
+            size = tuple(round(float(v), 4) for v in hi - lo)
+            mesh = by_size.get(size)
+            if mesh is None:
+                mesh = by_size[size] = len(meshes)
+                meshes.append((f"BoxShape_{mesh}", _box_trimesh(np.zeros(3), np.array(size))))
+            nodes.append(GlbNode(f"Box_{i}{CONVEX_COLLIDER_SUFFIX}", mesh, tuple(float(v) for v in lo)))
+        base = len(meshes)
+        meshes += self.hulls
+        nodes += [
+            GlbNode(f"{self.hulls[hull][0]}_{i}{CONVEX_COLLIDER_SUFFIX}", base + hull, translation)
+            for i, (hull, translation) in enumerate(self.placements)
+        ]
+        return meshes, nodes
+
+    def to_dict(self, y_up: bool = True) -> Dict[str, object]:
+        """Plain shape list: box centres/sizes and the points of each placed hull.
+
+        With ``y_up`` coordinates are converted like the GLB root node does,
+        ``(x, y, z) -> (x, z, -y)``.
+        """
+        def point(p) -> List[float]:
+            x, y, z = (round(float(v), 5) for v in p)
+            return [x, z, -y] if y_up else [x, y, z]
+
+        def size(s) -> List[float]:
+            x, y, z = (round(float(v), 5) for v in s)
+            return [x, z, y] if y_up else [x, y, z]
+
+        boxes = [
+            {"center": point((lo + hi) / 2), "size": size(hi - lo)}
+            for lo, hi in zip(self.box_mins, self.box_maxs)
+        ]
+        convex = [
+            {"name": self.hulls[hull][0], "points": [point(p) for p in self.hulls[hull][1].positions + np.asarray(translation)]}
+            for hull, translation in self.placements
+        ]
+        return {"up": "Y" if y_up else "Z", "boxes": boxes, "convex": convex}
+
+    def write_json(self, path: Path, y_up: bool = True) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(y_up), separators=(",", ":")), encoding="utf-8")
+        return path
+
+
+def collider_shapes(plan: BuildingPlan, min_span: float = COLLIDER_MIN_SPAN) -> ColliderShapes:
+    """Primitive collision shapes for ``plan``: merged boxes, stair hulls and the roof."""
+    shapes = ColliderShapes(*collider_boxes(plan, min_span))
+    if plan.stairwell and plan.spec.floors > 1:
+        hulls = stair_hulls(plan.stairwell.rect, plan.stairwell.stair_type)
+        shapes.hulls += [(f"StairHull_{k}", hull) for k, hull in enumerate(hulls)]
+        shapes.placements += [
+            (k, (0.0, 0.0, f * STORY_HEIGHT)) for f in range(plan.spec.floors - 1) for k in range(len(hulls))
+        ]
+    if plan.roof:
+        roof = roof_arrays(plan.roof).positions_only()
+        # Pitched roofs are convex solids; a flat roof is a plane already capped by the top ceiling slab
+        if np.ptp(roof.positions[:, 2]) > EPSILON:
+            shapes.placements.append((len(shapes.hulls), (0.0, 0.0, 0.0)))
+            shapes.hulls.append(("Roof", roof))
+    return shapes
 
-import bpy
-import bmesh
 
 def create_simplified_collider(building_obj: bpy.types.Object, name: str = "Building_Collider") -> bpy.types.Object:
     """
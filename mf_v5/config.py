@@ -28,10 +28,29 @@ MIN_ROOM_SIZE = 2.5
 # Roof
 ROOF_HEIGHT = 1.2
 
+# Stairs
+STAIR_STEPS = 16  # Steps per flight (one flight per storey)
+SPIRAL_COLUMN_RATIO = 0.15  # Central column radius relative to the spiral's outer radius
+
 # Cleanup
 MERGE_DISTANCE = 5e-4
 DISSOLVE_ANGLE = 0.01
 
+# Level of detail
+LOD_WINDOW_RECESS = 0.15  # How far LOD1 window panels sit behind the outer wall face (m)
+LOD_PANEL_THICKNESS = 0.02
+
+# Collider
+COLLIDER_MIN_SPAN = 0.5  # Sills/lintels shorter than this (m) are left out of the collider
+
+# Caching
+FLOORPLAN_CACHE_SIZE = 1024  # In-memory LRU entries per process
+# Set MF_FLOORPLAN_CACHE_DIR to share a persistent floorplan tier between workers
+FLOORPLAN_CACHE_DIR = os.environ.get("MF_FLOORPLAN_CACHE_DIR")
+# Set MF_ARTIFACT_CACHE_DIR to reuse finished GLB exports across runs and pipelines
+ARTIFACT_CACHE_DIR = os.environ.get("MF_ARTIFACT_CACHE_DIR")
+ARTIFACT_CACHE_MAX_BYTES = int(os.environ.get("MF_ARTIFACT_CACHE_MAX_BYTES", str(2 * 1024**3)))
+
 # --- Logging Configuration ---
 # Set MF_DEBUG=1 to enable debug logging
 DEBUG_MODE = os.environ.get("MF_DEBUG", "0") == "1"
@@ -4,7 +4,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .config import WINDOW_HEIGHT, WINDOW_SILL_HEIGHT, WINDOW_WIDTH
 
 
 class Axis(str, Enum):
@@ -54,27 +58,145 @@ class BuildingSpec:
     floors: int
     seed: int
     roof_type: RoofType = RoofType.HIP
+    stair_type: str = "straight"  # One of stairs.STAIR_TYPES
 
 
 @dataclass(frozen=True)
-class WallSegment:
+class DoorOpening:
     room_id: int
     side: str
-    x1: float
-    y1: float
-    x2: float
-    y2: float
+    center: Tuple[float, float]
+    width: float
     height: float
-    thickness: float
+
+    def solid_spans(self, wall_height: float) -> Tuple[Tuple[float, float], ...]:
+        """Vertical wall spans left standing inside the opening (doors are cut full height)."""
+        return ()
 
 
 @dataclass(frozen=True)
-class DoorOpening:
+class WindowOpening:
     room_id: int
     side: str
     center: Tuple[float, float]
-    width: float
+    width: float = WINDOW_WIDTH
+    height: float = WINDOW_HEIGHT
+    sill_height: float = WINDOW_SILL_HEIGHT
+
+    def solid_spans(self, wall_height: float) -> Tuple[Tuple[float, float], ...]:
+        """Sill below and lintel above the window."""
+        return ((0.0, self.sill_height), (self.sill_height + self.height, wall_height))
+
+
+Opening = Union[DoorOpening, WindowOpening]
+
+
+@dataclass(frozen=True)
+class WallSegment:
+    room_id: int
+    side: str
+    x1: float
+    y1: float
+    x2: float
+    y2: float
     height: float
+    thickness: float
+    opening: Optional[Opening] = None  # Set on pieces spanning an opening
+
+
+SIDE_NAMES = ("north", "south", "east", "west")
+SIDE_CODES = {name: code for code, name in enumerate(SIDE_NAMES)}
+
+_TABLE_COLUMNS = ("room_id", "side", "x1", "y1", "x2", "y2", "height", "thickness", "opening")
+
+
+class WallSegmentTable:
+    """Columnar (struct-of-arrays) store of wall segments.
+
+    Each field of :class:`WallSegment` is one NumPy column; ``side`` is stored
+    as a code into :data:`SIDE_NAMES` and ``opening`` as an index into the
+    shared ``openings`` tuple (``-1`` for solid pieces). Slicing returns a
+    table of views over the same columns, and iteration materializes
+    :class:`WallSegment` rows lazily, one at a time.
+    """
+
+    __slots__ = _TABLE_COLUMNS + ("openings",)
+
+    def __init__(self, room_id, side, x1, y1, x2, y2, height, thickness, opening=None, openings: Sequence[Opening] = ()):
+        self.room_id = np.asarray(room_id, np.int32)
+        self.side = np.asarray(side, np.uint8)
+        self.x1 = np.asarray(x1, np.float64)
+        self.y1 = np.asarray(y1, np.float64)
+        self.x2 = np.asarray(x2, np.float64)
+        self.y2 = np.asarray(y2, np.float64)
+        self.height = np.asarray(height, np.float64)
+        self.thickness = np.asarray(thickness, np.float64)
+        self.opening = np.full(len(self.room_id), -1, np.int32) if opening is None else np.asarray(opening, np.int32)
+        self.openings = tuple(openings)
+
+    @classmethod
+    def empty(cls) -> "WallSegmentTable":
+        return cls(*([()] * 8))
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[WallSegment]) -> "WallSegmentTable":
+        segments = list(segments)
+        refs: Dict[Opening, int] = {}
+        opening = [-1 if s.opening is None else refs.setdefault(s.opening, len(refs)) for s in segments]
+        return cls(
+            [s.room_id for s in segments],
+            [SIDE_CODES[s.side] for s in segments],
+            [s.x1 for s in segments],
+            [s.y1 for s in segments],
+            [s.x2 for s in segments],
+            [s.y2 for s in segments],
+            [s.height for s in segments],
+            [s.thickness for s in segments],
+            opening,
+            tuple(refs),
+        )
+
+    @classmethod
+    def concat(cls, tables: Sequence["WallSegmentTable"]) -> "WallSegmentTable":
+        if not tables:
+            return cls.empty()
+        openings: List[Opening] = []
+        refs = []
+        for t in tables:
+            refs.append(np.where(t.opening >= 0, t.opening + len(openings), -1))
+            openings.extend(t.openings)
+        columns = [np.concatenate([getattr(t, c) for t in tables]) for c in _TABLE_COLUMNS[:-1]]
+        return cls(*columns, np.concatenate(refs), openings)
+
+    def __len__(self) -> int:
+        return len(self.room_id)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return self.row(int(index))
+        # Basic slices share memory with this table; masks and index arrays copy
+        return WallSegmentTable(*(getattr(self, c)[index] for c in _TABLE_COLUMNS), self.openings)
+
+    def row(self, i: int) -> WallSegment:
+        ref = int(self.opening[i])
+        return WallSegment(
+            int(self.room_id[i]),
+            SIDE_NAMES[self.side[i]],
+            float(self.x1[i]),
+            float(self.y1[i]),
+            float(self.x2[i]),
+            float(self.y2[i]),
+            float(self.height[i]),
+            float(self.thickness[i]),
+            self.openings[ref] if ref >= 0 else None,
+        )
+
+    def __iter__(self) -> Iterator[WallSegment]:
+        for i in range(len(self)):
+            yield self.row(i)
+
+    def to_segments(self) -> List[WallSegment]:
+        return list(self)
 
 
 AdjacencyMap = Dict[int, Dict[str, Optional[int]]]
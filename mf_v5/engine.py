@@ -2,36 +2,40 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field
+import json
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 import time
 
 try:
     import bpy
-    from .blender_mesh import create_wall_mesh, create_slab_mesh, create_roof_mesh, final_merge_and_cleanup
+    from .blender_mesh import (
+        create_instance_objects, create_mesh_object, create_roof_mesh, create_slab_mesh, create_wall_mesh,
+        final_merge_and_cleanup,
+    )
     from .export import export_to_glb
-    from .collider import create_simplified_collider
-    from .stairs import build_stair_mesh
 except ImportError:
     bpy = None
 
-from .stairs import generate_stairwell
-
-from .adjacency import build_adjacency, corridor_facing_walls
-from .cleanup import dedupe_segments, remove_zero_length_segments
-from .config import STORY_HEIGHT, logger
-from .datamodel import BuildingSpec, RoofType, Rect
-from .doors import carve_doors, corridor_door_openings
-from .export import ExportSettings, export_manifest
-from .floorplan import generate_floorplan
+from .artifacts import RESULT_FILE, ArtifactCache, artifact_key, artifact_names, default_artifact_cache
+from .collider import ColliderShapes, collider_arrays, collider_shapes
+from .config import logger
+from .datamodel import BuildingSpec
+from .export import (
+    ExportSettings, GlbFile, GlbNode, collider_filename, export_manifest, lod_filename, navmesh_filenames, write_glb_files,
+)
+from .incremental import BuildSession, null_session
+from .lod import lod_arrays
 from .merge import default_merge_plan, summarize_cleanup
-from .roof import build_roof
-from .slabs import build_floor_ceiling_slabs, build_navmesh_slabs
-from .walls import build_room_wall_segments
-from .exceptions import GenerationError, ExportError, ConfigurationError
-from .windows import generate_window_placements, carve_windows
+from .navmesh import build_navmesh
+from .mesh_arrays import MeshArrays, MeshInstances, merge_arrays, roof_arrays, slab_arrays, stair_arrays, wall_arrays
+from .planning import BuildingPlan, plan_building, validate_spec
+from .tracing import Tracer
+from .exceptions import GenerationError, ExportError
 
+# Session stages run once per floor; their spans make up FloorOutput.timings
+FLOOR_STAGES = ("floorplan", "walls", "openings", "carving", "slabs", "mesh")
 
 @dataclass
 class FloorOutput:
@@ -41,6 +45,7 @@ class FloorOutput:
     wall_segment_count: int
     door_count: int
     window_count: int
+    timings: Dict[str, float] = field(default_factory=dict)  # Seconds per stage, when traced
 
 
 @dataclass
@@ -50,132 +55,347 @@ class GenerationOutput:
     cleanup: Dict[str, object]
     export_manifest: str
     glb_path: Optional[str] = None
+    geometry: Optional[MeshArrays] = None
+    timings: Dict[str, float] = field(default_factory=dict)  # Seconds per stage, when traced
+
 
+def generate(
+    spec: BuildingSpec,
+    output_dir: Path,
+    *,
+    session: Optional[BuildSession] = None,
+    artifact_cache: Optional[ArtifactCache] = None,
+    settings: Optional[ExportSettings] = None,
+    tracer: Optional[Tracer] = None,
+) -> GenerationOutput:
+    """Procedurally generate a building based on spec.
 
-def generate(spec: BuildingSpec, output_dir: Path) -> GenerationOutput:
-    """Procedurally generate a building based on spec."""
+    Pass the same :class:`BuildSession` to successive calls to only rebuild
+    the stages affected by a spec change. With an :class:`ArtifactCache`
+    (or ``MF_ARTIFACT_CACHE_DIR``), a previously exported spec is served from
+    the cache without planning or Blender work. With a :class:`Tracer`, stage
+    timings are attached to the output and recorded in ``tracer`` for
+    :meth:`Tracer.write_chrome_trace`; without one, a ``session``'s own
+    tracer is used. Passing ``tracer`` with a session makes it the session's.
+    """
     start_time = time.time()
     logger.info(f"Starting generation: {spec.width}x{spec.depth}, {spec.floors} floors (Seed: {spec.seed})")
-    
-    if spec.width < 5 or spec.depth < 5:
-        raise ConfigurationError(f"Building dimensions too small: {spec.width}x{spec.depth}")
 
-    floor_outputs: List[FloorOutput] = []
-    top_footprint = None
-    top_z = 0.0
-    stairwell = None
+    validate_spec(spec)
 
-    # For Blender rendering
-    blender_objects = []
+    settings = settings or ExportSettings()
+    session = session or null_session()
+    if tracer is not None:
+        session.tracer = tracer
+    # Per-build child, so the output's timings cover this build only
+    tracer = session.tracer.child()
+    artifact_cache = artifact_cache or default_artifact_cache()
+    key = artifact_key(spec, settings) if artifact_cache else None
+    if artifact_cache:
+        with tracer.span("artifact_cache"):
+            output = cached_output(artifact_cache, key, output_dir, settings)
+        if output is not None:
+            output.timings = tracer.timings()
+            return output
 
+    session_tracer, session.tracer = session.tracer, tracer
+    session.begin()
     try:
-        # 1. First floor generation to determine stairwell placement
-        first_rooms, first_corridor = generate_floorplan(spec.width, spec.depth, spec.seed, 0)
-        if spec.floors > 1:
-            stairwell = generate_stairwell(first_rooms, first_corridor.rect)
-            logger.info(f"Stairwell placed at {stairwell.rect}")
-
-        for floor_idx in range(spec.floors):
-            logger.debug(f"Processing Floor {floor_idx}...")
-            rooms, corridor = generate_floorplan(spec.width, spec.depth, spec.seed, floor_idx)
-            adjacency = build_adjacency(rooms)
-            wall_segments_by_room = build_room_wall_segments(rooms)
-            corridor_faces = corridor_facing_walls(rooms, corridor)
-            room_rect_lookup = {
-                r.id: (r.rect.min_x, r.rect.min_y, r.rect.max_x, r.rect.max_y) for r in rooms
-            }
-            
-            # Openings (Doors and Windows)
-            door_openings = corridor_door_openings(corridor_faces, room_rect_lookup)
-            window_openings = generate_window_placements(rooms)
-            
-            # Carve openings into wall segments
-            carved = carve_doors(wall_segments_by_room, door_openings)
-            carved = carve_windows(carved, window_openings)
-
-            merged_walls = [seg for segs in carved.values() for seg in segs]
-            merged_walls = dedupe_segments(remove_zero_length_segments(merged_walls))
-            
-            floor_z_offset = floor_idx * STORY_HEIGHT
-            
-            # Slabs with stairwell hole
-            slabs = build_floor_ceiling_slabs(rooms, floor_idx, stairwell.rect if stairwell else None)
-            
-            if bpy:
-                wall_obj = create_wall_mesh(merged_walls, f"Walls_F{floor_idx}")
-                wall_obj.location.z = floor_z_offset
-                blender_objects.append(wall_obj)
-                
-                slab_obj = create_slab_mesh(slabs, f"Slabs_F{floor_idx}")
-                blender_objects.append(slab_obj)
-
-            if rooms:
-                min_x = min(r.rect.min_x for r in rooms)
-                min_y = min(r.rect.min_y for r in rooms)
-                max_x = max(r.rect.max_x for r in rooms)
-                max_y = max(r.rect.max_y for r in rooms)
-                top_footprint = (min_x, min_y, max_x, max_y)
-                top_z = (floor_idx + 1) * STORY_HEIGHT
-
-            floor_outputs.append(
-                FloorOutput(
-                    floor_index=floor_idx,
-                    room_count=len(rooms),
-                    adjacency=adjacency,
-                    wall_segment_count=len(merged_walls),
-                    door_count=len(door_openings),
-                    window_count=len(window_openings)
-                )
+        plan = plan_building(spec, session)
+        output = realize_plan(plan, output_dir, session, settings)
+        if artifact_cache:
+            store_artifacts(artifact_cache, key, output, output_dir, settings)
+        duration = time.time() - start_time
+        logger.info(f"Generation completed successfully in {duration:.3f}s")
+        return output
+    except Exception as e:
+        logger.error(f"Generation failed: {str(e)}")
+        raise GenerationError(f"Critical error during building generation: {e}") from e
+    finally:
+        session.tracer = session_tracer
+
+
+def realize_plan(
+    plan: BuildingPlan,
+    output_dir: Path,
+    session: Optional[BuildSession] = None,
+    settings: Optional[ExportSettings] = None,
+) -> GenerationOutput:
+    """Turn an abstract :class:`BuildingPlan` into meshes, exports and a manifest.
+
+    Mesh, merge and GLB stages go through ``session``. Blender objects are
+    always rebuilt because the final join consumes them. With
+    ``settings.instance_walls`` wall pieces are exported as instances of a few
+    shared shape meshes instead of being merged into the building mesh.
+    Reduced LODs in ``settings.lod_levels`` are built from the plan (see
+    :mod:`mf_v5.lod`) and listed in the manifest with their triangle counts.
+    The navmesh (see :mod:`mf_v5.navmesh`) is always written as a GLB and a
+    polygon JSON without going through Blender. Stage timings come from the
+    spans recorded in ``session.tracer``.
+    """
+    session = session or null_session()
+    tracer = session.tracer
+    settings = settings or ExportSettings()
+    spec = plan.spec
+    floor_outputs: List[FloorOutput] = []
+
+    # Geometry is built as NumPy buffers; Blender objects are one consumer of them
+    parts: List[Tuple[str, MeshArrays]] = []
+
+    for floor in plan.floors:
+        walls, slabs = session.run(
+            "mesh", floor.floor_index, (floor.digest, floor.z_offset),
+            lambda: (wall_arrays(floor.walls, floor.z_offset), slab_arrays(floor.slabs)),
+        )
+        parts.append((f"Walls_F{floor.floor_index}", walls))
+        parts.append((f"Slabs_F{floor.floor_index}", slabs))
+
+        floor_outputs.append(
+            FloorOutput(
+                floor_index=floor.floor_index,
+                room_count=len(floor.rooms),
+                adjacency=floor.adjacency,
+                wall_segment_count=len(floor.walls),
+                door_count=len(floor.doors),
+                window_count=len(floor.windows)
             )
+        )
+
+    if plan.stairwell and spec.floors > 1:
+        parts.append(("Stairs", session.run(
+            "mesh", "stairs", (plan.stairwell, spec.floors), lambda: stair_arrays(plan.stairwell, spec.floors)
+        )))
+
+    if plan.roof:
+        parts.append(("Roof", session.run("mesh", "roof", session.digest("roof"), lambda: roof_arrays(plan.roof))))
+
+    part_digests = [
+        session.digest("mesh", scope)
+        for scope in [*(f.floor_index for f in plan.floors), "stairs", "roof"]
+    ]
+    geometry = session.run("merge", None, part_digests, lambda: merge_arrays(arrays for _, arrays in parts))
+    # Built from the plan, not the visual mesh
+    collider = session.run(
+        "collider", None, ([f.digest for f in plan.floors], plan.stairwell, session.digest("roof"), settings.collider_mode),
+        lambda: collider_arrays(plan) if settings.collider_mode == "trimesh" else collider_shapes(plan),
+    )
+    collider_path = output_dir / collider_filename("Building", settings)
+    lod_digests = [f.digest for f in plan.floors], session.digest("roof")
+    lods = {
+        level: session.run("lod", level, lod_digests, lambda level=level: lod_arrays(plan, level))
+        for level in settings.reduced_lods
+    }
+    lod_files = [
+        GlbFile(output_dir / lod_filename("Building", level), [(f"Building_LOD{level}", arrays)])
+        for level, arrays in lods.items()
+    ]
+    navmesh = session.run(
+        "navmesh", None, ([f.digest for f in plan.floors], plan.stairwell), lambda: build_navmesh(plan)
+    )
+    navmesh_glb, navmesh_json = (output_dir / name for name in navmesh_filenames("Building"))
+    # The "-navmesh" suffix makes Godot's importer turn the node into a NavigationRegion3D
+    plan_files = [*lod_files, GlbFile(navmesh_glb, [("Building-navmesh", navmesh.to_arrays())])]
+
+    instances = None
+    merged_parts = parts
+    if settings.instance_walls:
+        instances = session.run(
+            "instances", None, [f.digest for f in plan.floors],
+            lambda: _wall_instances(plan),
+        )
+        merged_parts = [(name, arrays) for name, arrays in parts if not name.startswith("Walls_")]
+
+    # For Blender rendering
+    blender_objects = []
+    if bpy:
+        with tracer.span("blender_objects"):
+            blender_objects = _blender_objects(plan, merged_parts)
 
-        # Build Stairs
-        if bpy and stairwell and spec.floors > 1:
-            stair_obj = build_stair_mesh(stairwell, spec.floors)
-            blender_objects.append(stair_obj)
-
-        if top_footprint:
-            roof_rect = Rect(*top_footprint)
-            roof_geo = build_roof(roof_rect, top_z, spec.roof_type)
-            if bpy and roof_geo:
-                roof_obj = create_roof_mesh(roof_geo, "Roof")
-                blender_objects.append(roof_obj)
-
-        glb_path = None
-        if bpy and blender_objects:
-            logger.info(f"Merging {len(blender_objects)} objects and cleaning up...")
+    glb_path = None
+    if bpy and blender_objects:
+        logger.info(f"Merging {len(blender_objects)} objects and cleaning up...")
+        with tracer.span("final_merge"):
             final_obj = final_merge_and_cleanup(blender_objects)
-            if final_obj:
-                collider_obj = create_simplified_collider(final_obj, "Building_Collider")
-                settings = ExportSettings()
-                # Deselect all objects first
-                bpy.ops.object.select_all(action='DESELECT')
-                # Select the final building object
-                final_obj.select_set(True)
-                # Export the main building
+        if final_obj:
+            wall_objects = create_instance_objects(instances, "Wall") if instances else []
+            # Deselect all objects first
+            bpy.ops.object.select_all(action='DESELECT')
+            # Select the final building object and any wall instances
+            final_obj.select_set(True)
+            for obj in wall_objects:
+                obj.select_set(True)
+            # Export the main building
+            with tracer.span("export", "building"):
                 building_glb_path = export_to_glb(final_obj, output_dir, "Building", settings)
-                if building_glb_path: glb_path = str(building_glb_path)
-                # Deselect all objects again
-                bpy.ops.object.select_all(action='DESELECT')
-                # Select the collider object
-                collider_obj.select_set(True)
-                # Export the collider
-                collider_glb_path = export_to_glb(collider_obj, output_dir, "Building-col", settings)
-
-            else:
-                raise ExportError("Failed to create merged building object.")
-
-        settings = ExportSettings()
-        manifest_path = export_manifest(output_dir / "export_manifest.json", "Building", settings)
-        duration = time.time() - start_time
-        logger.info(f"Generation completed successfully in {duration:.3f}s")
+            if building_glb_path: glb_path = str(building_glb_path)
+            with tracer.span("export", "collider"):
+                if settings.collider_mode == "trimesh":
+                    collider_obj = create_mesh_object(collider, "Building_Collider")
+                    # Deselect all objects again
+                    bpy.ops.object.select_all(action='DESELECT')
+                    # Select the collider object
+                    collider_obj.select_set(True)
+                    # Export the collider
+                    collider_glb_path = export_to_glb(collider_obj, output_dir, f"Building{settings.collider_suffix}", settings)
+                else:
+                    # Primitive shapes don't need Blender
+                    _write_collider(collider, collider_path, settings)
+            # LOD and navmesh meshes come straight from the plan
+            with tracer.span("export", "plan_files"):
+                write_glb_files(plan_files, settings)
+                navmesh.write_json(navmesh_json, settings.y_up)
+
+        else:
+            raise ExportError("Failed to create merged building object.")
+    else:
+        # No Blender process, or nothing for Blender to merge: stream the NumPy
+        # buffers straight to GLB. Empty meshes still get written, so every file
+        # the manifest lists exists.
+        if instances:
+            building = GlbFile(output_dir / "Building.glb", *_instanced_glb(merged_parts, instances))
+        else:
+            building = GlbFile(output_dir / "Building.glb", [("Building", geometry)])
+        if not all(p.exists() for p in [building.path, *(f.path for f in plan_files), collider_path, navmesh_json]):
+            session.invalidate("export")
+
+        def export() -> Path:
+            navmesh.write_json(navmesh_json, settings.y_up)
+            return _write_collider(collider, collider_path, settings, also=[building, *plan_files])[0]
 
-        return GenerationOutput(
-            floors=floor_outputs,
-            roof_type=spec.roof_type.value,
-            cleanup=summarize_cleanup(default_merge_plan()),
-            export_manifest=str(manifest_path),
-            glb_path=glb_path
+        building_glb_path = session.run(
+            "export", None,
+            (
+                session.digest("merge"), session.digest("collider"), [session.digest("lod", n) for n in lods],
+                session.digest("navmesh"), settings, str(output_dir),
+            ),
+            export,
         )
-    except Exception as e:
-        logger.error(f"Generation failed: {str(e)}")
-        raise GenerationError(f"Critical error during building generation: {e}") from e
+        glb_path = str(building_glb_path)
+
+    lod_triangles = {0: geometry.triangle_count} if 0 in settings.lod_levels else {}
+    lod_triangles.update((level, arrays.triangle_count) for level, arrays in lods.items())
+    with tracer.span("manifest"):
+        manifest_path = export_manifest(output_dir / "export_manifest.json", "Building", settings, lod_triangles)
+
+    for floor_output in floor_outputs:
+        floor_output.timings = tracer.timings(
+            lambda span, idx=floor_output.floor_index: span.scope == idx and span.name in FLOOR_STAGES
+        )
+    return GenerationOutput(
+        floors=floor_outputs,
+        roof_type=spec.roof_type.value,
+        cleanup=summarize_cleanup(default_merge_plan()),
+        export_manifest=str(manifest_path),
+        glb_path=glb_path,
+        geometry=geometry,
+        timings=tracer.timings(),
+    )
+
+
+def _write_collider(
+    collider: Union[MeshArrays, ColliderShapes],
+    path: Path,
+    settings: ExportSettings,
+    also: Sequence[GlbFile] = (),
+) -> List[Path]:
+    """Write the collider in ``settings.collider_mode``, alongside any ``also`` GLBs.
+
+    Returns the paths of ``also`` followed by the collider's path.
+    """
+    if settings.collider_mode == "json":
+        paths = write_glb_files(also, settings)
+        return [*paths, collider.write_json(path, settings.y_up)]
+    if settings.collider_mode == "boxes":
+        collider_file = GlbFile(path, *collider.glb_parts())
+    else:
+        collider_file = GlbFile(path, [("Building_Collider", collider)])
+    return write_glb_files([*also, collider_file], settings)
+
+
+def _wall_instances(plan: BuildingPlan) -> MeshInstances:
+    instances = MeshInstances()
+    for floor in plan.floors:
+        instances.add_walls(floor.walls, floor.z_offset)
+    logger.debug(f"Instancing {len(instances.placements)} wall pieces from {len(instances.shapes)} shapes")
+    return instances
+
+
+def _instanced_glb(parts: List[Tuple[str, MeshArrays]], instances: MeshInstances):
+    """Meshes and nodes for a building whose walls reference shared shape meshes."""
+    meshes: List[Tuple[str, MeshArrays]] = [("Building", merge_arrays(arrays for _, arrays in parts))]
+    nodes = [GlbNode("Building", 0)]
+    meshes += [(f"WallShape_{i}", shape) for i, shape in enumerate(instances.shapes)]
+    nodes += [
+        GlbNode(f"Wall_{i}", 1 + shape, tuple(float(v) for v in translation))
+        for i, (shape, translation) in enumerate(instances.placements)
+    ]
+    return meshes, nodes
+
+
+def _blender_objects(plan: BuildingPlan, parts: Sequence[Tuple[str, MeshArrays]]) -> list:
+    """One Blender object per non-empty part.
+
+    Walls, slabs and the roof are rebuilt from the plan as quads and n-gons
+    (see :mod:`mf_v5.blender_mesh`) instead of the triangle soup in ``parts``;
+    other parts, such as the stairs, come from their arrays.
+    """
+    builders = {"Roof": lambda: create_roof_mesh(plan.roof, "Roof")}
+    for floor in plan.floors:
+        walls, slabs = f"Walls_F{floor.floor_index}", f"Slabs_F{floor.floor_index}"
+        builders[walls] = lambda floor=floor, name=walls: create_wall_mesh(floor.walls, name, z_offset=floor.z_offset)
+        builders[slabs] = lambda floor=floor, name=slabs: create_slab_mesh(floor.slabs, name)
+    objects = []
+    for name, arrays in parts:
+        if arrays.vertex_count:
+            build = builders.get(name)
+            objects.append(build() if build else create_mesh_object(arrays, name))
+    return objects
+
+
+def cached_output(cache: ArtifactCache, key: str, output_dir: Path, settings: ExportSettings) -> Optional[GenerationOutput]:
+    """Materialize the cache entry for ``key`` into ``output_dir``; ``None`` on a miss."""
+    entry = cache.lookup(key)
+    if entry is None:
+        return None
+    try:
+        output = _output_from_cache(cache, entry, output_dir, settings)
+    except (OSError, ValueError) as e:
+        # Evicted by another process after the lookup; build as on a miss
+        logger.warning(f"Artifact cache entry {key} unreadable ({e}); regenerating")
+        return None
+    logger.info(f"Artifact cache hit {key}; skipping generation")
+    return output
+
+
+def store_artifacts(cache: ArtifactCache, key: str, output: GenerationOutput, output_dir: Path, settings: ExportSettings) -> None:
+    """Publish the artifacts ``output`` wrote to ``output_dir`` under ``key``."""
+    files = [output_dir / name for name in artifact_names(settings)]
+    if not all(f.exists() for f in files):
+        logger.warning(f"Not caching {key}: missing exported artifacts")
+        return
+    result = {
+        # Timings describe this build, not a later cache hit
+        "floors": [{**asdict(f), "timings": {}} for f in output.floors],
+        "roof_type": output.roof_type,
+        "cleanup": output.cleanup,
+    }
+    cache.store(key, files, result)
+
+
+def _output_from_cache(cache: ArtifactCache, entry: Path, output_dir: Path, settings: ExportSettings) -> GenerationOutput:
+    """Link a cache entry's artifacts into ``output_dir`` and rebuild its output."""
+    result = json.loads((entry / RESULT_FILE).read_text(encoding="utf-8"))
+    cache.materialize(entry, output_dir)
+    building, _, manifest, *_ = artifact_names(settings)
+    floors = []
+    for f in result["floors"]:
+        # JSON object keys are strings; room ids are ints
+        f["adjacency"] = {int(room_id): sides for room_id, sides in f["adjacency"].items()}
+        floors.append(FloorOutput(**f))
+    return GenerationOutput(
+        floors=floors,
+        roof_type=result["roof_type"],
+        cleanup=result["cleanup"],
+        export_manifest=str(output_dir / manifest),
+        glb_path=str(output_dir / building),
+    )
@@ -3,15 +3,24 @@
 from __future__ import annotations
 
 import json
+import struct
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .exceptions import ConfigurationError
+from .mesh_arrays import MeshArrays
 
 try:
     import bpy
 except ImportError:
     bpy = None
 
+COLLIDER_MODES = ("trimesh", "boxes", "json")
+
 @dataclass(frozen=True)
 class ExportSettings:
     format: str = "GLTF2"
@@ -21,15 +30,54 @@ class ExportSettings:
     selected_only: bool = True
     collider_suffix: str = "-col"
     navmesh_collection: str = "MF_Navmesh"
+    instance_walls: bool = False  # Export wall pieces as instances of shared shape meshes
+    # "trimesh": one collision mesh; "boxes": -convcolonly box/hull nodes; "json": sidecar shape list
+    collider_mode: str = "trimesh"
+    lod_levels: Tuple[int, ...] = (0,)  # 0 = Building.glb; 1 and 2 add Building_LOD1/2.glb
+
+    def __post_init__(self):
+        if self.collider_mode not in COLLIDER_MODES:
+            raise ConfigurationError(f"Unknown collider mode {self.collider_mode!r}; expected one of {COLLIDER_MODES}")
+        if not set(self.lod_levels) <= {0, 1, 2}:
+            raise ConfigurationError(f"Unsupported LOD levels {self.lod_levels}; expected a subset of (0, 1, 2)")
+
+    @property
+    def reduced_lods(self) -> Tuple[int, ...]:
+        """Requested LOD levels other than the full building, ascending."""
+        return tuple(sorted(set(self.lod_levels) - {0}))
 
-def export_manifest(output_path: Path, building_name: str, settings: ExportSettings) -> Path:
+def collider_filename(building_name: str, settings: ExportSettings) -> str:
+    extension = "json" if settings.collider_mode == "json" else "glb"
+    return f"{building_name}{settings.collider_suffix}.{extension}"
+
+def lod_filename(building_name: str, level: int) -> str:
+    return f"{building_name}.glb" if level == 0 else f"{building_name}_LOD{level}.glb"
+
+def navmesh_filenames(building_name: str) -> Tuple[str, str]:
+    """The navmesh GLB (a ``-navmesh`` node for Godot's importer) and its polygon JSON."""
+    return f"{building_name}_navmesh.glb", f"{building_name}_navmesh.json"
+
+def export_manifest(
+    output_path: Path,
+    building_name: str,
+    settings: ExportSettings,
+    lod_triangles: Optional[Dict[int, int]] = None,
+) -> Path:
+    """Write the manifest; ``lod_triangles`` maps each exported LOD level to its triangle count."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    navmesh_glb, navmesh_json = navmesh_filenames(building_name)
     payload: Dict[str, object] = {
         "building": f"{building_name}.glb",
-        "collider": f"{building_name}{settings.collider_suffix}.glb",
-        "navmesh": f"{building_name}_navmesh.glb",
+        "collider": collider_filename(building_name, settings),
+        "navmesh": navmesh_glb,
+        "navmesh_polygons": navmesh_json,
         "settings": settings.__dict__,
     }
+    if lod_triangles:
+        payload["lods"] = [
+            {"level": level, "file": lod_filename(building_name, level), "triangles": count}
+            for level, count in sorted(lod_triangles.items())
+        ]
     output_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
     return output_path
 
@@ -60,3 +108,155 @@ def export_to_glb(obj: bpy.types.Object, output_dir: Path, filename: str, settin
     # The collider path logic should be handled by the caller as well
     
     return filepath
+
+
+# --- Pure-Python glTF 2.0 binary writer ---
+
+_GLB_MAGIC = 0x46546C67  # b"glTF"
+_CHUNK_JSON = 0x4E4F534A
+_CHUNK_BIN = 0x004E4942
+_FLOAT = 5126
+_UNSIGNED_INT = 5125
+_ARRAY_BUFFER = 34962
+_ELEMENT_ARRAY_BUFFER = 34963
+# Rotation taking Blender's Z-up frame to glTF's Y-up frame: (x, y, z) -> (x, z, -y)
+_Z_UP_TO_Y_UP = [-0.7071067811865476, 0.0, 0.0, 0.7071067811865476]
+
+
+@dataclass(frozen=True)
+class GlbNode:
+    name: str
+    mesh: int
+    translation: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+
+
+@dataclass
+class GlbFile:
+    path: Path
+    meshes: Sequence[Tuple[str, MeshArrays]]
+    nodes: Optional[Sequence[GlbNode]] = None
+
+
+def _pad4(length: int) -> int:
+    return (4 - length % 4) % 4
+
+
+def _build_gltf(meshes: Sequence[Tuple[str, MeshArrays]], nodes: Sequence[GlbNode], settings: ExportSettings):
+    """Build the glTF JSON document and the ordered list of buffer views to stream."""
+    views: List[np.ndarray] = []
+    buffer_views: List[Dict[str, object]] = []
+    accessors: List[Dict[str, object]] = []
+    offset = 0
+
+    def add_view(array: np.ndarray, target: int) -> int:
+        nonlocal offset
+        array = np.ascontiguousarray(array)
+        buffer_views.append({"buffer": 0, "byteOffset": offset, "byteLength": array.nbytes, "target": target})
+        views.append(array)
+        offset += array.nbytes + _pad4(array.nbytes)
+        return len(buffer_views) - 1
+
+    def add_accessor(array: np.ndarray, component: int, kind: str, target: int, bounds: bool = False) -> int:
+        accessor: Dict[str, object] = {
+            "bufferView": add_view(array, target),
+            "componentType": component,
+            "count": len(array),
+            "type": kind,
+        }
+        if bounds:
+            accessor["min"] = array.min(axis=0).tolist()
+            accessor["max"] = array.max(axis=0).tolist()
+        accessors.append(accessor)
+        return len(accessors) - 1
+
+    gltf_meshes = []
+    mesh_index: Dict[int, int] = {}
+    for i, (name, arrays) in enumerate(meshes):
+        count = arrays.vertex_count
+        if not count:
+            # glTF accessors can't be empty; nodes of an empty mesh are written without one
+            continue
+        mesh_index[i] = len(gltf_meshes)
+        attributes = {"POSITION": add_accessor(arrays.positions.astype(np.float32, copy=False), _FLOAT, "VEC3", _ARRAY_BUFFER, bounds=True)}
+        if len(arrays.normals) == count:
+            attributes["NORMAL"] = add_accessor(arrays.normals.astype(np.float32, copy=False), _FLOAT, "VEC3", _ARRAY_BUFFER)
+        if len(arrays.uvs) == count:
+            # glTF puts the UV origin at the top-left of the image, Blender at the bottom-left
+            uvs = arrays.uvs.astype(np.float32)
+            uvs[:, 1] = 1.0 - uvs[:, 1]
+            attributes["TEXCOORD_0"] = add_accessor(uvs, _FLOAT, "VEC2", _ARRAY_BUFFER)
+        indices = add_accessor(arrays.indices.astype(np.uint32, copy=False), _UNSIGNED_INT, "SCALAR", _ELEMENT_ARRAY_BUFFER)
+        gltf_meshes.append({"name": name, "primitives": [{"attributes": attributes, "indices": indices, "mode": 4}]})
+
+    gltf_nodes: List[Dict[str, object]] = []
+    for node in nodes:
+        entry: Dict[str, object] = {"name": node.name}
+        if node.mesh in mesh_index:
+            entry["mesh"] = mesh_index[node.mesh]
+        if any(node.translation):
+            entry["translation"] = list(node.translation)
+        gltf_nodes.append(entry)
+
+    root_children = list(range(len(gltf_nodes)))
+    if settings.y_up:
+        gltf_nodes.append({"name": "Root", "rotation": _Z_UP_TO_Y_UP, "children": root_children})
+        scene_nodes = [len(gltf_nodes) - 1]
+    else:
+        scene_nodes = root_children
+
+    gltf = {
+        "asset": {"version": "2.0", "generator": "MF v5.1 glb writer"},
+        "scene": 0,
+        "scenes": [{"nodes": scene_nodes}],
+        "nodes": gltf_nodes,
+    }
+    if gltf_meshes:
+        gltf.update(meshes=gltf_meshes, accessors=accessors, bufferViews=buffer_views, buffers=[{"byteLength": offset}])
+    return gltf, views, offset
+
+
+def _stream_views(f: BinaryIO, views: Iterable[np.ndarray]) -> None:
+    for array in views:
+        f.write(memoryview(array).cast("B"))
+        f.write(b"\0" * _pad4(array.nbytes))
+
+
+def write_glb(
+    path: Path,
+    meshes: Sequence[Tuple[str, MeshArrays]],
+    settings: ExportSettings = ExportSettings(),
+    nodes: Optional[Sequence[GlbNode]] = None,
+) -> Path:
+    """Write meshes as a glTF 2.0 binary file straight from their NumPy buffers.
+
+    By default every mesh gets one node. Buffers are streamed to disk from
+    memoryviews without being copied into an intermediate blob; the Y-up
+    conversion is carried by a root node rotation instead of rewriting vertices.
+    """
+    if nodes is None:
+        nodes = [GlbNode(name, i) for i, (name, _) in enumerate(meshes)]
+    gltf, views, bin_length = _build_gltf(meshes, nodes, settings)
+
+    json_bytes = json.dumps(gltf, separators=(",", ":")).encode("utf-8")
+    json_bytes += b" " * _pad4(len(json_bytes))
+    # A file with no geometry has no BIN chunk
+    total = 12 + 8 + len(json_bytes) + (8 + bin_length if bin_length else 0)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(struct.pack("<III", _GLB_MAGIC, 2, total))
+        f.write(struct.pack("<II", len(json_bytes), _CHUNK_JSON))
+        f.write(json_bytes)
+        if bin_length:
+            f.write(struct.pack("<II", bin_length, _CHUNK_BIN))
+            _stream_views(f, views)
+    return path
+
+
+def write_glb_files(files: Sequence[GlbFile], settings: ExportSettings = ExportSettings()) -> List[Path]:
+    """Write several GLB files concurrently (e.g. building and collider)."""
+    if len(files) <= 1:
+        return [write_glb(f.path, f.meshes, settings, f.nodes) for f in files]
+    with ThreadPoolExecutor(max_workers=len(files)) as pool:
+        futures = [pool.submit(write_glb, f.path, f.meshes, settings, f.nodes) for f in files]
+        return [future.result() for future in futures]
@@ -3,11 +3,27 @@
 from __future__ import annotations
 
 import random
-from typing import List, Sequence, Tuple
-
-from .config import CORRIDOR_WIDTH, EPSILON, MIN_ROOM_SIZE, snap
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+from .cache import _MISSING, CacheStats, DiskTier, LRUCache, fingerprint
+from .config import (
+    CORRIDOR_WIDTH,
+    EPSILON,
+    FLOORPLAN_CACHE_DIR,
+    FLOORPLAN_CACHE_SIZE,
+    GRID,
+    MIN_ROOM_SIZE,
+    snap,
+)
 from .datamodel import Corridor, Rect, Room
 
+# Bump whenever generate_floorplan's output changes for the same arguments
+FLOORPLAN_VERSION = "5.1-floorplan-1"
+
+# Cached floorplans are only valid for the code and constants they were generated with
+_LAYOUT_FINGERPRINT = fingerprint(FLOORPLAN_VERSION, GRID, EPSILON, CORRIDOR_WIDTH, MIN_ROOM_SIZE)
+
 
 def split_rect(rect: Rect, vertical: bool, split_pos: float) -> Tuple[Rect, Rect]:
     if vertical:
@@ -91,3 +107,49 @@ def generate_floorplan(width: float, depth: float, seed: int, floor_index: int)
         queue.append(r2)
 
     return sorted(rooms, key=lambda r: r.id), corridor
+
+
+class FloorplanCache:
+    """Memoizes :func:`generate_floorplan` in a bounded LRU plus an optional disk tier.
+
+    Keys are the call arguments plus a fingerprint of the layout constants, so
+    a persistent tier is never read back with stale grid or size settings.
+    """
+
+    def __init__(self, maxsize: int = FLOORPLAN_CACHE_SIZE, disk_dir: Optional[str] = FLOORPLAN_CACHE_DIR):
+        self.memory = LRUCache(maxsize)
+        self.disk = DiskTier(Path(disk_dir)) if disk_dir else None
+        self.stats = CacheStats()
+
+    def get(self, width: float, depth: float, seed: int, floor_index: int) -> Tuple[List[Room], Corridor]:
+        key = (float(width), float(depth), int(seed), int(floor_index), _LAYOUT_FINGERPRINT)
+
+        value = self.memory.get(key)
+        if value is not _MISSING:
+            self.stats.hits += 1
+        else:
+            value = self.disk.get(key) if self.disk else _MISSING
+            if value is not _MISSING:
+                self.stats.disk_hits += 1
+            else:
+                self.stats.misses += 1
+                rooms, corridor = generate_floorplan(width, depth, seed, floor_index)
+                value = (tuple(rooms), corridor)
+                if self.disk:
+                    self.disk.put(key, value)
+            self.stats.evictions += self.memory.put(key, value)
+
+        rooms, corridor = value
+        return list(rooms), corridor
+
+    def clear(self) -> None:
+        self.memory.clear()
+        self.stats = CacheStats()
+
+
+FLOORPLAN_CACHE = FloorplanCache()
+
+
+def cached_floorplan(width: float, depth: float, seed: int, floor_index: int) -> Tuple[List[Room], Corridor]:
+    """:func:`generate_floorplan` through the process-wide :data:`FLOORPLAN_CACHE`."""
+    return FLOORPLAN_CACHE.get(width, depth, seed, floor_index)
@@ -0,0 +1,78 @@
+"""Stage-level memoization for incremental rebuilds of a changing BuildingSpec.
+
+Each stage result is stored per ``(stage, scope)`` (scope is usually the floor
+index) together with a digest of its inputs. Inputs are small parameters plus
+the digests of upstream stages, so digests chain like a Merkle tree:
+
+    floorplan -> walls / openings -> carving -> mesh -> merge -> export
+
+A stage is re-run only when its digest changes; everything downstream of an
+unchanged stage is reused.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, TypeVar
+
+from .cache import fingerprint
+from .tracing import Tracer, null_tracer
+
+T = TypeVar("T")
+
+
+class BuildSession:
+    """Keeps stage results between :func:`mf_v5.engine.generate` calls.
+
+    Every :meth:`run` is recorded as a span in :attr:`tracer`.
+    """
+
+    def __init__(self, store: bool = True, tracer: Optional[Tracer] = None):
+        self.store = store
+        self.tracer = tracer or null_tracer()
+        self._results: Dict[Tuple[str, Hashable], Tuple[str, Any]] = {}
+        self._digests: Dict[Tuple[str, Hashable], str] = {}
+        self.executed: List[Tuple[str, Hashable]] = []
+        self.reused: List[Tuple[str, Hashable]] = []
+
+    def begin(self) -> None:
+        """Start a new build; resets the executed/reused bookkeeping."""
+        self.executed = []
+        self.reused = []
+        self._digests = {}
+
+    def run(self, stage: str, scope: Hashable, inputs: Any, fn: Callable[[], T]) -> T:
+        """Return the stored result for ``stage`` if ``inputs`` are unchanged, else run ``fn``."""
+        with self.tracer.span(stage, scope):
+            return self._run(stage, scope, inputs, fn)
+
+    def _run(self, stage: str, scope: Hashable, inputs: Any, fn: Callable[[], T]) -> T:
+        key = (stage, scope)
+        digest = fingerprint(stage, inputs)
+        self._digests[key] = digest
+
+        cached = self._results.get(key)
+        if cached is not None and cached[0] == digest:
+            self.reused.append(key)
+            return cached[1]
+
+        value = fn()
+        self.executed.append(key)
+        if self.store:
+            self._results[key] = (digest, value)
+        return value
+
+    def digest(self, stage: str, scope: Hashable = None) -> Optional[str]:
+        """Digest of the inputs ``stage`` ran with in the current build."""
+        return self._digests.get((stage, scope))
+
+    def invalidate(self, stage: str, scope: Hashable = None) -> None:
+        self._results.pop((stage, scope), None)
+
+    def clear(self) -> None:
+        self._results.clear()
+        self.begin()
+
+
+def null_session(tracer: Optional[Tracer] = None) -> BuildSession:
+    """A session that computes digests but never keeps results."""
+    return BuildSession(store=False, tracer=tracer)
@@ -0,0 +1,129 @@
+"""Level-of-detail meshes built from the abstract building model.
+
+LOD0 is the full building. LOD1 is the exterior shell: one wall per
+footprint edge and storey, carved with that edge's windows, each window
+backed by a recessed panel, plus the roof. LOD2 is the footprint extruded
+to the roof base, plus the roof. Nothing here decimates a mesh; fewer
+pieces are generated in the first place.
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .collider import collider_wall_boxes, merge_boxes
+from .config import EPSILON, LOD_PANEL_THICKNESS, LOD_WINDOW_RECESS, STORY_HEIGHT, WALL_THICKNESS
+from .datamodel import Rect, WallSegment, WindowOpening
+from .exceptions import GeometryError
+from .mesh_arrays import MeshArrays, box_arrays, merge_arrays, roof_arrays
+from .openings import carve_segment
+from .planning import BuildingPlan, FloorPlan
+
+LOD_LEVELS = (0, 1, 2)
+
+# Direction pointing into the building from each footprint edge
+_INWARD = {"south": (0, 1), "north": (0, -1), "west": (1, 0), "east": (-1, 0)}
+
+
+def floor_footprint(floor: FloorPlan) -> Optional[Rect]:
+    if not floor.rooms:
+        return None
+    return Rect(
+        min(r.rect.min_x for r in floor.rooms),
+        min(r.rect.min_y for r in floor.rooms),
+        max(r.rect.max_x for r in floor.rooms),
+        max(r.rect.max_y for r in floor.rooms),
+    )
+
+
+def _edges(rect: Rect) -> List[Tuple[str, WallSegment]]:
+    """Full-storey walls along the footprint; north/south run past the corners to close them."""
+    half = WALL_THICKNESS / 2
+    return [
+        ("south", WallSegment(-1, "south", rect.min_x - half, rect.min_y, rect.max_x + half, rect.min_y, STORY_HEIGHT, WALL_THICKNESS)),
+        ("north", WallSegment(-1, "north", rect.min_x - half, rect.max_y, rect.max_x + half, rect.max_y, STORY_HEIGHT, WALL_THICKNESS)),
+        ("west", WallSegment(-1, "west", rect.min_x, rect.min_y, rect.min_x, rect.max_y, STORY_HEIGHT, WALL_THICKNESS)),
+        ("east", WallSegment(-1, "east", rect.max_x, rect.min_y, rect.max_x, rect.max_y, STORY_HEIGHT, WALL_THICKNESS)),
+    ]
+
+
+def shell_walls(floor: FloorPlan) -> Tuple[List[WallSegment], List[Tuple[str, WindowOpening]]]:
+    """Carved footprint walls of one floor and the ``(side, window)`` pairs cut into them.
+
+    Only windows centred on a footprint edge are exterior; the rest sit on
+    interior walls and are dropped with them.
+    """
+    rect = floor_footprint(floor)
+    if rect is None:
+        return [], []
+    pieces: List[WallSegment] = []
+    exterior: List[Tuple[str, WindowOpening]] = []
+    for side, edge in _edges(rect):
+        horizontal = side in ("north", "south")
+        line = edge.y1 if horizontal else edge.x1
+        windows = [
+            w for w in floor.windows
+            if (w.side in ("north", "south")) == horizontal and abs((w.center[1] if horizontal else w.center[0]) - line) <= EPSILON
+        ]
+        pieces.extend(carve_segment(edge, windows))
+        exterior.extend((side, w) for w in windows)
+    return pieces, exterior
+
+
+def _window_panels(exterior: List[Tuple[str, WindowOpening]], z_offset: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Thin boxes filling each window a little behind the outer wall face."""
+    mins: List[Tuple[float, float, float]] = []
+    maxs: List[Tuple[float, float, float]] = []
+    for side, w in exterior:
+        ix, iy = _INWARD[side]
+        outer = (w.center[0] - ix * WALL_THICKNESS / 2, w.center[1] - iy * WALL_THICKNESS / 2)
+        near = (outer[0] + ix * LOD_WINDOW_RECESS, outer[1] + iy * LOD_WINDOW_RECESS)
+        far = (near[0] + ix * LOD_PANEL_THICKNESS, near[1] + iy * LOD_PANEL_THICKNESS)
+        z0 = z_offset + w.sill_height
+        if ix:
+            xs, ys = sorted((near[0], far[0])), (w.center[1] - w.width / 2, w.center[1] + w.width / 2)
+        else:
+            xs, ys = (w.center[0] - w.width / 2, w.center[0] + w.width / 2), sorted((near[1], far[1]))
+        mins.append((xs[0], ys[0], z0))
+        maxs.append((xs[1], ys[1], z0 + w.height))
+    return np.array(mins, np.float32).reshape(-1, 3), np.array(maxs, np.float32).reshape(-1, 3)
+
+
+def lod1_arrays(plan: BuildingPlan) -> MeshArrays:
+    """Exterior shell with recessed windows; no interior walls, stairs or slabs."""
+    shells = [(shell_walls(f), f.z_offset) for f in plan.floors]
+    wall_mins, wall_maxs = collider_wall_boxes(((pieces, z) for (pieces, _), z in shells), min_span=0.0)
+    panels = [_window_panels(exterior, z) for (_, exterior), z in shells]
+    parts = [
+        box_arrays(wall_mins, wall_maxs),
+        box_arrays(np.concatenate([p[0] for p in panels]), np.concatenate([p[1] for p in panels])),
+    ]
+    if plan.roof:
+        parts.append(roof_arrays(plan.roof))
+    return merge_arrays(parts)
+
+
+def lod2_arrays(plan: BuildingPlan) -> MeshArrays:
+    """Footprint block up to the roof base, plus the roof."""
+    footprints = [(floor_footprint(f), f) for f in plan.floors]
+    footprints = [(r, f) for r, f in footprints if r is not None]
+    if not footprints:
+        return MeshArrays.empty()
+    mins = [(r.min_x, r.min_y, f.z_offset) for r, f in footprints]
+    maxs = [(r.max_x, r.max_y, f.z_offset + STORY_HEIGHT) for r, f in footprints]
+    # Identical storeys stack into one block
+    parts = [box_arrays(*merge_boxes(mins, maxs))]
+    if plan.roof:
+        parts.append(roof_arrays(plan.roof))
+    return merge_arrays(parts)
+
+
+def lod_arrays(plan: BuildingPlan, level: int) -> MeshArrays:
+    """Mesh for LOD ``level`` 1 or 2; LOD0 is the regular building mesh."""
+    if level == 1:
+        return lod1_arrays(plan)
+    if level == 2:
+        return lod2_arrays(plan)
+    raise GeometryError(f"No reduced mesh for LOD level {level}")
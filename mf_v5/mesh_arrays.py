@@ -0,0 +1,501 @@
+"""NumPy mesh backend: flat vertex/index buffers built without bpy.
+
+Every solid in the generator is either an axis-aligned box (wall pieces, slabs),
+a planar polygon (roof faces) or a stair flight with shared vertices. Boxes are expanded from a single
+24-vertex template in one vectorized step; polygons are fan-triangulated. The
+resulting :class:`MeshArrays` can be consumed by Blender, a glTF writer or any
+other renderer.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .config import SPIRAL_COLUMN_RATIO, STAIR_STEPS, STORY_HEIGHT, TEXTURE_TILE_SIZE
+from .datamodel import Rect, WallSegment
+from .exceptions import GeometryError
+from .roof import RoofGeometry
+from .slabs import Slab
+from .stairs import Stairwell
+
+
+@dataclass
+class MeshArrays:
+    positions: np.ndarray  # (V, 3) float32
+    normals: np.ndarray  # (V, 3) float32
+    uvs: np.ndarray  # (V, 2) float32
+    indices: np.ndarray  # (T * 3,) uint32 triangle list
+
+    @classmethod
+    def empty(cls) -> "MeshArrays":
+        return cls(
+            np.zeros((0, 3), np.float32),
+            np.zeros((0, 3), np.float32),
+            np.zeros((0, 2), np.float32),
+            np.zeros(0, np.uint32),
+        )
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self.positions)
+
+    @property
+    def triangle_count(self) -> int:
+        return len(self.indices) // 3
+
+    def positions_only(self) -> "MeshArrays":
+        """Same triangles without normals or UVs, e.g. for collision meshes."""
+        empty = MeshArrays.empty()
+        return MeshArrays(self.positions, empty.normals, empty.uvs, self.indices)
+
+    def polygon_buffers(self) -> "PolygonBuffers":
+        """The triangle list as :class:`PolygonBuffers` (one three-loop face per triangle)."""
+        loops = self.indices.astype(np.int32)
+        uvs = self.uvs[loops] if len(self.uvs) == self.vertex_count else None
+        starts = np.arange(self.triangle_count, dtype=np.int32) * 3
+        return PolygonBuffers(self.positions, loops, starts, uvs)
+
+    def translated(self, offset: Sequence[float]) -> "MeshArrays":
+        return MeshArrays(
+            self.positions + np.asarray(offset, np.float32),
+            self.normals,
+            self.uvs,
+            self.indices,
+        )
+
+
+# Unit cube corners per face, wound counter-clockwise seen from outside.
+_BOX_FACES = np.array(
+    [
+        [(0, 0, 0), (0, 1, 0), (1, 1, 0), (1, 0, 0)],  # -Z bottom
+        [(0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1)],  # +Z top
+        [(0, 0, 0), (1, 0, 0), (1, 0, 1), (0, 0, 1)],  # -Y front
+        [(1, 0, 0), (1, 1, 0), (1, 1, 1), (1, 0, 1)],  # +X right
+        [(1, 1, 0), (0, 1, 0), (0, 1, 1), (1, 1, 1)],  # +Y back
+        [(0, 1, 0), (0, 0, 0), (0, 0, 1), (0, 1, 1)],  # -X left
+    ],
+    dtype=np.float32,
+)
+_BOX_NORMALS = np.array(
+    [(0, 0, -1), (0, 0, 1), (0, -1, 0), (1, 0, 0), (0, 1, 0), (-1, 0, 0)],
+    dtype=np.float32,
+)
+_BOX_CORNERS = _BOX_FACES.reshape(24, 3)
+_BOX_VERTEX_NORMALS = np.repeat(_BOX_NORMALS, 4, axis=0)
+_BOX_INDICES = (np.arange(6, dtype=np.uint32)[:, None] * 4 + np.array([0, 1, 2, 0, 2, 3], np.uint32)).ravel()
+# World-space UV projection matching the bmesh path: faces facing +/-Y map (x, z), all others (y, z).
+_BOX_UV_AXES = np.where(np.abs(_BOX_VERTEX_NORMALS[:, 1:2]) > 0.5, [[0, 2]], [[1, 2]])
+
+
+def box_arrays(mins: np.ndarray, maxs: np.ndarray, uv_axes: Optional[Tuple[int, int]] = None) -> MeshArrays:
+    """Build N axis-aligned boxes at once from ``(N, 3)`` min and max corners.
+
+    ``uv_axes`` forces a single world-space projection for every face; by
+    default each face is projected like the bmesh path does.
+    """
+    mins = np.asarray(mins, np.float32).reshape(-1, 3)
+    maxs = np.asarray(maxs, np.float32).reshape(-1, 3)
+    n = len(mins)
+    if n == 0:
+        return MeshArrays.empty()
+
+    positions = mins[:, None, :] + _BOX_CORNERS[None, :, :] * (maxs - mins)[:, None, :]
+    axes = _BOX_UV_AXES if uv_axes is None else np.broadcast_to(np.array(uv_axes), (24, 2))
+    uvs = positions[:, np.arange(24)[:, None], axes] / TEXTURE_TILE_SIZE
+    normals = np.broadcast_to(_BOX_VERTEX_NORMALS, (n, 24, 3))
+    indices = _BOX_INDICES[None, :] + (np.arange(n, dtype=np.uint32) * 24)[:, None]
+
+    return MeshArrays(
+        positions.reshape(-1, 3),
+        np.ascontiguousarray(normals.reshape(-1, 3)),
+        uvs.reshape(-1, 2).astype(np.float32),
+        indices.ravel(),
+    )
+
+
+@dataclass
+class PolygonBuffers:
+    """Flat Blender-style buffers: shared vertices plus per-face corner loops.
+
+    Faces are implicit: face ``i`` covers ``loops[loop_starts[i]:loop_starts[i + 1]]``.
+    These map one-to-one onto ``foreach_set`` on ``Mesh.vertices``, ``loops``,
+    ``polygons`` and a UV layer.
+    """
+
+    positions: np.ndarray  # (V, 3) float32
+    loops: np.ndarray  # (L,) int32 vertex index of each face corner
+    loop_starts: np.ndarray  # (F,) int32 first loop of each face
+    uvs: Optional[np.ndarray]  # (L, 2) float32 per-loop UVs
+
+    @property
+    def face_count(self) -> int:
+        return len(self.loop_starts)
+
+
+# Each box face corner as an index into the 8 corners of the cube (bit 0 = x, 1 = y, 2 = z)
+_CUBE_CORNERS = np.array([(i & 1, i >> 1 & 1, i >> 2 & 1) for i in range(8)], np.float32)
+_CUBE_LOOPS = (_BOX_CORNERS @ np.array([1, 2, 4], np.float32)).astype(np.int32)
+
+
+def box_polygon_buffers(mins: np.ndarray, maxs: np.ndarray) -> PolygonBuffers:
+    """N boxes as 8 shared corners and 6 quads each, UV-projected like the bmesh path."""
+    mins = np.asarray(mins, np.float32).reshape(-1, 3)
+    maxs = np.asarray(maxs, np.float32).reshape(-1, 3)
+    n = len(mins)
+    corners = (mins[:, None, :] + _CUBE_CORNERS[None, :, :] * (maxs - mins)[:, None, :]).reshape(-1, 3)
+    loops = (_CUBE_LOOPS[None, :] + (np.arange(n, dtype=np.int32) * 8)[:, None]).ravel()
+    axes = np.tile(_BOX_UV_AXES, (n, 1))
+    uvs = corners[loops[:, None], axes] / TEXTURE_TILE_SIZE
+    return PolygonBuffers(corners, loops, np.arange(n * 6, dtype=np.int32) * 4, uvs.astype(np.float32))
+
+
+def polygon_buffers(polygons: Iterable[Sequence[Tuple[float, float, float]]], uv_axes: Tuple[int, int] = (0, 1)) -> PolygonBuffers:
+    """Planar polygons as n-gons (no triangulation) with world-space UVs."""
+    polys = [np.asarray(poly, np.float32).reshape(-1, 3) for poly in polygons]
+    polys = [poly for poly in polys if len(poly) >= 3]
+    if not polys:
+        return PolygonBuffers(np.zeros((0, 3), np.float32), np.zeros(0, np.int32), np.zeros(0, np.int32), np.zeros((0, 2), np.float32))
+    positions = np.concatenate(polys)
+    starts = np.cumsum([0] + [len(poly) for poly in polys[:-1]]).astype(np.int32)
+    uvs = (positions[:, list(uv_axes)] / TEXTURE_TILE_SIZE).astype(np.float32)
+    return PolygonBuffers(positions, np.arange(len(positions), dtype=np.int32), starts, uvs)
+
+
+def polygon_arrays(polygons: Iterable[Sequence[Tuple[float, float, float]]], uv_axes: Tuple[int, int] = (0, 1)) -> MeshArrays:
+    """Fan-triangulate planar convex polygons with flat normals and world-space UVs."""
+    positions: List[np.ndarray] = []
+    normals: List[np.ndarray] = []
+    indices: List[np.ndarray] = []
+    base = 0
+    for poly in polygons:
+        verts = np.asarray(poly, np.float32)
+        count = len(verts)
+        if count < 3:
+            continue
+        # Newell's method gives a robust normal for any planar polygon
+        nxt = np.roll(verts, -1, axis=0)
+        normal = np.array([
+            np.sum((verts[:, 1] - nxt[:, 1]) * (verts[:, 2] + nxt[:, 2])),
+            np.sum((verts[:, 2] - nxt[:, 2]) * (verts[:, 0] + nxt[:, 0])),
+            np.sum((verts[:, 0] - nxt[:, 0]) * (verts[:, 1] + nxt[:, 1])),
+        ], np.float32)
+        length = np.linalg.norm(normal)
+        if length > 0:
+            normal /= length
+
+        fan = np.arange(1, count - 1, dtype=np.uint32)
+        tris = np.stack([np.zeros_like(fan), fan, fan + 1], axis=1).ravel() + base
+
+        positions.append(verts)
+        normals.append(np.broadcast_to(normal, verts.shape))
+        indices.append(tris)
+        base += count
+
+    if not positions:
+        return MeshArrays.empty()
+
+    all_positions = np.concatenate(positions)
+    return MeshArrays(
+        all_positions,
+        np.concatenate(normals).astype(np.float32),
+        (all_positions[:, list(uv_axes)] / TEXTURE_TILE_SIZE).astype(np.float32),
+        np.concatenate(indices).astype(np.uint32),
+    )
+
+
+def merge_arrays(parts: Iterable[MeshArrays]) -> MeshArrays:
+    """Concatenate meshes into one, rebasing indices."""
+    parts = [p for p in parts if p.vertex_count]
+    if not parts:
+        return MeshArrays.empty()
+    offsets = np.cumsum([0] + [p.vertex_count for p in parts[:-1]], dtype=np.uint32)
+    return MeshArrays(
+        np.concatenate([p.positions for p in parts]),
+        np.concatenate([p.normals for p in parts]),
+        np.concatenate([p.uvs for p in parts]),
+        np.concatenate([p.indices + off for p, off in zip(parts, offsets)]),
+    )
+
+
+def wall_extent(s: WallSegment) -> Optional[Tuple[float, float, float, float]]:
+    """Footprint ``(min_x, min_y, max_x, max_y)`` of a thickened segment, or ``None`` if degenerate."""
+    half_t = s.thickness / 2
+    dx, dy = s.x2 - s.x1, s.y2 - s.y1
+    length = (dx**2 + dy**2)**0.5
+    if length < 1e-4:
+        return None
+    ux, uy = dx / length, dy / length
+    nx, ny = -uy, ux
+    ax, bx = sorted((s.x1 - nx * half_t, s.x2 + nx * half_t))
+    ay, by = sorted((s.y1 - ny * half_t, s.y2 + ny * half_t))
+    return ax, ay, bx, by
+
+
+def wall_spans(s: WallSegment) -> Sequence[Tuple[float, float]]:
+    """Solid vertical ``(z0, z1)`` spans of a segment, relative to its floor."""
+    return s.opening.solid_spans(s.height) if s.opening else ((0.0, s.height),)
+
+
+def wall_boxes(segments: Iterable[WallSegment], z_offset: float = 0.0) -> Tuple[np.ndarray, np.ndarray]:
+    """Min/max corners of the solid boxes making up each wall segment."""
+    mins: List[Tuple[float, float, float]] = []
+    maxs: List[Tuple[float, float, float]] = []
+    for s in segments:
+        extent = wall_extent(s)
+        if extent is None:
+            continue
+        ax, ay, bx, by = extent
+        for z0, z1 in wall_spans(s):
+            mins.append((ax, ay, z_offset + z0))
+            maxs.append((bx, by, z_offset + z1))
+    return np.array(mins, np.float32).reshape(-1, 3), np.array(maxs, np.float32).reshape(-1, 3)
+
+
+@dataclass
+class MeshInstances:
+    """Distinct shape meshes plus ``(shape index, translation)`` placements."""
+
+    shapes: List[MeshArrays] = field(default_factory=list)
+    placements: List[Tuple[int, Tuple[float, float, float]]] = field(default_factory=list)
+    _shape_index: Dict[tuple, int] = field(default_factory=dict, repr=False)
+
+    def add_walls(self, segments: Iterable[WallSegment], z_offset: float = 0.0) -> "MeshInstances":
+        """Group wall pieces by canonical shape (size and solid spans) and place each one.
+
+        Shapes are built at the origin, so their UVs are local to the piece
+        rather than world-space.
+        """
+        for s in segments:
+            extent = wall_extent(s)
+            if extent is None:
+                continue
+            ax, ay, bx, by = extent
+            spans = tuple((round(z0, 4), round(z1, 4)) for z0, z1 in wall_spans(s))
+            key = (round(bx - ax, 4), round(by - ay, 4), spans)
+            index = self._shape_index.get(key)
+            if index is None:
+                index = self._shape_index[key] = len(self.shapes)
+                size_x, size_y = key[0], key[1]
+                self.shapes.append(box_arrays(
+                    [(0.0, 0.0, z0) for z0, _ in spans],
+                    [(size_x, size_y, z1) for _, z1 in spans],
+                ))
+            self.placements.append((index, (ax, ay, z_offset)))
+        return self
+
+    def realize(self) -> MeshArrays:
+        """Flatten every placement into one mesh."""
+        return merge_arrays(self.shapes[i].translated(t) for i, t in self.placements)
+
+
+def wall_arrays(segments: Iterable[WallSegment], z_offset: float = 0.0) -> MeshArrays:
+    return box_arrays(*wall_boxes(segments, z_offset))
+
+
+def slab_boxes(slabs: Iterable[Slab]) -> Tuple[np.ndarray, np.ndarray]:
+    """Min/max corners of slab boxes; slabs with a hole become four boxes around it."""
+    mins: List[Tuple[float, float, float]] = []
+    maxs: List[Tuple[float, float, float]] = []
+    for s in slabs:
+        r = s.rect
+        z0, z1 = s.z, s.z + s.thickness
+        if s.hole_rect:
+            h = s.hole_rect
+            rects = [
+                (r.min_x, r.min_y, h.min_x, r.max_y),  # Left
+                (h.max_x, r.min_y, r.max_x, r.max_y),  # Right
+                (h.min_x, h.max_y, h.max_x, r.max_y),  # Top (middle part)
+                (h.min_x, r.min_y, h.max_x, h.min_y),  # Bottom (middle part)
+            ]
+        else:
+            rects = [(r.min_x, r.min_y, r.max_x, r.max_y)]
+        for x0, y0, x1, y1 in rects:
+            mins.append((x0, y0, z0))
+            maxs.append((x1, y1, z1))
+    return np.array(mins, np.float32).reshape(-1, 3), np.array(maxs, np.float32).reshape(-1, 3)
+
+
+def slab_arrays(slabs: Iterable[Slab]) -> MeshArrays:
+    return box_arrays(*slab_boxes(slabs))
+
+
+def roof_arrays(roof_geo: RoofGeometry) -> MeshArrays:
+    return polygon_arrays((face.vertices for face in roof_geo.faces), uv_axes=(0, 1))
+
+
+def _solid_arrays(
+    positions: np.ndarray, faces: Sequence[Tuple[Sequence[int], Sequence[float]]], welded: bool = False
+) -> MeshArrays:
+    """Fan-triangulate polygons over shared vertices into one closed solid.
+
+    Each face is ``(vertex indices, outward direction)``; triangles are wound
+    to face outward. With ``welded`` the shared vertices are kept and only
+    positions are returned, a watertight mesh for collision. Otherwise every
+    face gets its own corners with a flat normal, for rendering; UVs use the
+    (x, z) projection the per-box stair path used.
+    """
+    positions = np.asarray(positions, np.float32)
+    tris: List[Tuple[int, int, int]] = []
+    tri_faces: List[int] = []
+    for f, (poly, outward) in enumerate(faces):
+        for a, b in zip(poly[1:-1], poly[2:]):
+            p0, p1, p2 = positions[[poly[0], a, b]]
+            if np.dot(np.cross(p1 - p0, p2 - p0), outward) < 0:
+                a, b = b, a
+            tris.append((poly[0], a, b))
+            tri_faces.append(f)
+    indices = np.asarray(tris, np.uint32)
+    if welded:
+        empty = MeshArrays.empty()
+        return MeshArrays(positions, empty.normals, empty.uvs, indices.ravel())
+
+    corners = positions[indices]
+    face_normals = np.zeros((len(faces), 3), np.float64)
+    np.add.at(face_normals, tri_faces, np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0]))
+    face_normals /= np.maximum(np.linalg.norm(face_normals, axis=1, keepdims=True), 1e-12)
+
+    # One vertex per (face, corner) pair
+    keys = np.asarray(tri_faces, np.int64)[:, None] * len(positions) + indices
+    unique, inverse = np.unique(keys.ravel(), return_inverse=True)
+    flat_positions = positions[unique % len(positions)]
+    return MeshArrays(
+        flat_positions,
+        face_normals[unique // len(positions)].astype(np.float32),
+        (flat_positions[:, [0, 2]] / TEXTURE_TILE_SIZE).astype(np.float32),
+        inverse.astype(np.uint32),
+    )
+
+
+def _straight_flight(r: Rect, num_steps: int, welded: bool) -> MeshArrays:
+    """Solid sawtooth profile in the YZ plane, extruded across the stairwell width.
+
+    Per side: ``B_i`` along the floor, ``L_i``/``R_i`` at the front/back of
+    tread ``i``. Each side is split into columns ``B_i B_i+1 R_i L_i R_i-1``,
+    so no triangle spans more than one step.
+    """
+    n = num_steps
+    step_height = STORY_HEIGHT / n
+    y = r.min_y + np.arange(n + 1) * ((r.max_y - r.min_y) / n)
+    top = np.arange(1, n + 1) * step_height
+    profile = np.concatenate([
+        np.stack([y, np.zeros(n + 1)], axis=1),  # B_0..B_n
+        np.stack([y[:-1], top], axis=1),  # L_0..L_n-1
+        np.stack([y[1:], top], axis=1),  # R_0..R_n-1
+    ])
+    per_side = len(profile)
+    positions = np.concatenate([
+        np.column_stack([np.full(per_side, x), profile]) for x in (r.min_x, r.max_x)
+    ])
+
+    def B(i): return i
+    def L(i): return n + 1 + i
+    def R(i): return 2 * n + 1 + i
+
+    faces: List[Tuple[Sequence[int], Sequence[float]]] = []
+    for side, outward in ((0, (-1, 0, 0)), (per_side, (1, 0, 0))):
+        faces.append(([side + B(1), side + R(0), side + L(0), side + B(0)], outward))
+        for i in range(1, n):
+            faces.append(([side + v for v in (B(i + 1), R(i), L(i), R(i - 1), B(i))], outward))
+
+    def strip(a, b, outward):
+        faces.append(([a, b, b + per_side, a + per_side], outward))
+
+    strip(B(0), L(0), (0, -1, 0))
+    for i in range(n):
+        strip(L(i), R(i), (0, 0, 1))
+        strip(B(i), B(i + 1), (0, 0, -1))
+        if i:
+            strip(R(i - 1), L(i), (0, -1, 0))
+    strip(R(n - 1), B(n), (0, 1, 0))
+    return _solid_arrays(positions, faces, welded)
+
+
+def _prism_faces(corners: np.ndarray, base: int = 0) -> List[Tuple[Sequence[int], Sequence[float]]]:
+    """Faces of a convex prism, each pointing away from its centre.
+
+    ``corners`` holds one k-gon cap followed by the opposite cap in the same order.
+    """
+    k = len(corners) // 2
+    polys = [tuple(range(k)), tuple(range(k, 2 * k)), *((j, (j + 1) % k, (j + 1) % k + k, j + k) for j in range(k))]
+    center = corners.mean(axis=0)
+    return [([base + v for v in poly], corners[list(poly)].mean(axis=0) - center) for poly in polys]
+
+
+def _spiral_wedges(r: Rect, num_steps: int) -> List[np.ndarray]:
+    """Eight corners (bottom quad, then top quad) of each wedge step, clockwise seen from above."""
+    cx, cy = (r.min_x + r.max_x) / 2, (r.min_y + r.max_y) / 2
+    outer = min(r.max_x - r.min_x, r.max_y - r.min_y) / 2
+    inner = outer * SPIRAL_COLUMN_RATIO
+    step_height = STORY_HEIGHT / num_steps
+    angles = -np.arange(num_steps + 1) * (2 * np.pi / num_steps)
+
+    wedges = []
+    for i in range(num_steps):
+        wedges.append(np.array([
+            (cx + radius * np.cos(angle), cy + radius * np.sin(angle), z)
+            for z in (i * step_height, (i + 1) * step_height)
+            for radius, angle in ((inner, angles[i]), (outer, angles[i]), (outer, angles[i + 1]), (inner, angles[i + 1]))
+        ]))
+    return wedges
+
+
+def _spiral_flight(r: Rect, num_steps: int, welded: bool) -> MeshArrays:
+    """One full turn of wedge steps around a central column."""
+    wedges = _spiral_wedges(r, num_steps)
+    faces = [face for i, wedge in enumerate(wedges) for face in _prism_faces(wedge, 8 * i)]
+    return _solid_arrays(np.concatenate(wedges), faces, welded)
+
+
+@lru_cache(maxsize=32)
+def stair_flight_arrays(
+    rect: Rect, stair_type: str = "straight", num_steps: int = STAIR_STEPS, welded: bool = False
+) -> MeshArrays:
+    """One flight from floor level up one storey, built once per stairwell shape.
+
+    Flat-shaded for rendering, or with ``welded`` a watertight positions-only
+    solid for collision. The result is cached and its buffers are read-only;
+    use :meth:`MeshArrays.translated` to place copies.
+    """
+    if stair_type == "straight":
+        flight = _straight_flight(rect, num_steps, welded)
+    elif stair_type == "spiral":
+        flight = _spiral_flight(rect, num_steps, welded)
+    else:
+        raise GeometryError(f"Unknown stair type: {stair_type!r}")
+    for array in (flight.positions, flight.normals, flight.uvs, flight.indices):
+        array.flags.writeable = False
+    return flight
+
+
+def stair_arrays(stairwell: Stairwell, total_floors: int, num_steps: int = STAIR_STEPS, welded: bool = False) -> MeshArrays:
+    """The cached flight stamped once per pair of consecutive floors."""
+    flight = stair_flight_arrays(stairwell.rect, stairwell.stair_type, num_steps, welded)
+    return merge_arrays(
+        flight.translated((0.0, 0.0, f * STORY_HEIGHT)) for f in range(total_floors - 1)
+    )
+
+
+@lru_cache(maxsize=32)
+def stair_hulls(rect: Rect, stair_type: str = "straight", num_steps: int = STAIR_STEPS) -> Tuple[MeshArrays, ...]:
+    """Convex pieces covering one flight, positions only, e.g. for convex colliders.
+
+    A straight flight is a single ramp whose slope runs through the step
+    noses, so no step pokes through it; a spiral flight is one wedge per step.
+    """
+    if stair_type == "straight":
+        # Floor at both ends, the top tread, then the nose line down to the first step
+        step_depth = (rect.max_y - rect.min_y) / num_steps
+        profile = [
+            (rect.min_y, 0.0), (rect.max_y, 0.0), (rect.max_y, STORY_HEIGHT),
+            (rect.max_y - step_depth, STORY_HEIGHT), (rect.min_y, STORY_HEIGHT / num_steps),
+        ]
+        pieces = [np.array([(x, y, z) for x in (rect.min_x, rect.max_x) for y, z in profile])]
+    elif stair_type == "spiral":
+        pieces = _spiral_wedges(rect, num_steps)
+    else:
+        raise GeometryError(f"Unknown stair type: {stair_type!r}")
+    return tuple(_solid_arrays(corners, _prism_faces(corners), welded=True) for corners in pieces)
@@ -0,0 +1,208 @@
+"""Navigation mesh generated from the abstract building model.
+
+Walkable areas are the room and corridor rects of each floor shrunk by half
+a wall thickness, so the wall footprints are left out, with the stairwell
+hole cut away. Each door becomes a small connector polygon across its wall,
+and each stair flight becomes a ramp polygon that starts at the floor
+below. Polygons share vertices wherever they meet, with extra collinear
+vertices inserted at T-junctions, so engines can link them without baking.
+
+The flight arrives inside the upper floor's stairwell hole, so the top of
+each ramp is joined to the upper corridor by an off-mesh link.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .config import EPSILON, STORY_HEIGHT, WALL_THICKNESS
+from .datamodel import Rect
+from .mesh_arrays import MeshArrays
+from .planning import BuildingPlan, FloorPlan
+from .slabs import build_navmesh_slabs
+
+Point = Tuple[float, float, float]
+
+
+@dataclass
+class NavMesh:
+    """Convex polygons over shared vertices, plus off-mesh links between floors.
+
+    Polygons are wound counter-clockwise seen from above (+Z).
+    """
+
+    vertices: np.ndarray  # (V, 3) float32
+    polygons: List[List[int]]
+    links: List[Tuple[Point, Point]] = field(default_factory=list)
+
+    @property
+    def triangle_count(self) -> int:
+        return sum(len(p) - 2 for p in self.polygons)
+
+    def to_arrays(self) -> MeshArrays:
+        """Fan-triangulated mesh, positions only, e.g. for a Godot ``-navmesh`` node."""
+        tris = [(p[0], a, b) for p in self.polygons for a, b in zip(p[1:-1], p[2:])]
+        empty = MeshArrays.empty()
+        return MeshArrays(self.vertices, empty.normals, empty.uvs, np.asarray(tris, np.uint32).reshape(-1))
+
+    def to_dict(self, y_up: bool = True) -> Dict[str, object]:
+        """Godot-style vertices/polygons lists; ``y_up`` maps ``(x, y, z) -> (x, z, -y)``.
+
+        Y-up polygons are wound clockwise seen from above, like Godot's baked navmeshes.
+        """
+        def point(p) -> List[float]:
+            x, y, z = (round(float(v), 5) for v in p)
+            return [x, z, -y] if y_up else [x, y, z]
+
+        return {
+            "up": "Y" if y_up else "Z",
+            "vertices": [point(v) for v in self.vertices],
+            "polygons": [p[::-1] for p in self.polygons] if y_up else self.polygons,
+            "links": [{"start": point(a), "end": point(b), "bidirectional": True} for a, b in self.links],
+        }
+
+    def write_json(self, path: Path, y_up: bool = True) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(y_up), separators=(",", ":")), encoding="utf-8")
+        return path
+
+
+def _shrink(rect: Rect, amount: float) -> Optional[Rect]:
+    r = Rect(rect.min_x + amount, rect.min_y + amount, rect.max_x - amount, rect.max_y - amount)
+    return r if r.width() > EPSILON and r.height() > EPSILON else None
+
+
+def _subtract(rect: Rect, hole: Optional[Rect]) -> List[Rect]:
+    """``rect`` minus ``hole`` as up to four rects (full-width strips below and above, then sides)."""
+    if hole is None or hole.min_x >= rect.max_x or hole.max_x <= rect.min_x or hole.min_y >= rect.max_y or hole.max_y <= rect.min_y:
+        return [rect]
+    lo_y, hi_y = max(rect.min_y, hole.min_y), min(rect.max_y, hole.max_y)
+    pieces = [
+        Rect(rect.min_x, rect.min_y, rect.max_x, lo_y),
+        Rect(rect.min_x, hi_y, rect.max_x, rect.max_y),
+        Rect(rect.min_x, lo_y, max(rect.min_x, hole.min_x), hi_y),
+        Rect(min(rect.max_x, hole.max_x), lo_y, rect.max_x, hi_y),
+    ]
+    return [p for p in pieces if p.width() > EPSILON and p.height() > EPSILON]
+
+
+def _flat(rect: Rect, z: float) -> List[Point]:
+    return [(rect.min_x, rect.min_y, z), (rect.max_x, rect.min_y, z), (rect.max_x, rect.max_y, z), (rect.min_x, rect.max_y, z)]
+
+
+def _area_polygons(area: Rect, walk_z: float, hole: Optional[Rect]) -> List[List[Point]]:
+    inner = _shrink(area, WALL_THICKNESS / 2)
+    return [] if inner is None else [_flat(r, walk_z) for r in _subtract(inner, hole)]
+
+
+def _door_polygons(floor: FloorPlan, walk_z: float, hole: Optional[Rect]) -> List[List[Point]]:
+    """Connectors across door walls, clipped by the stairwell hole."""
+    half = WALL_THICKNESS / 2
+    polygons: List[List[Point]] = []
+    for door in floor.doors:
+        cx, cy = door.center
+        w = door.width / 2
+        if door.side in ("north", "south"):
+            connector = Rect(cx - w, cy - half, cx + w, cy + half)
+        else:
+            connector = Rect(cx - half, cy - w, cx + half, cy + w)
+        polygons.extend(_flat(r, walk_z) for r in _subtract(connector, hole))
+    return polygons
+
+
+def _ramp(floor: FloorPlan, stair: Rect, walk_z: float) -> Optional[List[Point]]:
+    """Ramp over the flight, as wide as the stairwell's overlap with this floor's corridor."""
+    half = WALL_THICKNESS / 2
+    corridor = floor.corridor.rect if floor.corridor else stair
+    x0, x1 = max(stair.min_x, corridor.min_x) + half, min(stair.max_x, corridor.max_x) - half
+    if x1 - x0 <= EPSILON:
+        return None
+    top = walk_z + STORY_HEIGHT
+    return [(x0, stair.min_y, walk_z), (x1, stair.min_y, walk_z), (x1, stair.max_y, top), (x0, stair.max_y, top)]
+
+
+def _nearest_point(polygons: Sequence[List[Point]], target: Point) -> Optional[Point]:
+    best, best_d = None, float("inf")
+    for poly in polygons:
+        xs, ys = [p[0] for p in poly], [p[1] for p in poly]
+        x = min(max(target[0], min(xs)), max(xs))
+        y = min(max(target[1], min(ys)), max(ys))
+        d = (x - target[0]) ** 2 + (y - target[1]) ** 2
+        if d < best_d:
+            best, best_d = (x, y, poly[0][2]), d
+    return best
+
+
+def _weld(polygons: List[List[Point]]) -> Tuple[np.ndarray, List[List[int]]]:
+    """Share coincident vertices and split edges at vertices lying on them (T-junctions).
+
+    Level edges along x or y only look at vertices with the same z and the
+    same fixed coordinate, so the split stays linear in the vertex count;
+    only sloped ramp edges are tested against every vertex.
+    """
+    index: Dict[Tuple[float, ...], int] = {}
+    loops = [[index.setdefault(tuple(round(c, 5) for c in p), len(index)) for p in poly] for poly in polygons]
+    keys = list(index)
+    vertices = np.array(keys, np.float64).reshape(-1, 3)
+
+    # (axis held fixed, z, its value) -> [(coordinate along the edge, vertex)]
+    lines: Dict[Tuple[int, float, float], List[Tuple[float, int]]] = {}
+    for i, (x, y, z) in enumerate(keys):
+        lines.setdefault((0, z, x), []).append((y, i))
+        lines.setdefault((1, z, y), []).append((x, i))
+
+    def split(a: int, b: int) -> List[int]:
+        pa, pb = keys[a], keys[b]
+        for fixed in (0, 1):
+            if pa[2] == pb[2] and pa[fixed] == pb[fixed]:
+                along = 1 - fixed
+                lo, hi = sorted((pa[along], pb[along]))
+                inner = sorted(
+                    (c, i) for c, i in lines[(fixed, pa[2], pa[fixed])] if lo + EPSILON < c < hi - EPSILON
+                )
+                return [i for _, i in (inner if pa[along] < pb[along] else inner[::-1])]
+        edge = vertices[b] - vertices[a]
+        t = (vertices - vertices[a]) @ edge / float(edge @ edge)
+        off = vertices - (vertices[a] + t[:, None] * edge)
+        on_edge = np.flatnonzero((t > EPSILON) & (t < 1 - EPSILON) & (np.einsum("ij,ij->i", off, off) < EPSILON ** 2))
+        return [int(i) for i in on_edge[np.argsort(t[on_edge])]]
+
+    welded = [[v for a, b in zip(loop, loop[1:] + loop[:1]) for v in (a, *split(a, b))] for loop in loops]
+    return vertices.astype(np.float32), welded
+
+
+def build_navmesh(plan: BuildingPlan) -> NavMesh:
+    """Walkable polygons for every floor, joined through doors and stair ramps."""
+    stair = plan.stairwell.rect if plan.stairwell and plan.spec.floors > 1 else None
+    polygons: List[List[Point]] = []
+    landings: List[List[List[Point]]] = []  # Corridor polygons first, then rooms
+    ramps: List[Optional[List[Point]]] = []
+    for floor in plan.floors:
+        slabs = build_navmesh_slabs(floor.slabs)
+        walk_z = slabs[0].z + slabs[0].thickness if slabs else floor.z_offset
+        hole = slabs[0].hole_rect if slabs else stair
+        corridor = _area_polygons(floor.corridor.rect, walk_z, hole) if floor.corridor else []
+        rooms = [poly for room in floor.rooms for poly in _area_polygons(room.rect, walk_z, hole)]
+        landings.append(corridor or rooms)
+        polygons += rooms + corridor + _door_polygons(floor, walk_z, hole)
+        ramp = _ramp(floor, stair, walk_z) if stair and floor.floor_index < len(plan.floors) - 1 else None
+        ramps.append(ramp)
+        if ramp:
+            polygons.append(ramp)
+
+    links: List[Tuple[Point, Point]] = []
+    for floor_idx, ramp in enumerate(ramps):
+        if not ramp:
+            continue
+        top = ((ramp[2][0] + ramp[3][0]) / 2, ramp[2][1], ramp[2][2])
+        landing = _nearest_point(landings[floor_idx + 1], top)
+        if landing is not None:
+            links.append((top, landing))
+
+    vertices, loops = _weld(polygons)
+    return NavMesh(vertices, loops, links)
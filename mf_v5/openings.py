@@ -0,0 +1,111 @@
+"""Single-pass carving of doors, windows and other openings into wall segments."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import DefaultDict, Dict, Iterable, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from .config import EPSILON
+from .datamodel import SIDE_CODES, Opening, WallSegment, WallSegmentTable
+from .exceptions import GeometryError
+
+
+def _along(opening: Opening, horizontal: bool) -> float:
+    return opening.center[0] if horizontal else opening.center[1]
+
+
+def _piece(seg: WallSegment, horizontal: bool, start: float, end: float, opening=None) -> WallSegment:
+    if horizontal:
+        return WallSegment(seg.room_id, seg.side, start, seg.y1, end, seg.y2, seg.height, seg.thickness, opening)
+    return WallSegment(seg.room_id, seg.side, seg.x1, start, seg.x2, end, seg.height, seg.thickness, opening)
+
+
+def carve_segment(seg: WallSegment, openings: Sequence[Opening]) -> List[WallSegment]:
+    """Split one wall into solid and opening pieces in a single sweep.
+
+    Openings whose center lies strictly inside the wall are sorted by their
+    start and visited once. Pieces come out in ascending order; an opening
+    piece is only emitted when the opening leaves wall material standing
+    (see ``solid_spans``) and carries that opening in :attr:`WallSegment.opening`.
+
+    Identical openings are cut once (both faces of a fused wall carry the
+    same window). Distinct openings that overlap raise :class:`GeometryError`
+    rather than one silently swallowing the other.
+    """
+    horizontal = seg.side in ("north", "south")
+    lo, hi = sorted((seg.x1, seg.x2)) if horizontal else sorted((seg.y1, seg.y2))
+
+    inside = list(dict.fromkeys(o for o in openings if lo + EPSILON < _along(o, horizontal) < hi - EPSILON))
+    if not inside:
+        return [seg]
+    inside.sort(key=lambda o: _along(o, horizontal) - o.width / 2)
+
+    pieces: List[WallSegment] = []
+    cursor = lo
+    for previous, opening in zip([None, *inside], inside):
+        center = _along(opening, horizontal)
+        if previous is not None and center - opening.width / 2 < cursor - EPSILON:
+            raise GeometryError(f"Overlapping openings in wall of room {seg.room_id} ({seg.side}): {previous} and {opening}")
+        start = max(center - opening.width / 2, cursor)
+        end = min(center + opening.width / 2, hi)
+        if start - cursor > EPSILON:
+            pieces.append(_piece(seg, horizontal, cursor, start))
+        if end - start > EPSILON and opening.solid_spans(seg.height):
+            pieces.append(_piece(seg, horizontal, start, end, opening))
+        cursor = max(cursor, end)
+    if hi - cursor > EPSILON:
+        pieces.append(_piece(seg, horizontal, cursor, hi))
+    return pieces
+
+
+def carve_openings(
+    wall_segments: Union[Dict[int, List[WallSegment]], WallSegmentTable],
+    openings: Iterable[Opening],
+) -> Union[Dict[int, List[WallSegment]], WallSegmentTable]:
+    """Carve any mix of opening types into per-room wall segments.
+
+    Accepts either the per-room dict or a :class:`WallSegmentTable` and
+    returns the same kind.
+    """
+    openings_by_room_side: DefaultDict[Tuple[int, str], List[Opening]] = defaultdict(list)
+    for o in openings:
+        openings_by_room_side[(o.room_id, o.side)].append(o)
+
+    if isinstance(wall_segments, WallSegmentTable):
+        return _carve_table(wall_segments, openings_by_room_side)
+
+    carved: Dict[int, List[WallSegment]] = {}
+    for room_id, segments in wall_segments.items():
+        out: List[WallSegment] = []
+        for seg in segments:
+            room_openings = openings_by_room_side.get((room_id, seg.side))
+            if room_openings:
+                out.extend(carve_segment(seg, room_openings))
+            else:
+                out.append(seg)
+        carved[room_id] = out
+    return carved
+
+
+def _carve_table(table: WallSegmentTable, openings_by_room_side: Dict[Tuple[int, str], List[Opening]]) -> WallSegmentTable:
+    """Carve only the rows that have openings, keeping the original row order."""
+    keys = table.room_id.astype(np.int64) * len(SIDE_CODES) + table.side
+    wanted = np.array([room_id * len(SIDE_CODES) + SIDE_CODES[side] for room_id, side in openings_by_room_side], np.int64)
+    hit = np.isin(keys, wanted)
+    if not hit.any():
+        return table
+
+    pieces: List[WallSegment] = []
+    parents: List[int] = []
+    for i in np.flatnonzero(hit):
+        seg = table.row(int(i))
+        for piece in carve_segment(seg, openings_by_room_side[(seg.room_id, seg.side)]):
+            pieces.append(piece)
+            parents.append(int(i))
+
+    kept = np.flatnonzero(~hit)
+    merged = WallSegmentTable.concat([table[kept], WallSegmentTable.from_segments(pieces)])
+    order = np.argsort(np.concatenate([kept, np.array(parents, np.int64)]), kind="stable")
+    return merged[order]
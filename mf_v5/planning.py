@@ -0,0 +1,158 @@
+"""Pure-Python planning stages shared by single and batch generation.
+
+Everything here runs without ``bpy`` and returns picklable descriptors, so the
+planning half of a build can be fanned out to worker processes.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+from .adjacency import build_adjacency, corridor_facing_walls
+from .cache import fingerprint
+from .cleanup import dedupe_segments, fuse_shared_walls, remove_zero_length_segments
+from .config import STORY_HEIGHT, logger
+from .datamodel import AdjacencyMap, BuildingSpec, Corridor, DoorOpening, Rect, Room, WallSegmentTable
+from .doors import corridor_door_openings
+from .exceptions import ConfigurationError
+from .floorplan import cached_floorplan
+from .incremental import BuildSession, null_session
+from .openings import carve_openings
+from .roof import RoofGeometry, build_roof
+from .slabs import Slab, build_floor_ceiling_slabs
+from .stairs import STAIR_TYPES, Stairwell, generate_stairwell
+from .walls import build_room_wall_table
+from .windows import WindowOpening, generate_window_placements
+
+
+@dataclass
+class FloorPlan:
+    floor_index: int
+    rooms: List[Room]
+    corridor: Corridor
+    adjacency: AdjacencyMap
+    walls: WallSegmentTable  # Columnar; iterating it yields WallSegment rows
+    doors: List[DoorOpening]
+    windows: List[WindowOpening]
+    slabs: List[Slab]
+    digest: str = ""  # Digest of everything the floor's geometry depends on
+
+    @property
+    def z_offset(self) -> float:
+        return self.floor_index * STORY_HEIGHT
+
+
+@dataclass
+class BuildingPlan:
+    spec: BuildingSpec
+    floors: List[FloorPlan]
+    stairwell: Optional[Stairwell]
+    roof: Optional[RoofGeometry]
+
+
+def validate_spec(spec: BuildingSpec) -> None:
+    if spec.width < 5 or spec.depth < 5:
+        raise ConfigurationError(f"Building dimensions too small: {spec.width}x{spec.depth}")
+    if spec.stair_type not in STAIR_TYPES:
+        raise ConfigurationError(f"Unknown stair type {spec.stair_type!r}; expected one of {STAIR_TYPES}")
+
+
+def _floor_openings(rooms: List[Room], corridor: Corridor):
+    corridor_faces = corridor_facing_walls(rooms, corridor)
+    room_rect_lookup = {
+        r.id: (r.rect.min_x, r.rect.min_y, r.rect.max_x, r.rect.max_y) for r in rooms
+    }
+    return corridor_door_openings(corridor_faces, room_rect_lookup), generate_window_placements(rooms)
+
+
+def _carve_floor(wall_table, door_openings, window_openings, adjacency=None) -> WallSegmentTable:
+    # Build shared walls once, then carve all openings into them in one pass per wall
+    fused, openings = fuse_shared_walls(wall_table, [*door_openings, *window_openings], adjacency)
+    return dedupe_segments(remove_zero_length_segments(carve_openings(fused, openings)))
+
+
+def plan_floor(
+    spec: BuildingSpec,
+    floor_idx: int,
+    stairwell: Optional[Stairwell],
+    session: Optional[BuildSession] = None,
+) -> FloorPlan:
+    """Run floorplan, adjacency, openings, carving and slab stages for one floor.
+
+    With a :class:`BuildSession`, each stage is reused when its inputs are
+    unchanged since the session's previous build.
+    """
+    session = session or null_session()
+    key = (spec.width, spec.depth, spec.seed, floor_idx)
+
+    rooms, corridor = session.run("floorplan", floor_idx, key, lambda: cached_floorplan(*key))
+    layout = session.digest("floorplan", floor_idx)
+
+    adjacency, wall_table = session.run(
+        "walls", floor_idx, layout, lambda: (build_adjacency(rooms), build_room_wall_table(rooms))
+    )
+    # Openings (Doors and Windows)
+    door_openings, window_openings = session.run("openings", floor_idx, layout, lambda: _floor_openings(rooms, corridor))
+    merged_walls = session.run(
+        "carving",
+        floor_idx,
+        (session.digest("walls", floor_idx), session.digest("openings", floor_idx)),
+        lambda: _carve_floor(wall_table, door_openings, window_openings, adjacency),
+    )
+
+    # Slabs with stairwell hole
+    stair_rect = stairwell.rect if stairwell else None
+    slabs = session.run(
+        "slabs", floor_idx, (layout, stair_rect), lambda: build_floor_ceiling_slabs(rooms, floor_idx, stair_rect)
+    )
+
+    return FloorPlan(
+        floor_index=floor_idx,
+        rooms=rooms,
+        corridor=corridor,
+        adjacency=adjacency,
+        walls=merged_walls,
+        doors=door_openings,
+        windows=window_openings,
+        slabs=slabs,
+        digest=fingerprint(session.digest("carving", floor_idx), session.digest("slabs", floor_idx)),
+    )
+
+
+def plan_building(spec: BuildingSpec, session: Optional[BuildSession] = None) -> BuildingPlan:
+    """Produce the complete abstract building model for ``spec``."""
+    validate_spec(spec)
+    session = session or null_session()
+
+    stairwell = None
+    # First floor generation determines stairwell placement
+    if spec.floors > 1:
+        first_rooms, first_corridor = cached_floorplan(spec.width, spec.depth, spec.seed, 0)
+        stairwell = generate_stairwell(first_rooms, first_corridor.rect, spec.stair_type)
+        logger.info(f"Stairwell placed at {stairwell.rect}")
+
+    floors: List[FloorPlan] = []
+    top_footprint = None
+    top_z = 0.0
+    for floor_idx in range(spec.floors):
+        logger.debug(f"Processing Floor {floor_idx}...")
+        floor = plan_floor(spec, floor_idx, stairwell, session)
+        floors.append(floor)
+
+        if floor.rooms:
+            top_footprint = (
+                min(r.rect.min_x for r in floor.rooms),
+                min(r.rect.min_y for r in floor.rooms),
+                max(r.rect.max_x for r in floor.rooms),
+                max(r.rect.max_y for r in floor.rooms),
+            )
+            top_z = (floor_idx + 1) * STORY_HEIGHT
+
+    roof = None
+    if top_footprint:
+        roof = session.run(
+            "roof", None, (top_footprint, top_z, spec.roof_type),
+            lambda: build_roof(Rect(*top_footprint), top_z, spec.roof_type),
+        )
+    return BuildingPlan(spec=spec, floors=floors, stairwell=stairwell, roof=roof)
@@ -6,21 +6,20 @@ from dataclasses import dataclass
 from typing import List, Optional
 try:
     import bpy
-    import bmesh
 except ImportError:
     bpy = None
-    bmesh = None
 from .datamodel import Rect, Room
-from .config import STORY_HEIGHT, TEXTURE_TILE_SIZE
+
+STAIR_TYPES = ("straight", "spiral")
 
 @dataclass(frozen=True)
 class Stairwell:
     rect: Rect          # Position of the stairwell hole
     floor_from: int
     floor_to: int
-    stair_type: str = "straight" # "straight", "spiral" (planned)
+    stair_type: str = "straight" # "straight", "spiral"
 
-def generate_stairwell(rooms: List[Room], corridor_rect: Rect) -> Optional[Stairwell]:
+def generate_stairwell(rooms: List[Room], corridor_rect: Rect, stair_type: str = "straight") -> Optional[Stairwell]:
     """
     Place a stairwell at the end of the corridor.
     Ensures vertical alignment across all floors.
@@ -43,61 +42,15 @@ def generate_stairwell(rooms: List[Room], corridor_rect: Rect) -> Optional[Stair
         max_y = corridor_rect.max_y
     )
     
-    return Stairwell(stair_rect, 0, 99) # Spans all floors
+    return Stairwell(stair_rect, 0, 99, stair_type) # Spans all floors
 
 def build_stair_mesh(stairwell: Stairwell, total_floors: int, name: str = "Stairs", material: Optional[bpy.types.Material] = None) -> bpy.types.Object:
-    """Create a mesh for the stairs connecting all floors."""
-    mesh = bpy.data.meshes.new(name)
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.scene.collection.objects.link(obj)
-    
-    if material:
-        obj.data.materials.append(material)
-        
-    bm = bmesh.new()
-    uv_layer = bm.loops.layers.uv.new("UVMap")
-    
-    r = stairwell.rect
-    num_steps = 16 # Steps per floor
-    step_height = STORY_HEIGHT / num_steps
-    step_depth = (r.max_y - r.min_y) / num_steps
-    
-    for f_idx in range(total_floors - 1):
-        base_z = f_idx * STORY_HEIGHT
-        
-        for i in range(num_steps):
-            z_start = base_z + i * step_height
-            y_start = r.min_y + i * step_depth
-            
-            # Create a box for each step
-            v = []
-            # Bottom 4
-            v.append(bm.verts.new((r.min_x, y_start, z_start)))
-            v.append(bm.verts.new((r.max_x, y_start, z_start)))
-            v.append(bm.verts.new((r.max_x, y_start + step_depth, z_start)))
-            v.append(bm.verts.new((r.min_x, y_start + step_depth, z_start)))
-            # Top 4
-            v.append(bm.verts.new((r.min_x, y_start, z_start + step_height)))
-            v.append(bm.verts.new((r.max_x, y_start, z_start + step_height)))
-            v.append(bm.verts.new((r.max_x, y_start + step_depth, z_start + step_height)))
-            v.append(bm.verts.new((r.min_x, y_start + step_depth, z_start + step_height)))
-            
-            try:
-                faces = [
-                    bm.faces.new(v[0:4]), bm.faces.new(v[4:8]),
-                    bm.faces.new((v[0], v[1], v[5], v[4])),
-                    bm.faces.new((v[1], v[2], v[6], v[5])),
-                    bm.faces.new((v[2], v[3], v[7], v[6])),
-                    bm.faces.new((v[3], v[0], v[4], v[7]))
-                ]
-                # UVs
-                for face in faces:
-                    for loop in face.loops:
-                        co = loop.vert.co
-                        loop[uv_layer].uv = (co.x / TEXTURE_TILE_SIZE, co.z / TEXTURE_TILE_SIZE)
-            except ValueError:
-                pass
-                
-    bm.to_mesh(mesh)
-    bm.free()
-    return obj
+    """Create a mesh for the stairs connecting all floors.
+
+    The flight is built once per stairwell shape and stamped per floor.
+    """
+    # Imported here: mesh_arrays depends on this module for Stairwell
+    from .blender_mesh import create_mesh_object
+    from .mesh_arrays import stair_arrays
+
+    return create_mesh_object(stair_arrays(stairwell, total_floors), name, material)
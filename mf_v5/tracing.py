@@ -0,0 +1,112 @@
+"""Span timings for build stages, exportable as a Chrome trace.
+
+A :class:`Tracer` records one :class:`Span` per stage run (every
+:meth:`mf_v5.incremental.BuildSession.run` call, plus the Blender and export
+steps). Stage timings are attached to :class:`mf_v5.engine.GenerationOutput`
+and :class:`mf_v5.engine.FloorOutput`. The spans can be written as Chrome
+trace-event JSON for ``chrome://tracing`` or Perfetto.
+
+The default tracer is disabled; its :meth:`Tracer.span` returns a shared
+no-op context manager, so instrumented code pays only a method call.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Dict, Hashable, Iterator, List, Optional
+
+_NULL_SPAN = nullcontext()
+
+
+@dataclass(frozen=True)
+class Span:
+    name: str
+    scope: Hashable
+    start_ns: int  # time.perf_counter_ns(); system-wide monotonic, so comparable across worker processes
+    duration_ns: int
+    process: int
+    thread: int
+    tags: Dict[str, Any] = field(default_factory=dict)
+
+    def chrome_event(self) -> Dict[str, object]:
+        args = dict(self.tags)
+        if self.scope is not None:
+            args["scope"] = self.scope if isinstance(self.scope, (int, float)) else str(self.scope)
+        return {
+            "name": self.name if self.scope is None else f"{self.name}:{self.scope}",
+            "cat": "mf",
+            "ph": "X",
+            "ts": self.start_ns / 1000,
+            "dur": self.duration_ns / 1000,
+            "pid": self.process,
+            "tid": self.thread,
+            "args": args,
+        }
+
+
+class Tracer:
+    """Collects spans; ``tags`` are attached to every span it records."""
+
+    def __init__(self, enabled: bool = True, tags: Optional[Dict[str, Any]] = None, parent: Optional[Tracer] = None):
+        self.enabled = enabled
+        self.tags = dict(tags or {})
+        self.spans: List[Span] = []
+        self._parent = parent
+
+    def child(self, **tags: Any) -> Tracer:
+        """Tracer for one build whose spans are also recorded in this one."""
+        if not self.enabled:
+            return self
+        return Tracer(True, {**self.tags, **tags}, self)
+
+    def span(self, name: str, scope: Hashable = None) -> ContextManager[None]:
+        """Time the enclosed block as ``name`` (``scope`` is usually a floor index)."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return self._timed(name, scope)
+
+    @contextmanager
+    def _timed(self, name: str, scope: Hashable) -> Iterator[None]:
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter_ns() - start
+            self.add([Span(name, scope, start, duration, os.getpid(), threading.get_ident(), self.tags)])
+
+    def add(self, spans: List[Span]) -> None:
+        """Record finished spans here and in every parent tracer."""
+        tracer: Optional[Tracer] = self
+        while tracer is not None:
+            tracer.spans.extend(spans)
+            tracer = tracer._parent
+
+    def timings(self, where: Optional[Callable[[Span], bool]] = None) -> Dict[str, float]:
+        """Seconds spent per span name, summed over scopes; ``where`` filters the spans."""
+        totals: Dict[str, float] = {}
+        for span in self.spans:
+            if where is None or where(span):
+                totals[span.name] = totals.get(span.name, 0.0) + span.duration_ns / 1e9
+        return totals
+
+    def chrome_trace(self) -> Dict[str, object]:
+        return {"traceEvents": [span.chrome_event() for span in self.spans], "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Path) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.chrome_trace()), encoding="utf-8")
+        return path
+
+
+_NULL_TRACER = Tracer(enabled=False)
+
+
+def null_tracer() -> Tracer:
+    """The shared disabled tracer."""
+    return _NULL_TRACER
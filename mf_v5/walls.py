@@ -4,8 +4,10 @@ from __future__ import annotations
 
 from typing import Dict, Iterable, List, Sequence
 
+import numpy as np
+
 from .config import WALL_HEIGHT, WALL_THICKNESS
-from .datamodel import Room, WallSegment
+from .datamodel import SIDE_CODES, Room, WallSegment, WallSegmentTable
 
 
 def build_room_wall_segments(rooms: Iterable[Room]) -> Dict[int, List[WallSegment]]:
@@ -19,3 +21,23 @@ def build_room_wall_segments(rooms: Iterable[Room]) -> Dict[int, List[WallSegmen
             WallSegment(room.id, "east", r.max_x, r.min_y, r.max_x, r.max_y, WALL_HEIGHT, WALL_THICKNESS),
         ]
     return result
+
+
+def build_room_wall_table(rooms: Iterable[Room]) -> WallSegmentTable:
+    """Columnar equivalent of :func:`build_room_wall_segments` (same row order)."""
+    rooms = list(rooms)
+    ids = np.array([r.id for r in rooms], np.int32)
+    rect = np.array([(r.rect.min_x, r.rect.min_y, r.rect.max_x, r.rect.max_y) for r in rooms], np.float64).reshape(-1, 4)
+    min_x, min_y, max_x, max_y = rect.T
+
+    # One row per (room, side) in south, north, west, east order
+    x1 = np.stack([min_x, min_x, min_x, max_x], axis=1).ravel()
+    y1 = np.stack([min_y, max_y, min_y, min_y], axis=1).ravel()
+    x2 = np.stack([max_x, max_x, min_x, max_x], axis=1).ravel()
+    y2 = np.stack([min_y, max_y, max_y, max_y], axis=1).ravel()
+    sides = np.tile([SIDE_CODES[s] for s in ("south", "north", "west", "east")], len(rooms))
+    count = 4 * len(rooms)
+    return WallSegmentTable(
+        np.repeat(ids, 4), sides, x1, y1, x2, y2,
+        np.full(count, WALL_HEIGHT), np.full(count, WALL_THICKNESS),
+    )
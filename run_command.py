@@ -5,6 +5,11 @@ import time
 import bpy
 import traceback
 
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
 # Add project root to path for imports
 project_root = os.path.dirname(os.path.abspath(__file__))
 if project_root not in sys.path:
@@ -13,7 +18,141 @@ if project_root not in sys.path:
 # Use absolute imports
 from atoms.wall import create_engineered_wall
 from engine.inventory_manager import InventoryManager
-from config import LIBRARY_DIR, REGISTRY_DIR, INVENTORY_FILE
+from config import LIBRARY_DIR, REGISTRY_DIR, INVENTORY_FILE, BATCH_REGISTER_CHUNK
+
+# Prefix marking protocol lines in worker mode; Blender writes its own logs to stdout too
+RESULT_PREFIX = "@@MF_RESULT "
+
+
+def execute_command(command_data, factory_reset=True, pending_assets=None):
+    """Run one command dict and return its result dict.
+
+    ``factory_reset=False`` clears the scene in place instead of reloading
+    factory settings, which is what warm workers use between jobs. When
+    ``pending_assets`` is a list, inventory entries are appended to it for the
+    caller to register in bulk instead of being written immediately.
+    """
+    try:
+        cmd = command_data.get("command")
+        seed = command_data.get("seed", 0)
+
+        if cmd == "create_wall":
+            wall_data = command_data.get("asset", {})
+            name = wall_data.get("name", "GenWall")
+            length = wall_data.get("dimensions", {}).get("width", 4.0)
+
+            # Create engineered mesh with slots
+            obj, slots = create_engineered_wall(name, length, seed, factory_reset=factory_reset)
+
+            # Register in inventory with slots
+            asset_info = {
+                "name": name,
+                "tags": wall_data.get("tags", ["arch_wall"]),
+                "dimensions": {"width": length, "height": 3.0, "depth": 0.2},
+                "slots": slots,
+                "blend_file": os.path.join(LIBRARY_DIR, f"{name}.blend"),
+                "seed": seed
+            }
+            if pending_assets is None:
+                InventoryManager.register_asset(asset_info)
+            else:
+                pending_assets.append(asset_info)
+
+            # Save
+            os.makedirs(LIBRARY_DIR, exist_ok=True)
+            lib_path = os.path.join(LIBRARY_DIR, f"{name}.blend")
+            bpy.ops.wm.save_as_mainfile(filepath=lib_path)
+
+            return {
+                "status": "success",
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "result": {"asset_name": name, "slots_count": len(slots), "blend_file": lib_path}
+            }
+        return {"status": "error", "message": f"Unknown command: {cmd}"}
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": str(e),
+            "traceback": traceback.format_exc()
+        }
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return 0.0
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _emit(payload):
+    sys.stdout.write(RESULT_PREFIX + json.dumps(payload) + "\n")
+    sys.stdout.flush()
+
+
+def serve(stream=None):
+    """Warm worker loop: one JSON command per stdin line, one prefixed result line each.
+
+    The optional ``id`` of a command is echoed back. ``{"command": "shutdown"}``
+    ends the loop; so does closing stdin.
+    """
+    stream = stream or sys.stdin
+    _emit({"status": "ready", "pid": os.getpid()})
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            command_data = json.loads(line)
+        except json.JSONDecodeError as e:
+            _emit({"status": "error", "message": f"Invalid JSON command: {e}"})
+            continue
+
+        if command_data.get("command") == "shutdown":
+            break
+        if command_data.get("command") == "ping":
+            result = {"status": "success"}
+        else:
+            result = execute_command(command_data, factory_reset=False)
+        result["id"] = command_data.get("id")
+        result["rss_mb"] = round(_peak_rss_mb(), 1)
+        _emit(result)
+
+
+def run_batch(input_file, output_file):
+    """Run every JSONL command in ``input_file`` in this Blender process.
+
+    Writes one result line per input line, each with its ``duration_ms``.
+    Factory settings are loaded once for the whole batch; commands then clear
+    the scene in place, like a warm worker. Inventory entries are registered
+    in chunks of ``BATCH_REGISTER_CHUNK`` with one locked write per chunk.
+    """
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    pending_assets = []
+    with open(input_file, 'r') as src, open(output_file, 'w') as out:
+        for line_no, line in enumerate(src, 1):
+            line = line.strip()
+            if not line:
+                continue
+            start = time.perf_counter()
+            try:
+                command_data = json.loads(line)
+            except json.JSONDecodeError as e:
+                command_data = {}
+                result = {"status": "error", "message": f"Invalid JSON on line {line_no}: {e}"}
+            else:
+                result = execute_command(command_data, factory_reset=False, pending_assets=pending_assets)
+            result["line"] = line_no
+            result["id"] = command_data.get("id")
+            result["duration_ms"] = round((time.perf_counter() - start) * 1000, 3)
+            out.write(json.dumps(result) + "\n")
+
+            if len(pending_assets) >= BATCH_REGISTER_CHUNK:
+                InventoryManager.register_assets(pending_assets)
+                pending_assets.clear()
+        InventoryManager.register_assets(pending_assets)
+
 
 def run():
     input_file = None
@@ -21,6 +160,12 @@ def run():
     try:
         if '--' in sys.argv:
             args = sys.argv[sys.argv.index('--') + 1:]
+            if args == ["--worker"]:
+                serve()
+                return
+            if len(args) == 3 and args[0] == "--batch":
+                run_batch(args[1], args[2])
+                return
             if len(args) == 2:
                 input_file = args[0]
                 output_file = args[1]
@@ -29,7 +174,7 @@ def run():
         else:
             raise ValueError("Missing -- separator for arguments")
     except (ValueError, IndexError) as e:
-        result = {"status": "error", "message": f"CLI Argument Error: {e}. Usage: blender --background --python run_command.py -- <input.json> <output.json>"}
+        result = {"status": "error", "message": f"CLI Argument Error: {e}. Usage: blender --background --python run_command.py -- <input.json> <output.json> | --batch <in.jsonl> <out.jsonl> | --worker"}
         if output_file:
             with open(output_file, 'w') as f:
                 json.dump(result, f, indent=2)
@@ -41,45 +186,10 @@ def run():
         try:
             with open(input_file, 'r') as f:
                 command_data = json.load(f)
-            
-            cmd = command_data.get("command")
-            seed = command_data.get("seed", 0)
-            
-            if cmd == "create_wall":
-                wall_data = command_data.get("asset", {})
-                name = wall_data.get("name", "GenWall")
-                length = wall_data.get("dimensions", {}).get("width", 4.0)
-                
-                # Create engineered mesh with slots
-                obj, slots = create_engineered_wall(name, length, seed)
-                
-                # Register in inventory with slots
-                asset_info = {
-                    "name": name,
-                    "tags": wall_data.get("tags", ["arch_wall"]),
-                    "dimensions": {"width": length, "height": 3.0, "depth": 0.2},
-                    "slots": slots,
-                    "blend_file": os.path.join(LIBRARY_DIR, f"{name}.blend"),
-                    "seed": seed
-                }
-                InventoryManager.register_asset(asset_info)
-                
-                # Save
-                os.makedirs(LIBRARY_DIR, exist_ok=True)
-                lib_path = os.path.join(LIBRARY_DIR, f"{name}.blend")
-                bpy.ops.wm.save_as_mainfile(filepath=lib_path)
-                
-                result = {
-                    "status": "success",
-                    "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
-                    "result": {"asset_name": name, "slots_count": len(slots), "blend_file": lib_path}
-                }
-            else:
-                result = {"status": "error", "message": f"Unknown command: {cmd}"}
-                
+            result = execute_command(command_data)
         except Exception as e:
             result = {
-                "status": "error", 
+                "status": "error",
                 "message": str(e),
                 "traceback": traceback.format_exc()
             }
@@ -0,0 +1,29 @@
+"""Benchmark the bucketed adjacency builder against the pairwise reference.
+
+Usage: python scripts/bench_adjacency.py [footprint_size ...]
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mf_v5.adjacency import build_adjacency, build_adjacency_pairwise
+from mf_v5.floorplan import generate_floorplan
+
+
+def main(sizes):
+    print(f"{'footprint':>10} {'rooms':>6} {'pairwise ms':>12} {'bucketed ms':>12} {'speedup':>8}")
+    for size in sizes:
+        rooms, _ = generate_floorplan(size, size, seed=42, floor_index=0)
+        assert build_adjacency(rooms) == build_adjacency_pairwise(rooms)
+
+        repeat = max(1, 2000 // max(len(rooms), 1))
+        pairwise = min(timeit.repeat(lambda: build_adjacency_pairwise(rooms), number=repeat, repeat=3)) / repeat
+        bucketed = min(timeit.repeat(lambda: build_adjacency(rooms), number=repeat, repeat=3)) / repeat
+        print(f"{size:>10} {len(rooms):>6} {pairwise * 1e3:>12.3f} {bucketed * 1e3:>12.3f} {pairwise / bucketed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main([float(a) for a in sys.argv[1:]] or [20.0, 60.0, 120.0, 240.0])
@@ -0,0 +1,25 @@
+"""Stand-in for ``run_command.py -- --worker`` speaking the same line protocol."""
+import json
+import os
+import sys
+import time
+
+PREFIX = "@@MF_RESULT "
+
+
+def emit(payload):
+    sys.stdout.write(PREFIX + json.dumps(payload) + "\n")
+    sys.stdout.flush()
+
+
+emit({"status": "ready", "pid": os.getpid()})
+for line in sys.stdin:
+    command = json.loads(line)
+    if command["command"] == "shutdown":
+        break
+    if command["command"] == "crash":
+        os._exit(3)
+    if command["command"] == "sleep":
+        time.sleep(command["seconds"])
+    print("Blender log noise")
+    emit({"status": "success", "id": command.get("id"), "pid": os.getpid(), "rss_mb": command.get("rss_mb", 10.0)})
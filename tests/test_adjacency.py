@@ -0,0 +1,34 @@
+import random
+
+from mf_v5.adjacency import build_adjacency, build_adjacency_pairwise
+from mf_v5.datamodel import Rect, Room
+from mf_v5.floorplan import generate_floorplan
+
+
+def test_bucketed_adjacency_matches_pairwise_on_floorplans():
+    for size, seed in [(20, 42), (30, 123), (75, 7), (120, 1)]:
+        rooms, _ = generate_floorplan(size, size, seed, 0)
+        assert build_adjacency(rooms) == build_adjacency_pairwise(rooms)
+
+
+def test_bucketed_adjacency_matches_pairwise_on_arbitrary_rects():
+    rng = random.Random(5)
+    for _ in range(20):
+        rooms = []
+        for i in range(60):
+            x = rng.randrange(0, 20) * 0.5 + rng.choice([0.0, 0.00005, -0.00005, 0.13])
+            y = rng.randrange(0, 20) * 0.5
+            w = rng.randrange(1, 6) * 0.5
+            h = rng.randrange(1, 6) * 0.5
+            rooms.append(Room(Rect(x, y, x + w, y + h), 0, i))
+        assert build_adjacency(rooms) == build_adjacency_pairwise(rooms)
+
+
+def test_last_neighbour_wins_like_pairwise():
+    a = Room(Rect(0, 0, 10, 5), 0, 0)
+    b = Room(Rect(0, 5, 5, 10), 0, 1)
+    c = Room(Rect(5, 5, 10, 10), 0, 2)
+    adj = build_adjacency([a, b, c])
+    assert adj[0]["north"] == 2
+    assert adj[1]["south"] == 0 and adj[2]["south"] == 0
+    assert adj[1]["east"] == 2 and adj[2]["west"] == 1
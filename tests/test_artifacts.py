@@ -0,0 +1,106 @@
+import os
+import shutil
+from dataclasses import replace
+from pathlib import Path
+
+from mf_v5 import BuildingSpec, RoofType
+from mf_v5 import engine
+from mf_v5.artifacts import ArtifactCache, artifact_key, config_constants
+from mf_v5.export import ExportSettings
+
+
+def test_key_covers_spec_config_and_settings(monkeypatch):
+    spec = BuildingSpec(width=20, depth=16, floors=2, seed=1)
+    key = artifact_key(spec, ExportSettings())
+    assert key == artifact_key(replace(spec), ExportSettings())
+    assert key != artifact_key(replace(spec, roof_type=RoofType.FLAT), ExportSettings())
+    assert key != artifact_key(spec, ExportSettings(y_up=False))
+
+    assert "WALL_HEIGHT" in config_constants() and "DEBUG_MODE" not in config_constants()
+    monkeypatch.setattr("mf_v5.config.WALL_HEIGHT", 3.5)
+    assert key != artifact_key(spec, ExportSettings())
+
+
+def test_hit_skips_generation(tmp_path: Path, monkeypatch):
+    cache = ArtifactCache(tmp_path / "cache")
+    spec = BuildingSpec(width=20, depth=16, floors=2, seed=1)
+    first = engine.generate(spec, tmp_path / "a", artifact_cache=cache)
+    assert cache.stats.misses == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("planning should be skipped on a hit")
+
+    monkeypatch.setattr(engine, "plan_building", fail)
+    second = engine.generate(spec, tmp_path / "b", artifact_cache=cache)
+    assert cache.stats.hits == 1
+    assert Path(second.glb_path).read_bytes() == Path(first.glb_path).read_bytes()
+    assert Path(second.export_manifest).exists()
+    assert second.floors == first.floors
+    assert second.roof_type == first.roof_type
+
+
+def test_eviction_drops_least_recently_used(tmp_path: Path):
+    cache = ArtifactCache(tmp_path / "cache", max_bytes=10**9)
+    for seed in range(3):
+        engine.generate(BuildingSpec(width=20, depth=16, floors=1, seed=seed), tmp_path / str(seed), artifact_cache=cache)
+    keys = [artifact_key(BuildingSpec(width=20, depth=16, floors=1, seed=s), ExportSettings()) for s in range(3)]
+
+    # Make the first entry the most recently used, then shrink the budget
+    for i, key in enumerate(keys):
+        os.utime(cache.root / key, (1000 + i, 1000 + i))
+    cache.lookup(keys[0])
+    cache.max_bytes = cache.size_bytes() - 1
+    assert cache.evict() == 1
+    assert cache.lookup(keys[1]) is None
+    assert cache.lookup(keys[0]) is not None and cache.lookup(keys[2]) is not None
+    assert not [p for p in cache.root.iterdir() if p.name.startswith(".")]
+
+
+def test_rebuilding_over_a_hit_leaves_the_entry_intact(tmp_path: Path):
+    cache = ArtifactCache(tmp_path / "cache")
+    spec = BuildingSpec(width=20, depth=16, floors=2, seed=1)
+    engine.generate(spec, tmp_path / "a", artifact_cache=cache)
+    entry = cache.lookup(artifact_key(spec, ExportSettings()))
+    cached = (entry / "Building.glb").read_bytes()
+
+    engine.generate(spec, tmp_path / "b", artifact_cache=cache)
+    engine.generate(replace(spec, width=24), tmp_path / "b")
+    assert (entry / "Building.glb").read_bytes() == cached
+    assert (tmp_path / "b" / "Building.glb").read_bytes() != cached
+
+
+def test_entry_evicted_during_a_hit_is_rebuilt(tmp_path: Path, monkeypatch):
+    cache = ArtifactCache(tmp_path / "cache")
+    spec = BuildingSpec(width=20, depth=16, floors=2, seed=1)
+    first = engine.generate(spec, tmp_path / "a", artifact_cache=cache)
+
+    materialize = cache.materialize
+
+    def evict_first(entry, output_dir):
+        shutil.rmtree(entry)  # Another process evicts between lookup and read
+        materialize(entry, output_dir)
+
+    monkeypatch.setattr(cache, "materialize", evict_first)
+    second = engine.generate(spec, tmp_path / "b", artifact_cache=cache)
+    assert Path(second.glb_path).read_bytes() == Path(first.glb_path).read_bytes()
+    assert second.geometry is not None
+
+
+def test_store_scans_the_cache_only_when_needed(tmp_path: Path, monkeypatch):
+    src = tmp_path / "Building.glb"
+    src.write_bytes(b"x" * 100)
+    cache = ArtifactCache(tmp_path / "cache", max_bytes=10**6, rescan_every=4)
+    scans = []
+    entries = cache._entries
+    monkeypatch.setattr(cache, "_entries", lambda: scans.append(1) or entries())
+
+    for i in range(6):
+        cache.store(f"key{i}", [src], {})
+    assert len(scans) == 2  # The first store, then every fourth
+
+    # Past the budget, the next store scans and evicts right away
+    cache.max_bytes = cache.size_bytes() + 50
+    scans.clear()
+    cache.store("big", [src], {})
+    assert len(scans) == 1 and cache.stats.evictions == 1
+    assert cache.size_bytes() <= cache.max_bytes
@@ -0,0 +1,142 @@
+import json
+import os
+
+from engine import slot_engine
+from engine.asset_index import AssetIndex, get_index
+
+
+def write_inventory(path, assets):
+    path.write_text(json.dumps({"version": "1.0", "assets": {a["name"]: a for a in assets}}))
+
+
+def linear_find_all(assets, tags):
+    return [a for a in assets if all(t in a.get("tags", []) for t in tags)]
+
+
+def test_index_matches_linear_scan(tmp_path):
+    assets = [
+        {"name": f"A{i}", "tags": [t for t, m in (("wall", 2), ("door", 3), ("wood", 5)) if i % m == 0]}
+        for i in range(200)
+    ]
+    inventory = tmp_path / "inventory.json"
+    write_inventory(inventory, assets)
+    index = AssetIndex(str(inventory))
+    for tags in ([], ["wall"], ["wall", "door"], ["wall", "door", "wood"], ["missing"], ["door", "missing"]):
+        assert index.find_assets(tags) == linear_find_all(assets, tags)
+    assert [a["name"] for a in index.find_assets(["wall", "wood"], limit=2)] == ["A0", "A10"]
+
+
+def test_index_reloads_when_file_changes(tmp_path):
+    inventory = tmp_path / "inventory.json"
+    write_inventory(inventory, [{"name": "A", "tags": ["wall"]}])
+    index = get_index(str(inventory))
+    assert len(index.find_assets(["wall"])) == 1
+
+    write_inventory(inventory, [{"name": "A", "tags": ["wall"]}, {"name": "B", "tags": ["wall", "glass"]}])
+    st = os.stat(inventory)
+    os.utime(inventory, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert [a["name"] for a in get_index(str(inventory)).find_assets(["glass"])] == ["B"]
+    assert get_index(str(inventory)) is index
+
+
+def test_is_stale_tracks_the_file(tmp_path):
+    inventory = tmp_path / "inventory.json"
+    write_inventory(inventory, [{"name": "A", "tags": ["wall"]}])
+    index = AssetIndex(str(inventory))
+    assert index.is_stale()
+    index.refresh()
+    assert not index.is_stale()
+    st = os.stat(inventory)
+    os.utime(inventory, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert index.is_stale()
+
+
+def test_backends_share_one_dispatch(tmp_path):
+    from engine.asset_index import inventory_backend
+    from engine.inventory_store import SqliteInventoryStore
+
+    inventory = tmp_path / "inventory.json"
+    write_inventory(inventory, [])
+    assert inventory_backend("json", str(inventory)) is get_index(str(inventory))
+    assert isinstance(inventory_backend("sqlite", inventory_db=str(tmp_path / "inv.db")), SqliteInventoryStore)
+
+
+def test_add_replaces_tags_in_place(tmp_path):
+    index = AssetIndex(str(tmp_path / "missing.json"))
+    index.add({"name": "A", "tags": ["wall"]})
+    index.add({"name": "A", "tags": ["door"]})
+    assert index.find_assets(["wall"]) == []
+    assert index.match_bits(["door"]) == 1 and index.match_bits(["wall"]) == 0
+
+
+def test_slot_engine_uses_shared_index(tmp_path, monkeypatch):
+    inventory = tmp_path / "inventory.json"
+    write_inventory(inventory, [{"name": "Chair", "tags": ["furn", "wood"]}, {"name": "Desk", "tags": ["furn"]}])
+    monkeypatch.setattr(slot_engine, "INVENTORY_FILE", str(inventory))
+    assert slot_engine.find_asset(["furn"])["name"] == "Chair"
+    assert [a["name"] for a in slot_engine.find_assets(["furn"])] == ["Chair", "Desk"]
+    assert slot_engine.place_on_slot(None, {}, ["missing"])["status"] == "error"
+
+
+def brute_force_fitting(assets, tags, width, height):
+    fits = [
+        (width - a["dimensions"]["width"] + height - a["dimensions"]["height"], i, a)
+        for i, a in enumerate(assets)
+        if all(t in a["tags"] for t in tags) and a["dimensions"]["width"] <= width and a["dimensions"]["height"] <= height
+    ]
+    return [a for _, _, a in sorted(fits, key=lambda f: (f[0], f[1]))]
+
+
+def test_find_fitting_matches_brute_force(tmp_path):
+    import random
+
+    rng = random.Random(3)
+    assets = [
+        {"name": f"F{i}", "tags": rng.sample(["furn", "wood", "metal", "small"], 2),
+         "dimensions": {"width": rng.choice([0.5, 0.75, 1.0, 1.25, 2.0]), "height": rng.uniform(0.3, 2.5), "depth": 0.5}}
+        for i in range(300)
+    ]
+    inventory = tmp_path / "inventory.json"
+    write_inventory(inventory, assets)
+    index = AssetIndex(str(inventory))
+    for tags, w, h in ((["furn"], 1.0, 1.2), (["wood", "metal"], 2.0, 2.5), ([], 0.75, 0.8), (["small"], 0.4, 3.0)):
+        expected = brute_force_fitting(assets, tags, w, h)
+        assert index.find_fitting(tags, w, h) == expected
+        assert index.find_fitting(tags, w, h, limit=3) == expected[:3]
+
+
+def test_find_fitting_skips_cells_that_cannot_fit(tmp_path, monkeypatch):
+    assets = [{"name": f"Tall{i}", "tags": ["win"], "dimensions": {"width": 0.5, "height": 3.0 + i / 1000}} for i in range(500)]
+    assets += [{"name": f"Fit{i}", "tags": ["win"], "dimensions": {"width": 0.9, "height": 1.0 + i / 10}} for i in range(3)]
+    inventory = tmp_path / "inventory.json"
+    write_inventory(inventory, assets)
+    index = AssetIndex(str(inventory))
+    index.refresh()
+
+    visited = []
+    size = AssetIndex._size
+    monkeypatch.setattr(AssetIndex, "_size", staticmethod(lambda a: visited.append(a["name"]) or size(a)))
+    assert [a["name"] for a in index.find_fitting(["win"], 1.0, 1.25)] == ["Fit2", "Fit1", "Fit0"]
+    assert sorted(visited) == ["Fit0", "Fit1", "Fit2"]
+
+    visited.clear()
+    index.add({"name": "Fit1", "tags": ["win"], "dimensions": {"width": 3.0, "height": 3.0}})
+    assert [a["name"] for a in index.find_fitting(["win"], 1.0, 1.25)] == ["Fit2", "Fit0"]
+
+
+def test_register_updates_loaded_index_in_place(tmp_path, monkeypatch):
+    from engine import asset_index, inventory_manager
+    from engine.inventory_manager import InventoryManager
+
+    monkeypatch.setattr(inventory_manager, "REGISTRY_DIR", str(tmp_path))
+    monkeypatch.setattr(inventory_manager, "INVENTORY_FILE", str(tmp_path / "inventory.json"))
+    monkeypatch.setattr(inventory_manager, "LOCK_FILE", str(tmp_path / ".inventory.lock"))
+    InventoryManager.register_asset({"name": "Small", "tags": ["win"], "dimensions": {"width": 0.8, "height": 1.0}})
+    assert InventoryManager.find_fitting_assets(["win"], 1.0, 1.2)[0]["name"] == "Small"
+
+    def no_reload(*args, **kwargs):
+        raise AssertionError("index should be updated without re-reading the file")
+
+    monkeypatch.setattr(asset_index.AssetIndex, "_rebuild", no_reload)
+    InventoryManager.register_asset({"name": "Snug", "tags": ["win"], "dimensions": {"width": 1.0, "height": 1.2}})
+    assert [a["name"] for a in InventoryManager.find_fitting_assets(["win"], 1.0, 1.2)] == ["Snug", "Small"]
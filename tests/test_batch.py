@@ -0,0 +1,80 @@
+from pathlib import Path
+
+from mf_v5 import BuildingSpec, RoofType, generate_batch
+from mf_v5.planning import plan_building
+
+
+def test_plan_building_matches_spec():
+    spec = BuildingSpec(width=20, depth=16, floors=3, seed=7, roof_type=RoofType.GABLED)
+    plan = plan_building(spec)
+    assert [f.floor_index for f in plan.floors] == [0, 1, 2]
+    assert plan.stairwell is not None
+    assert plan.roof.roof_type == RoofType.GABLED
+
+
+def test_generate_batch_preserves_order_and_isolates_errors(tmp_path: Path):
+    specs = [
+        BuildingSpec(width=20, depth=16, floors=1, seed=1),
+        BuildingSpec(width=2, depth=2, floors=1, seed=2),  # too small
+        BuildingSpec(width=12, depth=12, floors=2, seed=3),
+    ]
+    results = generate_batch(specs, tmp_path, workers=2)
+
+    assert [r.index for r in results] == [0, 1, 2]
+    assert [r.spec for r in results] == specs
+    assert results[0].ok and results[2].ok
+    assert not results[1].ok
+    assert "ConfigurationError" in results[1].error
+    assert len(results[2].output.floors) == 2
+    assert Path(results[0].output.export_manifest).exists()
+
+
+def test_generate_batch_inline_matches_pool(tmp_path: Path):
+    specs = [BuildingSpec(width=20, depth=16, floors=2, seed=s) for s in range(3)]
+    pooled = generate_batch(specs, tmp_path / "pool", workers=2)
+    inline = generate_batch(specs, tmp_path / "inline", workers=1)
+    for a, b in zip(pooled, inline):
+        assert [f.wall_segment_count for f in a.output.floors] == [f.wall_segment_count for f in b.output.floors]
+
+
+def test_generate_batch_realizes_each_plan_before_planning_the_rest(tmp_path: Path, monkeypatch):
+    from mf_v5 import batch
+
+    events = []
+    plan_traced, realize = batch._plan_traced, batch.realize_plan
+
+    def traced_plan(spec, traced):
+        events.append(("plan", spec.seed))
+        return plan_traced(spec, traced)
+
+    def traced_realize(plan, *args):
+        events.append(("realize", plan.spec.seed))
+        return realize(plan, *args)
+
+    monkeypatch.setattr(batch, "_plan_traced", traced_plan)
+    monkeypatch.setattr(batch, "realize_plan", traced_realize)
+    specs = [BuildingSpec(width=20, depth=16, floors=1, seed=s) for s in range(3)]
+    generate_batch(specs, tmp_path, workers=1)
+    assert events == [(kind, s) for s in range(3) for kind in ("plan", "realize")]
+
+
+def test_generate_batch_uses_settings_and_artifact_cache(tmp_path: Path, monkeypatch):
+    from mf_v5 import batch
+    from mf_v5.artifacts import ArtifactCache
+    from mf_v5.export import ExportSettings
+
+    cache = ArtifactCache(tmp_path / "cache")
+    settings = ExportSettings(collider_mode="json")
+    specs = [BuildingSpec(width=20, depth=16, floors=1, seed=s) for s in (1, 2)]
+    first = generate_batch(specs, tmp_path / "a", workers=1, settings=settings, artifact_cache=cache)
+    assert all(r.ok for r in first) and cache.stats.misses == 2
+    assert (tmp_path / "a" / "building_0000" / "Building-col.json").exists()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cached specs should not be planned")
+
+    monkeypatch.setattr(batch, "plan_building", fail)
+    second = generate_batch(specs, tmp_path / "b", workers=1, settings=settings, artifact_cache=cache)
+    assert all(r.ok for r in second) and cache.stats.hits == 2
+    for a, b in zip(first, second):
+        assert Path(b.output.glb_path).read_bytes() == Path(a.output.glb_path).read_bytes()
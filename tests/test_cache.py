@@ -0,0 +1,54 @@
+from mf_v5.cache import DiskTier, LRUCache, fingerprint
+from mf_v5.floorplan import FloorplanCache, generate_floorplan
+
+
+def test_lru_evicts_least_recently_used():
+    lru = LRUCache(2)
+    lru.put("a", 1)
+    lru.put("b", 2)
+    assert lru.get("a") == 1
+    assert lru.put("c", 3) == 1
+    assert lru.get("b", None) is None
+    assert len(lru) == 2
+
+
+def test_floorplan_cache_hits_and_copies():
+    cache = FloorplanCache(maxsize=4, disk_dir=None)
+    rooms, corridor = cache.get(20, 16, 42, 0)
+    again, corridor_again = cache.get(20, 16, 42, 0)
+    assert cache.stats.misses == 1 and cache.stats.hits == 1
+    assert again == rooms and corridor_again == corridor
+    # Callers get their own list
+    again.clear()
+    assert len(cache.get(20, 16, 42, 0)[0]) == len(rooms)
+    assert rooms == generate_floorplan(20, 16, 42, 0)[0]
+
+
+def test_floorplan_cache_disk_tier_is_shared(tmp_path):
+    writer = FloorplanCache(maxsize=4, disk_dir=str(tmp_path))
+    rooms, _ = writer.get(30, 30, 123, 1)
+    reader = FloorplanCache(maxsize=4, disk_dir=str(tmp_path))
+    cached, _ = reader.get(30, 30, 123, 1)
+    assert reader.stats.disk_hits == 1 and reader.stats.misses == 0
+    assert cached == rooms
+
+
+def test_disk_tier_drops_unreadable_entries(tmp_path):
+    tier = DiskTier(tmp_path)
+    tier.put("truncated", list(range(100)))
+    path = tier._path("truncated")
+    path.write_bytes(path.read_bytes()[:20])
+    assert tier.get("truncated", None) is None and not path.exists()
+
+    # A pickle naming a class that no longer exists raises AttributeError on load
+    stale = tier._path("stale")
+    stale.write_bytes(b"\x80\x04\x95\x1d\x00\x00\x00\x00\x00\x00\x00\x8c\x0bmf_v5.cache\x94\x8c\x07Missing\x94\x93\x94.")
+    assert tier.get("stale", None) is None and not stale.exists()
+
+
+def test_floorplan_key_covers_code_version():
+    from mf_v5 import floorplan
+
+    assert floorplan._LAYOUT_FINGERPRINT == fingerprint(
+        floorplan.FLOORPLAN_VERSION, floorplan.GRID, floorplan.EPSILON, floorplan.CORRIDOR_WIDTH, floorplan.MIN_ROOM_SIZE
+    )
@@ -0,0 +1,45 @@
+from mf_v5.adjacency import build_adjacency
+from mf_v5.cleanup import fuse_shared_walls
+from mf_v5.datamodel import DoorOpening, Rect, Room, WallSegmentTable, WindowOpening
+from mf_v5.openings import carve_openings
+from mf_v5.walls import build_room_wall_segments, build_room_wall_table
+
+
+def _stacked_rooms():
+    # Room 0 below room 1, plus room 2 to the right of room 1 on the same top line
+    return [
+        Room(Rect(0, 0, 5, 4), 0, 0),
+        Room(Rect(0, 4, 5, 8), 0, 1),
+        Room(Rect(5, 4, 9, 8), 0, 2),
+    ]
+
+
+def test_shared_wall_is_built_once_and_keeps_both_openings():
+    rooms = _stacked_rooms()
+    walls = build_room_wall_segments(rooms)
+    window = WindowOpening(0, "north", (1.5, 4.0))
+    door = DoorOpening(1, "south", (3.5, 4.0), 0.9, 2.1)
+    fused, openings = fuse_shared_walls(walls, [window, door], build_adjacency(rooms))
+
+    on_shared_line = [s for segs in fused.values() for s in segs if s.y1 == s.y2 == 4.0 and s.x2 <= 5.0]
+    assert len(on_shared_line) == 1
+    assert (on_shared_line[0].room_id, on_shared_line[0].x1, on_shared_line[0].x2) == (0, 0.0, 5.0)
+    # Both rooms' openings now target the one wall that is left
+    assert {(o.room_id, o.side) for o in openings} == {(0, "north")}
+
+    carved = [s for segs in carve_openings(fused, openings).values() for s in segs if s.y1 == s.y2 == 4.0 and s.x2 <= 5.0]
+    spans = sorted((round(s.x1, 3), round(s.x2, 3), type(s.opening).__name__) for s in carved)
+    assert spans == [(0.0, 0.9, "NoneType"), (0.9, 2.1, "WindowOpening"), (2.1, 3.05, "NoneType"), (3.95, 5.0, "NoneType")]
+
+
+def test_collinear_walls_merge_into_runs():
+    rooms = _stacked_rooms()
+    fused, _ = fuse_shared_walls(build_room_wall_segments(rooms))
+    top = [s for segs in fused.values() for s in segs if s.y1 == 8.0 and s.y2 == 8.0]
+    assert [(s.room_id, s.x1, s.x2) for s in top] == [(1, 0.0, 9.0)]
+    # Room 1's east wall and room 2's west wall coincide
+    assert sum(1 for segs in fused.values() for s in segs if s.x1 == s.x2 == 5.0) == 1
+
+    table, _ = fuse_shared_walls(build_room_wall_table(rooms))
+    assert isinstance(table, WallSegmentTable)
+    assert table.to_segments() == [s for segs in fused.values() for s in segs]
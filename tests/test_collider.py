@@ -0,0 +1,110 @@
+from pathlib import Path
+
+import numpy as np
+
+from mf_v5 import BuildingSpec
+from mf_v5.collider import collider_arrays, collider_shapes, collider_wall_boxes, merge_boxes
+from mf_v5.datamodel import Rect, WallSegment, WindowOpening
+from mf_v5.engine import realize_plan
+from mf_v5.mesh_arrays import slab_boxes, stair_flight_arrays, stair_hulls, wall_boxes
+from mf_v5.openings import carve_segment
+from mf_v5.planning import plan_building
+
+
+def test_window_row_collapses_into_bands_and_piers():
+    wall = WallSegment(0, "north", 0.0, 0.0, 10.0, 0.0, 3.0, 0.2)
+    windows = [WindowOpening(0, "north", (x, 0.0)) for x in (2.0, 5.0, 8.0)]
+    pieces = carve_segment(wall, windows)
+    assert len(wall_boxes(pieces)[0]) == 4 + 2 * 3
+
+    mins, maxs = collider_wall_boxes([(pieces, 0.0)])
+    boxes = sorted(zip(map(tuple, mins.round(3)), map(tuple, maxs.round(3))), key=lambda b: (b[0][2], b[0][0]))
+    # Sill band, four piers, lintel band
+    assert len(boxes) == 6
+    assert boxes[0] == ((0.0, -0.1, 0.0), (10.0, 0.1, 1.0))
+    assert boxes[-1] == ((0.0, -0.1, 2.0), (10.0, 0.1, 3.0))
+
+    solid = collider_wall_boxes([([wall], 3.2)])
+    assert np.allclose(solid[0], [(0, -0.1, 3.2)]) and np.allclose(solid[1], [(10, 0.1, 6.2)])
+
+
+def test_short_sills_are_dropped():
+    wall = WallSegment(0, "east", 0.0, 0.0, 0.0, 6.0, 3.0, 0.2)
+    pieces = carve_segment(wall, [WindowOpening(0, "east", (0.0, 3.0), sill_height=0.3)])
+    mins, maxs = collider_wall_boxes([(pieces, 0.0)], min_span=0.5)
+    # Sill (0.3 m) dropped: two piers up to the lintel, then one full-length band
+    assert np.allclose(sorted(maxs[:, 2] - mins[:, 2]), [1.3, 1.3, 1.7])
+    assert len(collider_wall_boxes([(pieces, 0.0)], min_span=0.2)[0]) == 4
+
+
+def test_collider_from_plan_matches_building_bounds(tmp_path: Path):
+    plan = plan_building(BuildingSpec(width=20, depth=16, floors=2, seed=42))
+    collider = collider_arrays(plan)
+    assert len(collider.normals) == 0 and len(collider.uvs) == 0
+    assert collider.indices.max() == collider.vertex_count - 1
+
+    geometry = realize_plan(plan, tmp_path).geometry
+    assert np.allclose(collider.positions.min(axis=0), geometry.positions.min(axis=0))
+    assert np.allclose(collider.positions.max(axis=0), geometry.positions.max(axis=0))
+    assert collider.triangle_count < geometry.triangle_count
+
+
+def test_merge_boxes_joins_shared_faces_only():
+    mins = [(0, 0, 0), (1, 0, 0), (2, 0, 0), (0, 1, 0), (5, 0, 0)]
+    maxs = [(1, 1, 1), (2, 1, 1), (3, 1, 1), (3, 2, 1), (6, 1, 2)]
+    merged_mins, merged_maxs = merge_boxes(mins, maxs)
+    boxes = sorted(zip(map(tuple, merged_mins.tolist()), map(tuple, merged_maxs.tolist())))
+    # Row of three joins along x, then with the row above along y; the taller box stays apart
+    assert boxes == [((0, 0, 0), (3, 2, 1)), ((5, 0, 0), (6, 1, 2))]
+
+
+def test_collider_shapes_for_plan():
+    plan = plan_building(BuildingSpec(width=20, depth=16, floors=3, seed=42))
+    shapes = collider_shapes(plan)
+    visual_boxes = sum(len(wall_boxes(f.walls)[0]) + len(slab_boxes(f.slabs)[0]) for f in plan.floors)
+    assert len(shapes.box_mins) < 0.7 * visual_boxes
+    # One stair ramp per flight plus the (hip) roof
+    assert [shapes.hulls[h][0] for h, _ in shapes.placements] == ["StairHull_0", "StairHull_0", "Roof"]
+    assert shapes.shape_count == len(shapes.box_mins) + 3
+
+
+def test_stair_ramp_hull_contains_every_step():
+    rect = Rect(0, 0, 2, 4)
+    (hull,) = stair_hulls(rect)
+    tris = hull.positions[hull.indices.reshape(-1, 3)]
+    normals = np.cross(tris[:, 1] - tris[:, 0], tris[:, 2] - tris[:, 0])
+    steps = stair_flight_arrays(rect).positions
+    # Every step corner lies on or inside every outward face plane
+    depth = np.einsum("tj,vtj->vt", normals, steps[:, None] - tris[None, :, 0])
+    assert depth.max() < 1e-5
+
+
+def test_spec_stair_type_reaches_generate(tmp_path: Path):
+    import json
+    from dataclasses import replace
+
+    import pytest
+
+    from mf_v5 import generate
+    from mf_v5.artifacts import ArtifactCache, artifact_key
+    from mf_v5.exceptions import ConfigurationError
+    from mf_v5.export import ExportSettings
+
+    spiral = BuildingSpec(width=20, depth=16, floors=2, seed=42, stair_type="spiral")
+    straight = replace(spiral, stair_type="straight")
+    settings = ExportSettings(collider_mode="json")
+    assert artifact_key(spiral, settings) != artifact_key(straight, settings)
+    assert plan_building(spiral).stairwell.stair_type == "spiral"
+
+    cache = ArtifactCache(tmp_path / "cache")
+    hulls = {}
+    for spec in (spiral, straight):
+        generate(spec, tmp_path / spec.stair_type, settings=settings, artifact_cache=cache)
+        collider = json.loads((tmp_path / spec.stair_type / "Building-col.json").read_text())
+        hulls[spec.stair_type] = [c["name"] for c in collider["convex"] if c["name"].startswith("StairHull")]
+    assert cache.stats.misses == 2
+    assert len(hulls["spiral"]) == len(stair_hulls(plan_building(spiral).stairwell.rect, "spiral"))
+    assert hulls["straight"] == ["StairHull_0"]
+
+    with pytest.raises(ConfigurationError):
+        generate(replace(spiral, stair_type="ladder"), tmp_path / "bad")
@@ -16,3 +16,43 @@ def test_engine_generates_manifest(tmp_path: Path):
     out = generate(spec, tmp_path)
     assert len(out.floors) == 2
     assert Path(out.export_manifest).exists()
+
+
+def test_blender_parts_use_quad_builders(monkeypatch):
+    from mf_v5 import engine
+    from mf_v5.mesh_arrays import MeshArrays, wall_arrays
+    from mf_v5.planning import plan_building
+
+    calls = []
+    for name in ("create_wall_mesh", "create_slab_mesh", "create_roof_mesh", "create_mesh_object"):
+        monkeypatch.setattr(engine, name, lambda *args, _name=name, **kwargs: calls.append((_name, args, kwargs)) or _name, raising=False)
+
+    plan = plan_building(BuildingSpec(width=20, depth=16, floors=2, seed=42))
+    floor = plan.floors[1]
+    parts = [("Walls_F1", wall_arrays(floor.walls)), ("Slabs_F1", MeshArrays.empty()), ("Stairs", wall_arrays(floor.walls)), ("Roof", wall_arrays(floor.walls))]
+    assert engine._blender_objects(plan, parts) == ["create_wall_mesh", "create_mesh_object", "create_roof_mesh"]
+    assert calls[0][1][0] is floor.walls and calls[0][2] == {"z_offset": floor.z_offset}
+    assert calls[2][1][0] is plan.roof
+
+
+def test_degenerate_spec_writes_every_manifest_file(tmp_path: Path):
+    import json
+
+    import pytest
+
+    from mf_v5.artifacts import ArtifactCache
+    from mf_v5.export import ExportSettings
+
+    spec = BuildingSpec(width=5, depth=5, floors=1, seed=1)
+    cache = ArtifactCache(tmp_path / "cache")
+    for mode in ("trimesh", "boxes", "json"):
+        out_dir = tmp_path / mode
+        out = generate(spec, out_dir, settings=ExportSettings(collider_mode=mode, lod_levels=(0, 1, 2)), artifact_cache=cache)
+        assert out.geometry.vertex_count == 0 and out.glb_path is not None
+        manifest = json.loads(Path(out.export_manifest).read_text())
+        listed = [manifest[k] for k in ("building", "collider", "navmesh", "navmesh_polygons")]
+        listed += [lod["file"] for lod in manifest["lods"]]
+        assert all((out_dir / name).exists() for name in listed)
+    assert cache.stats.misses == 3 and len(list(cache.root.iterdir())) == 3
+    hit = generate(spec, tmp_path / "hit", settings=ExportSettings(collider_mode="json", lod_levels=(0, 1, 2)), artifact_cache=cache)
+    assert cache.stats.hits == 1 and Path(hit.glb_path).exists()
@@ -0,0 +1,121 @@
+import json
+import struct
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from mf_v5 import BuildingSpec, generate
+from mf_v5.exceptions import ConfigurationError
+from mf_v5.export import ExportSettings, GlbFile, write_glb, write_glb_files
+from mf_v5.mesh_arrays import MeshArrays, box_arrays
+
+
+def read_glb(path: Path):
+    data = path.read_bytes()
+    magic, version, total = struct.unpack_from("<III", data, 0)
+    assert magic == 0x46546C67 and version == 2 and total == len(data)
+    json_len, json_type = struct.unpack_from("<II", data, 12)
+    assert json_type == 0x4E4F534A and json_len % 4 == 0
+    gltf = json.loads(data[20:20 + json_len])
+    if 20 + json_len == len(data):
+        return gltf, b""
+    bin_len, bin_type = struct.unpack_from("<II", data, 20 + json_len)
+    assert bin_type == 0x004E4942 and bin_len % 4 == 0
+    return gltf, data[28 + json_len:28 + json_len + bin_len]
+
+
+def accessor_array(gltf, blob, index):
+    acc = gltf["accessors"][index]
+    view = gltf["bufferViews"][acc["bufferView"]]
+    dtype = np.float32 if acc["componentType"] == 5126 else np.uint32
+    width = {"SCALAR": 1, "VEC2": 2, "VEC3": 3}[acc["type"]]
+    raw = blob[view["byteOffset"]:view["byteOffset"] + view["byteLength"]]
+    return np.frombuffer(raw, dtype).reshape(acc["count"], width)
+
+
+def test_glb_round_trip(tmp_path: Path):
+    box = box_arrays(np.array([[0, 0, 0], [3, 0, 0]]), np.array([[1, 2, 3], [4, 1, 1]]))
+    path = write_glb(tmp_path / "box.glb", [("Box", box)])
+    gltf, blob = read_glb(path)
+
+    prim = gltf["meshes"][0]["primitives"][0]
+    positions = accessor_array(gltf, blob, prim["attributes"]["POSITION"])
+    indices = accessor_array(gltf, blob, prim["indices"]).ravel()
+    assert np.array_equal(positions, box.positions)
+    assert np.array_equal(indices, box.indices)
+    uvs = accessor_array(gltf, blob, prim["attributes"]["TEXCOORD_0"])
+    assert np.allclose(uvs, np.column_stack([box.uvs[:, 0], 1.0 - box.uvs[:, 1]]))
+    assert gltf["accessors"][prim["attributes"]["POSITION"]]["max"] == [4.0, 2.0, 3.0]
+    # Y-up conversion is carried by the root node
+    root = gltf["nodes"][gltf["scenes"][0]["nodes"][0]]
+    assert root["children"] == [0]
+    assert "rotation" in root
+
+
+def test_write_glb_files_without_attributes(tmp_path: Path):
+    box = box_arrays(np.zeros((1, 3)), np.ones((1, 3)))
+    settings = ExportSettings(y_up=False)
+    a, b = write_glb_files([
+        GlbFile(tmp_path / "a.glb", [("A", box)]),
+        GlbFile(tmp_path / "b.glb", [("B", box.positions_only())]),
+    ], settings)
+    gltf_b, _ = read_glb(b)
+    assert set(gltf_b["meshes"][0]["primitives"][0]["attributes"]) == {"POSITION"}
+    assert gltf_b["scenes"][0]["nodes"] == [0]
+    assert a.exists()
+
+
+def test_empty_mesh_becomes_a_node_without_geometry(tmp_path: Path):
+    box = box_arrays(np.zeros((1, 3)), np.ones((1, 3)))
+    gltf, _ = read_glb(write_glb(tmp_path / "mixed.glb", [("Empty", MeshArrays.empty()), ("Box", box)]))
+    assert "mesh" not in gltf["nodes"][0] and gltf["nodes"][1]["mesh"] == 0
+    gltf, blob = read_glb(write_glb(tmp_path / "empty.glb", [("Empty", MeshArrays.empty())]))
+    assert "meshes" not in gltf and "buffers" not in gltf and blob == b""
+
+
+def test_generate_writes_glbs_without_blender(tmp_path: Path):
+    out = generate(BuildingSpec(width=20, depth=16, floors=2, seed=42), tmp_path)
+    assert out.glb_path == str(tmp_path / "Building.glb")
+    gltf, _ = read_glb(Path(out.glb_path))
+    assert gltf["meshes"][0]["name"] == "Building"
+    assert (tmp_path / "Building-col.glb").exists()
+
+
+def test_instanced_walls_share_meshes(tmp_path: Path):
+    spec = BuildingSpec(width=30, depth=24, floors=3, seed=11)
+    flat = generate(spec, tmp_path / "flat")
+    instanced = generate(spec, tmp_path / "inst", settings=ExportSettings(instance_walls=True))
+
+    gltf, _ = read_glb(Path(instanced.glb_path))
+    wall_nodes = [n for n in gltf["nodes"] if n["name"].startswith("Wall_")]
+    assert len(gltf["meshes"]) < len(wall_nodes) // 10
+    assert all("translation" in n for n in wall_nodes)
+    assert Path(instanced.glb_path).stat().st_size < Path(flat.glb_path).stat().st_size
+    # Colliders still cover the whole building
+    assert Path(instanced.glb_path).with_name("Building-col.glb").read_bytes() == \
+        Path(flat.glb_path).with_name("Building-col.glb").read_bytes()
+
+
+def test_box_collider_modes(tmp_path: Path):
+    spec = BuildingSpec(width=20, depth=16, floors=2, seed=42)
+    generate(spec, tmp_path / "mesh")
+    trimesh, _ = read_glb(tmp_path / "mesh" / "Building-col.glb")
+
+    generate(spec, tmp_path / "boxes", settings=ExportSettings(collider_mode="boxes"))
+    gltf, _ = read_glb(tmp_path / "boxes" / "Building-col.glb")
+    shapes = [n for n in gltf["nodes"] if n["name"].endswith("-convcolonly")]
+    assert len(shapes) == len(gltf["nodes"]) - 1  # plus the Y-up root
+    # Boxes of equal size share a mesh
+    assert len(gltf["meshes"]) < len(shapes)
+    assert len(trimesh["meshes"]) == 1
+
+    generate(spec, tmp_path / "json", settings=ExportSettings(collider_mode="json"))
+    sidecar = json.loads((tmp_path / "json" / "Building-col.json").read_text())
+    assert sidecar["up"] == "Y"
+    assert len(sidecar["boxes"]) + len(sidecar["convex"]) == len(shapes)
+    manifest = json.loads((tmp_path / "json" / "export_manifest.json").read_text())
+    assert manifest["collider"] == "Building-col.json"
+
+    with pytest.raises(ConfigurationError):
+        ExportSettings(collider_mode="spheres")
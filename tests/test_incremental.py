@@ -0,0 +1,44 @@
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+
+from mf_v5 import BuildingSpec, RoofType
+from mf_v5.engine import generate
+from mf_v5.incremental import BuildSession
+
+
+def test_roof_change_only_rebuilds_roof_stages(tmp_path: Path):
+    session = BuildSession()
+    spec = BuildingSpec(width=20, depth=16, floors=2, seed=5, roof_type=RoofType.FLAT)
+    generate(spec, tmp_path, session=session)
+
+    out = generate(replace(spec, roof_type=RoofType.GABLED), tmp_path, session=session)
+    assert set(session.executed) == {("roof", None), ("mesh", "roof"), ("merge", None), ("collider", None), ("export", None)}
+    assert ("carving", 0) in session.reused and ("mesh", 1) in session.reused
+
+    fresh = generate(replace(spec, roof_type=RoofType.GABLED), tmp_path / "fresh")
+    np.testing.assert_array_equal(out.geometry.positions, fresh.geometry.positions)
+
+
+def test_adding_a_floor_reuses_existing_floors(tmp_path: Path):
+    session = BuildSession()
+    spec = BuildingSpec(width=20, depth=16, floors=2, seed=5)
+    generate(spec, tmp_path, session=session)
+
+    generate(replace(spec, floors=3), tmp_path, session=session)
+    for floor_idx in (0, 1):
+        assert ("floorplan", floor_idx) in session.reused
+        assert ("carving", floor_idx) in session.reused
+    assert ("carving", 2) in session.executed
+
+
+def test_missing_export_is_rewritten(tmp_path: Path):
+    session = BuildSession()
+    spec = BuildingSpec(width=20, depth=16, floors=1, seed=5)
+    out = generate(spec, tmp_path, session=session)
+    Path(out.glb_path).unlink()
+
+    out = generate(spec, tmp_path, session=session)
+    assert session.executed == [("export", None)]
+    assert Path(out.glb_path).exists()
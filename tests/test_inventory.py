@@ -0,0 +1,29 @@
+import json
+
+import pytest
+
+from engine import inventory_manager
+from engine.inventory_manager import InventoryManager
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    monkeypatch.setattr(inventory_manager, "REGISTRY_DIR", str(tmp_path))
+    monkeypatch.setattr(inventory_manager, "INVENTORY_FILE", str(tmp_path / "inventory.json"))
+    monkeypatch.setattr(inventory_manager, "LOCK_FILE", str(tmp_path / ".inventory.lock"))
+    return tmp_path
+
+
+def test_register_assets_writes_once(registry, monkeypatch):
+    writes = []
+    real_dump = json.dump
+    monkeypatch.setattr(inventory_manager.json, "dump", lambda *a, **k: (writes.append(1), real_dump(*a, **k)))
+
+    InventoryManager.register_asset({"name": "Old", "tags": ["arch_wall"]})
+    InventoryManager.register_assets([{"name": f"Wall_{i}", "tags": ["arch_wall"]} for i in range(50)])
+    assert len(writes) == 2
+
+    inventory = json.loads((registry / "inventory.json").read_text())
+    assert len(inventory["assets"]) == 51
+    assert InventoryManager.lock_stats().acquisitions >= 2
+    assert InventoryManager.find_asset(["arch_wall"])["name"] == "Old"
@@ -0,0 +1,74 @@
+import json
+import threading
+
+from engine import inventory_manager
+from engine.inventory_manager import InventoryManager
+from engine.inventory_store import SqliteInventoryStore
+
+FIXTURE_ASSETS = [
+    {"name": "WallA", "tags": ["arch_wall", "mat_concrete"], "dimensions": {"width": 4.0, "height": 3.0, "depth": 0.2},
+     "slots": [{"id": "main_opening", "type": "window_opening", "pos": [2.0, 0, 1.2], "size": [1.0, 1.2]}]},
+    {"name": "WallB", "tags": ["arch_wall"], "dimensions": {"width": 5.0, "height": 3.0, "depth": 0.2}},
+    {"name": "Door", "tags": ["arch_door"], "dimensions": {"width": 0.9, "height": 2.1, "depth": 0.05}},
+]
+
+
+def test_upsert_and_query(tmp_path):
+    store = SqliteInventoryStore(str(tmp_path / "inventory.db"))
+    store.upsert_assets(FIXTURE_ASSETS)
+    assert store.count() == 3
+    assert [a["name"] for a in store.find_assets(["arch_wall"])] == ["WallA", "WallB"]
+    assert [a["name"] for a in store.find_assets(["arch_wall", "mat_concrete"])] == ["WallA"]
+    assert store.find_assets(["arch_wall"], limit=1)[0]["name"] == "WallA"
+    assert store.find_assets(["missing"]) == []
+    assert store.find_slots("window_opening")[0]["asset"] == "WallA"
+
+    # Re-registering keeps the original position but replaces tags
+    store.upsert_assets([{**FIXTURE_ASSETS[0], "tags": ["arch_wall"]}])
+    assert store.find_assets(["mat_concrete"]) == []
+    assert [a["name"] for a in store.find_assets([])] == ["WallA", "WallB", "Door"]
+    assert store._connect().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_json_round_trip(tmp_path):
+    source = tmp_path / "inventory.json"
+    source.write_text(json.dumps({"version": "1.0", "assets": {a["name"]: a for a in FIXTURE_ASSETS}}))
+    store = SqliteInventoryStore(str(tmp_path / "inventory.db"))
+    assert store.import_json(str(source)) == 3
+
+    exported = tmp_path / "exported.json"
+    store.export_json(str(exported))
+    assert json.loads(exported.read_text())["assets"] == {a["name"]: a for a in FIXTURE_ASSETS}
+
+
+def test_concurrent_writers_and_readers(tmp_path):
+    path = str(tmp_path / "inventory.db")
+    SqliteInventoryStore(path)
+
+    def writer(i):
+        store = SqliteInventoryStore(path)
+        store.upsert_assets([{"name": f"W{i}_{j}", "tags": ["arch_wall"]} for j in range(20)])
+        store.find_assets(["arch_wall"])
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert SqliteInventoryStore(path).count() == 80
+
+
+def test_inventory_manager_sqlite_backend(tmp_path, monkeypatch):
+    monkeypatch.setattr(inventory_manager, "INVENTORY_BACKEND", "sqlite")
+    monkeypatch.setattr(inventory_manager, "INVENTORY_DB", str(tmp_path / "inventory.db"))
+    monkeypatch.setattr(inventory_manager, "INVENTORY_FILE", str(tmp_path / "inventory.json"))
+    InventoryManager.register_assets(FIXTURE_ASSETS)
+    assert InventoryManager.find_asset(["arch_door"])["name"] == "Door"
+    assert not (tmp_path / "inventory.json").exists()
+
+
+def test_find_fitting_orders_by_leftover(tmp_path):
+    store = SqliteInventoryStore(str(tmp_path / "inventory.db"))
+    store.upsert_assets(FIXTURE_ASSETS)
+    assert [a["name"] for a in store.find_fitting([], 5.0, 3.0)] == ["WallB", "WallA", "Door"]
+    assert [a["name"] for a in store.find_fitting(["arch_wall"], 4.5, 3.0)] == ["WallA"]
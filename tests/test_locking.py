@@ -0,0 +1,50 @@
+import subprocess
+import sys
+import threading
+import time
+
+from engine.locking import FileLock, lock_path_for
+
+HOLD_AND_DIE = """
+import fcntl, os, sys, time
+fd = os.open(sys.argv[1], os.O_RDWR | os.O_CREAT)
+fcntl.flock(fd, fcntl.LOCK_EX)
+print("locked", flush=True)
+time.sleep(0.3)
+os._exit(1)
+"""
+
+
+def test_shared_locks_coexist_and_exclusive_waits(tmp_path):
+    lock = FileLock(str(tmp_path / ".inventory.lock"))
+    order = []
+    with lock.shared():
+        with lock.shared():
+            order.append("two readers")
+
+        def writer():
+            with lock.exclusive():
+                order.append("writer")
+
+        t = threading.Thread(target=writer)
+        t.start()
+        time.sleep(0.1)
+        order.append("reader done")
+    t.join()
+    assert order == ["two readers", "reader done", "writer"]
+    assert lock.stats.acquisitions == 3
+    assert lock.stats.contended == 1 and lock.stats.max_wait_seconds >= 0.05
+
+
+def test_lock_released_when_holder_dies(tmp_path):
+    path = str(tmp_path / ".inventory.lock")
+    proc = subprocess.Popen([sys.executable, "-c", HOLD_AND_DIE, path], stdout=subprocess.PIPE, text=True)
+    assert proc.stdout.readline().strip() == "locked"
+    lock = FileLock(path)
+    with lock.exclusive():
+        assert proc.poll() is not None
+    assert lock.stats.contended == 1
+
+
+def test_lock_path_for_inventory():
+    assert lock_path_for("/reg/inventory.json") == "/reg/.inventory.lock"
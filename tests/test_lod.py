@@ -0,0 +1,53 @@
+import json
+from pathlib import Path
+
+import numpy as np
+
+from mf_v5 import BuildingSpec, generate
+from mf_v5.config import STORY_HEIGHT
+from mf_v5.export import ExportSettings
+from mf_v5.lod import floor_footprint, lod1_arrays, lod2_arrays, shell_walls
+from mf_v5.planning import plan_building
+
+
+def test_lod1_keeps_only_the_shell_and_exterior_windows():
+    plan = plan_building(BuildingSpec(width=20, depth=16, floors=2, seed=42))
+    floor = plan.floors[0]
+    rect = floor_footprint(floor)
+    pieces, exterior = shell_walls(floor)
+    on_edge = lambda s: s.y1 in (rect.min_y, rect.max_y) if s.side in ("north", "south") else s.x1 in (rect.min_x, rect.max_x)
+    assert all(on_edge(s) for s in pieces)
+    assert 0 < len(exterior) < len(floor.windows)
+    assert sum(1 for s in pieces if s.opening is not None) == len({w.center for _, w in exterior})
+
+    lod1 = lod1_arrays(plan)
+    # Shell walls reach the roof base
+    assert np.isclose(np.sort(np.unique(lod1.positions[:, 2]))[-2], 2 * STORY_HEIGHT)
+    assert lod1.positions[:, 0].min() >= rect.min_x - 0.1 - 1e-5
+
+
+def test_lod2_is_one_block_plus_roof():
+    plan = plan_building(BuildingSpec(width=20, depth=16, floors=3, seed=42))
+    lod2 = lod2_arrays(plan)
+    roof_triangles = sum(len(f.vertices) - 2 for f in plan.roof.faces)
+    assert lod2.triangle_count == 12 + roof_triangles
+    assert np.isclose(np.sort(np.unique(lod2.positions[:, 2]))[1], 3 * STORY_HEIGHT)
+
+
+def test_lods_are_exported_and_listed(tmp_path: Path):
+    spec = BuildingSpec(width=20, depth=16, floors=2, seed=42)
+    out = generate(spec, tmp_path, settings=ExportSettings(lod_levels=(0, 1, 2)))
+    manifest = json.loads(Path(out.export_manifest).read_text())
+    lods = manifest["lods"]
+    assert [(l["level"], l["file"]) for l in lods] == [(0, "Building.glb"), (1, "Building_LOD1.glb"), (2, "Building_LOD2.glb")]
+    assert lods[0]["triangles"] == out.geometry.triangle_count
+    assert lods[0]["triangles"] > lods[1]["triangles"] > lods[2]["triangles"]
+    assert all((tmp_path / l["file"]).exists() for l in lods)
+
+
+def test_small_spec_with_empty_lods_still_exports(tmp_path: Path):
+    # Too small to fit a room: the reduced LODs have no geometry
+    out = generate(BuildingSpec(width=6, depth=8, floors=2, seed=1), tmp_path, settings=ExportSettings(lod_levels=(0, 1, 2)))
+    lods = json.loads(Path(out.export_manifest).read_text())["lods"]
+    assert [l["triangles"] for l in lods[1:]] == [0, 0]
+    assert all((tmp_path / l["file"]).exists() for l in lods)
@@ -0,0 +1,147 @@
+from pathlib import Path
+
+import numpy as np
+
+from mf_v5 import BuildingSpec, RoofType, generate
+from mf_v5.datamodel import Rect, WallSegment
+from mf_v5.config import STORY_HEIGHT
+from mf_v5.mesh_arrays import (
+    MeshInstances, box_arrays, box_polygon_buffers, merge_arrays, polygon_buffers, roof_arrays, slab_arrays,
+    stair_arrays, stair_flight_arrays, wall_arrays,
+)
+from mf_v5.planning import plan_building
+from mf_v5.roof import build_roof
+from mf_v5.slabs import Slab
+from mf_v5.stairs import Stairwell
+from mf_v5.windows import WindowOpening, carve_windows
+
+
+def _face_normals(arrays):
+    tris = arrays.positions[arrays.indices.reshape(-1, 3)]
+    n = np.cross(tris[:, 1] - tris[:, 0], tris[:, 2] - tris[:, 0])
+    return n / np.linalg.norm(n, axis=1, keepdims=True)
+
+
+def test_box_template_is_outward_wound():
+    box = box_arrays(np.array([[0, 0, 0]]), np.array([[2, 3, 4]]))
+    assert box.vertex_count == 24
+    assert box.triangle_count == 12
+    assert box.positions.dtype == np.float32 and box.indices.dtype == np.uint32
+    # Geometric winding agrees with the stored normals
+    stored = box.normals[box.indices.reshape(-1, 3)[:, 0]]
+    assert np.allclose(_face_normals(box), stored, atol=1e-6)
+    centroid = box.positions.mean(axis=0)
+    face_centers = box.positions[box.indices.reshape(-1, 3)].mean(axis=1)
+    assert np.all(np.einsum("ij,ij->i", face_centers - centroid, stored) > 0)
+
+
+def test_wall_with_window_becomes_sill_and_lintel():
+    wall = WallSegment(0, "north", 0.0, 5.0, 6.0, 5.0, 3.0, 0.2)
+    carved = carve_windows({0: [wall]}, [WindowOpening(0, "north", (3.0, 5.0))])[0]
+    arrays = wall_arrays(carved, z_offset=3.2)
+    # left + right solid pieces, plus sill and lintel for the window piece
+    assert arrays.triangle_count == 4 * 12
+    assert np.isclose(arrays.positions[:, 2].min(), 3.2)
+    assert np.isclose(arrays.positions[:, 1].min(), 4.9)
+
+
+def test_slab_hole_and_merge():
+    slab = Slab(Rect(0, 0, 10, 10), 0.0, 0.2, "floor", hole_rect=Rect(4, 4, 6, 8))
+    holed = slab_arrays([slab])
+    assert holed.triangle_count == 4 * 12
+    merged = merge_arrays([holed, slab_arrays([Slab(Rect(0, 0, 1, 1), 3.0, 0.2, "ceiling")])])
+    assert merged.triangle_count == 5 * 12
+    assert merged.indices.max() == merged.vertex_count - 1
+
+
+def test_roof_and_stairs_arrays():
+    roof = roof_arrays(build_roof(Rect(0, 0, 10, 10), 0, RoofType.HIP))
+    assert roof.triangle_count == 4 + 2  # four slopes, quad bottom
+    stairs = stair_arrays(Stairwell(Rect(0, 0, 2, 4), 0, 99), total_floors=3)
+    assert stairs.triangle_count == 2 * 16 * 12
+    solid = stair_arrays(Stairwell(Rect(0, 0, 2, 4), 0, 99), total_floors=3, welded=True)
+    assert solid.triangle_count == stairs.triangle_count
+    assert solid.vertex_count == 2 * (6 * 16 + 2)  # shared vertices, not 24 per step
+
+
+def _edge_use_counts(arrays):
+    tris = arrays.indices.reshape(-1, 3)
+    edges = np.sort(np.concatenate([tris[:, [0, 1]], tris[:, [1, 2]], tris[:, [2, 0]]]), axis=1)
+    return np.unique(edges, axis=0, return_counts=True)[1]
+
+
+def test_stair_flights_are_closed_and_stamped_per_floor():
+    for stair_type in ("straight", "spiral"):
+        flight = stair_flight_arrays(Rect(0, 0, 2, 4), stair_type)
+        assert (_edge_use_counts(stair_flight_arrays(Rect(0, 0, 2, 4), stair_type, welded=True)) == 2).all()
+        assert np.isclose(flight.positions[:, 2].max(), STORY_HEIGHT)
+
+        well = Stairwell(Rect(0, 0, 2, 4), 0, 99, stair_type=stair_type)
+        stairs = stair_arrays(well, total_floors=4)
+        assert stairs.vertex_count == 3 * flight.vertex_count
+        top = stairs.positions[2 * flight.vertex_count:]
+        assert np.allclose(top, flight.positions + (0, 0, 2 * STORY_HEIGHT))
+    assert stair_flight_arrays(Rect(0, 0, 2, 4)) is stair_flight_arrays(Rect(0, 0, 2, 4))
+
+
+def test_straight_flight_faces_point_outward():
+    flight = stair_flight_arrays(Rect(0, 0, 2, 4))
+    tris = flight.positions[flight.indices.reshape(-1, 3)]
+    # Closed, consistently outward solid: positive signed volume
+    volume = np.einsum("ij,ij->i", tris[:, 0], np.cross(tris[:, 1], tris[:, 2])).sum() / 6
+    steps = np.arange(1, 17) * (STORY_HEIGHT / 16)
+    assert np.isclose(volume, (2 * 4 / 16 * steps).sum(), rtol=1e-4)
+
+
+def test_stair_faces_are_flat_shaded():
+    for stair_type in ("straight", "spiral"):
+        flight = stair_flight_arrays(Rect(0, 0, 2, 4), stair_type)
+        # Stored normals match each triangle's own plane
+        assert np.allclose(flight.normals[flight.indices.reshape(-1, 3)], _face_normals(flight)[:, None], atol=1e-5)
+        tris = flight.indices.reshape(-1, 3)
+        level = np.ptp(flight.positions[tris][:, :, 2], axis=1) < 1e-6
+        normals = flight.normals[tris[level]]
+        assert np.allclose(np.abs(normals), (0, 0, 1), atol=1e-6)
+        # Two triangles per tread point straight up
+        assert (normals[:, :, 2] > 0).all(axis=1).sum() == 2 * 16
+
+
+def test_generate_returns_geometry_without_bpy(tmp_path: Path):
+    out = generate(BuildingSpec(width=20, depth=16, floors=2, seed=42), tmp_path)
+    assert out.geometry is not None
+    assert out.geometry.triangle_count > 0
+    assert len(out.geometry.normals) == out.geometry.vertex_count
+
+
+def test_wall_instances_reproduce_merged_walls():
+    plan = plan_building(BuildingSpec(width=30, depth=24, floors=3, seed=11))
+    instances = MeshInstances()
+    for floor in plan.floors:
+        instances.add_walls(floor.walls, floor.z_offset)
+    merged = merge_arrays(wall_arrays(f.walls, f.z_offset) for f in plan.floors)
+
+    assert len(instances.shapes) < len(instances.placements) // 10
+    realized = instances.realize()
+    assert realized.triangle_count == merged.triangle_count
+    np.testing.assert_allclose(realized.positions, merged.positions, atol=1e-4)
+
+
+def test_box_polygon_buffers_share_corners_and_match_triangle_path():
+    mins, maxs = [(0, 0, 0), (2, 0, 0)], [(1, 0.2, 3), (3, 1, 0.5)]
+    buffers = box_polygon_buffers(mins, maxs)
+    assert buffers.positions.shape == (16, 3)
+    assert buffers.face_count == 12
+    boxes = box_arrays(mins, maxs)
+    # Same corners, same order and UVs as the 24-vertex box template
+    assert np.allclose(buffers.positions[buffers.loops], boxes.positions)
+    assert np.allclose(buffers.uvs, boxes.uvs)
+
+
+def test_polygon_buffers_keep_ngons():
+    roof = build_roof(Rect(0, 0, 10, 10), 0, RoofType.HIP)
+    buffers = polygon_buffers(face.vertices for face in roof.faces)
+    assert buffers.face_count == len(roof.faces)
+    assert len(buffers.loops) == sum(len(face.vertices) for face in roof.faces)
+    tris = roof_arrays(roof).polygon_buffers()
+    assert tris.face_count == roof_arrays(roof).triangle_count
+    assert np.array_equal(tris.loop_starts, np.arange(tris.face_count) * 3)
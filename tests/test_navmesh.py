@@ -0,0 +1,76 @@
+import json
+import struct
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+from mf_v5 import BuildingSpec, generate
+from mf_v5.config import STORY_HEIGHT
+from mf_v5.navmesh import build_navmesh
+from mf_v5.planning import plan_building
+
+
+def test_navmesh_polygons_skip_walls_and_stairwell():
+    plan = plan_building(BuildingSpec(width=20, depth=16, floors=2, seed=42))
+    navmesh = build_navmesh(plan)
+    stair = plan.stairwell.rect
+    for poly in navmesh.polygons:
+        pts = navmesh.vertices[poly]
+        xy = pts[:, :2]
+        # Counter-clockwise from above
+        area = np.sum(xy[:, 0] * np.roll(xy[:, 1], -1) - np.roll(xy[:, 0], -1) * xy[:, 1]) / 2
+        assert area > 0
+        if np.ptp(pts[:, 2]) > 1e-5:
+            continue  # The ramp over the flight
+        mid = xy.mean(axis=0)
+        assert not (stair.min_x < mid[0] < stair.max_x and stair.min_y < mid[1] < stair.max_y)
+
+    ramps = [p for p in navmesh.polygons if np.ptp(navmesh.vertices[p][:, 2]) > 1e-5]
+    assert len(ramps) == 1
+    assert np.isclose(np.ptp(navmesh.vertices[ramps[0]][:, 2]), STORY_HEIGHT)
+    (top, landing), = navmesh.links
+    assert np.isclose(top[2], landing[2])
+
+
+def test_door_connectors_share_edges_with_rooms_and_corridor():
+    plan = plan_building(BuildingSpec(width=20, depth=16, floors=1, seed=42))
+    navmesh = build_navmesh(plan)
+    edges = Counter(
+        tuple(sorted(edge))
+        for poly in navmesh.polygons
+        for edge in zip(poly, poly[1:] + poly[:1])
+    )
+    doors = navmesh.polygons[-len(plan.floors[0].doors):]
+    for door in doors:
+        shared = [tuple(sorted(e)) for e in zip(door, door[1:] + door[:1]) if edges[tuple(sorted(e))] == 2]
+        assert len(shared) == 2  # One edge into the room, one into the corridor
+
+
+def test_navmesh_is_exported(tmp_path: Path):
+    out = generate(BuildingSpec(width=20, depth=16, floors=2, seed=42), tmp_path)
+    manifest = json.loads(Path(out.export_manifest).read_text())
+    data = (tmp_path / manifest["navmesh"]).read_bytes()
+    json_len, _ = struct.unpack_from("<II", data, 12)
+    gltf = json.loads(data[20:20 + json_len])
+    assert gltf["nodes"][0]["name"].endswith("-navmesh")
+
+    data = json.loads((tmp_path / manifest["navmesh_polygons"]).read_text())
+    assert data["up"] == "Y" and len(data["links"]) == 1
+    vertices = np.array(data["vertices"])
+    assert max(i for poly in data["polygons"] for i in poly) == len(vertices) - 1
+    assert vertices[:, 1].max() > STORY_HEIGHT  # Y-up heights
+
+
+def test_empty_plan_still_writes_a_navmesh(tmp_path: Path):
+    from dataclasses import replace
+
+    from mf_v5.export import write_glb
+
+    plan = plan_building(BuildingSpec(width=20, depth=16, floors=1, seed=42))
+    plan = replace(plan, floors=[replace(f, rooms=[], corridor=None, doors=[]) for f in plan.floors])
+    navmesh = build_navmesh(plan)
+    assert len(navmesh.vertices) == 0 and navmesh.polygons == [] and navmesh.links == []
+    assert navmesh.to_arrays().triangle_count == 0
+    assert write_glb(tmp_path / "nav.glb", [("Building-navmesh", navmesh.to_arrays())]).exists()
+    assert json.loads(navmesh.write_json(tmp_path / "nav.json").read_text())["polygons"] == []
@@ -0,0 +1,64 @@
+from mf_v5.config import EPSILON
+from mf_v5.datamodel import DoorOpening, WallSegment, WindowOpening
+from mf_v5.openings import carve_openings, carve_segment
+
+
+def _wall(length=10.0, side="north"):
+    if side in ("north", "south"):
+        return WallSegment(0, side, 0.0, 0.0, length, 0.0, 3.0, 0.2)
+    return WallSegment(0, side, 0.0, 0.0, 0.0, length, 3.0, 0.2)
+
+
+def test_mixed_openings_in_one_sweep():
+    door = DoorOpening(0, "north", (2.0, 0.0), 1.0, 2.1)
+    window = WindowOpening(0, "north", (7.0, 0.0))
+    pieces = carve_segment(_wall(), [window, door])
+
+    spans = [(round(p.x1, 3), round(p.x2, 3), p.opening) for p in pieces]
+    assert spans == [
+        (0.0, 1.5, None),
+        (2.5, 6.4, None),
+        (6.4, 7.6, window),
+        (7.6, 10.0, None),
+    ]
+
+
+def test_dense_window_rhythm_covers_wall():
+    windows = [WindowOpening(0, "east", (0.0, 1.0 + 2.0 * i), width=1.0) for i in range(5)]
+    pieces = carve_openings({0: [_wall(side="east")]}, windows)[0]
+    assert len(pieces) == 11
+    assert sum(p.opening is not None for p in pieces) == 5
+    # Pieces tile the wall without gaps or overlaps
+    for a, b in zip(pieces, pieces[1:]):
+        assert abs(a.y2 - b.y1) < EPSILON
+    assert pieces[0].y1 == 0.0 and abs(pieces[-1].y2 - 10.0) < EPSILON
+
+
+def test_openings_outside_wall_or_other_side_are_ignored():
+    wall = _wall()
+    pieces = carve_openings({0: [wall]}, [
+        DoorOpening(0, "south", (5.0, 0.0), 1.0, 2.1),
+        WindowOpening(0, "north", (12.0, 0.0)),
+    ])[0]
+    assert pieces == [wall]
+
+
+def test_window_spans_leave_sill_and_lintel():
+    window = WindowOpening(0, "north", (5.0, 0.0))
+    assert window.solid_spans(3.0) == ((0.0, 1.0), (2.0, 3.0))
+    assert DoorOpening(0, "north", (5.0, 0.0), 1.0, 2.1).solid_spans(3.0) == ()
+
+
+def test_overlapping_openings_are_rejected():
+    import pytest
+
+    from mf_v5.exceptions import GeometryError
+
+    door = DoorOpening(0, "north", (5.0, 0.0), 1.0, 2.1)
+    window = WindowOpening(0, "north", (5.8, 0.0))
+    with pytest.raises(GeometryError, match="Overlapping openings"):
+        carve_segment(_wall(), [window, door])
+
+    # The same opening reaching the wall through both faces is cut once
+    pieces = carve_segment(_wall(), [door, door])
+    assert [(p.x1, p.x2) for p in pieces] == [(0.0, 4.5), (5.5, 10.0)]
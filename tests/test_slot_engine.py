@@ -0,0 +1,54 @@
+import math
+from types import SimpleNamespace
+
+import numpy as np
+
+from engine import slot_engine
+from engine.slot_engine import clear_aabb_cache, get_aabb, get_aabbs
+
+UNIT_BOX = [(x, y, z) for x in (-0.5, 0.5) for y in (-0.5, 0.5) for z in (-0.5, 0.5)]
+
+
+def make_obj(name, angle=0.0, offset=(0.0, 0.0, 0.0), scale=1.0):
+    c, s = math.cos(angle), math.sin(angle)
+    matrix = [
+        [c * scale, -s * scale, 0, offset[0]],
+        [s * scale, c * scale, 0, offset[1]],
+        [0, 0, scale, offset[2]],
+        [0, 0, 0, 1],
+    ]
+    return SimpleNamespace(name=name, matrix_world=matrix, bound_box=UNIT_BOX, dimensions=(scale, scale, scale))
+
+
+def reference_aabb(obj):
+    m = np.array(obj.matrix_world)
+    corners = np.array([m[:3, :3] @ np.array(v) + m[:3, 3] for v in obj.bound_box])
+    return corners.min(axis=0), corners.max(axis=0)
+
+
+def test_batched_aabbs_match_per_object_transform():
+    clear_aabb_cache()
+    objects = [make_obj(f"O{i}", angle=i * 0.3, offset=(i, -i, 2 * i), scale=1 + i * 0.1) for i in range(50)]
+    mins, maxs = get_aabbs(objects)
+    for obj, lo, hi in zip(objects, mins, maxs):
+        ref_lo, ref_hi = reference_aabb(obj)
+        np.testing.assert_allclose(lo, ref_lo, atol=1e-12)
+        np.testing.assert_allclose(hi, ref_hi, atol=1e-12)
+    assert get_aabb(make_obj("Moved", offset=(10, 0, 0)))["min"] == [9.5, -0.5, -0.5]
+
+
+def test_unchanged_objects_come_from_cache():
+    clear_aabb_cache()
+    objects = [make_obj("A"), make_obj("B", offset=(1, 0, 0))]
+    get_aabbs(objects)
+
+    # Poison the bound boxes: cached objects must not read them again
+    for obj in objects:
+        obj.bound_box = None
+    mins, _ = get_aabbs(objects)
+    assert mins[1].tolist() == [0.5, -0.5, -0.5]
+
+    moved = make_obj("B", offset=(5, 0, 0))
+    mins, _ = get_aabbs([objects[0], moved])
+    assert mins[1].tolist() == [4.5, -0.5, -0.5]
+    assert len(slot_engine._aabb_cache) == 2
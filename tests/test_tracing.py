@@ -0,0 +1,55 @@
+import json
+import os
+from pathlib import Path
+
+from mf_v5 import BuildingSpec, generate, generate_batch
+from mf_v5.engine import FLOOR_STAGES
+from mf_v5.tracing import Tracer, null_tracer
+
+
+def test_untraced_build_records_nothing(tmp_path: Path):
+    out = generate(BuildingSpec(width=20, depth=16, floors=2, seed=42), tmp_path)
+    assert out.timings == {} and all(f.timings == {} for f in out.floors)
+    assert null_tracer().spans == []
+    assert null_tracer().span("mesh") is null_tracer().span("walls")
+
+
+def test_stage_timings_and_chrome_trace(tmp_path: Path):
+    tracer = Tracer()
+    out = generate(BuildingSpec(width=20, depth=16, floors=2, seed=42), tmp_path, tracer=tracer)
+    assert {"floorplan", "carving", "mesh", "merge", "collider", "navmesh", "export", "manifest"} <= set(out.timings)
+    for floor in out.floors:
+        assert set(floor.timings) == set(FLOOR_STAGES)
+        assert all(0 <= floor.timings[stage] <= out.timings[stage] for stage in FLOOR_STAGES)
+
+    trace = tracer.write_chrome_trace(tmp_path / "trace.json")
+    events = json.loads(trace.read_text())["traceEvents"]
+    assert len(events) == len(tracer.spans)
+    assert all(e["ph"] == "X" and e["dur"] >= 0 for e in events)
+    assert {"carving:0", "carving:1", "merge"} <= {e["name"] for e in events}
+
+
+def test_batch_trace_tags_buildings_and_worker_planning(tmp_path: Path):
+    specs = [BuildingSpec(width=20, depth=16, floors=1, seed=s) for s in (1, 2)]
+    tracer = Tracer()
+    results = generate_batch(specs, tmp_path, workers=2, tracer=tracer)
+    assert all(r.ok and "floorplan" in r.output.timings for r in results)
+
+    events = tracer.chrome_trace()["traceEvents"]
+    assert {e["args"]["building"] for e in events} == {0, 1}
+    planning = {e["pid"] for e in events if e["name"].startswith("floorplan")}
+    assert os.getpid() not in planning
+
+
+def test_session_keeps_its_own_tracer(tmp_path: Path):
+    from mf_v5.incremental import BuildSession
+
+    tracer = Tracer()
+    session = BuildSession(tracer=tracer)
+    first = generate(BuildingSpec(width=20, depth=16, floors=2, seed=42), tmp_path / "a", session=session)
+    assert session.tracer is tracer and "floorplan" in first.timings
+    spans = len(tracer.spans)
+
+    second = generate(BuildingSpec(width=20, depth=16, floors=2, seed=43), tmp_path / "b", session=session)
+    assert session.tracer is tracer and len(tracer.spans) > spans
+    assert second.timings["merge"] < tracer.timings()["merge"]
@@ -0,0 +1,72 @@
+import numpy as np
+
+from mf_v5 import BuildingSpec
+from mf_v5.cleanup import dedupe_segments, fuse_shared_walls, remove_zero_length_segments
+from mf_v5.datamodel import WallSegment, WallSegmentTable, WindowOpening
+from mf_v5.doors import corridor_door_openings
+from mf_v5.adjacency import build_adjacency, corridor_facing_walls
+from mf_v5.floorplan import generate_floorplan
+from mf_v5.openings import carve_openings
+from mf_v5.planning import plan_building
+from mf_v5.walls import build_room_wall_segments, build_room_wall_table
+from mf_v5.windows import generate_window_placements
+
+
+def _floor_openings(rooms, corridor):
+    lookup = {r.id: (r.rect.min_x, r.rect.min_y, r.rect.max_x, r.rect.max_y) for r in rooms}
+    doors = corridor_door_openings(corridor_facing_walls(rooms, corridor), lookup)
+    return [*doors, *generate_window_placements(rooms)]
+
+
+def test_table_pipeline_matches_object_pipeline():
+    rooms, corridor = generate_floorplan(30, 24, 9, 0)
+    openings = _floor_openings(rooms, corridor)
+
+    by_room = carve_openings(build_room_wall_segments(rooms), openings)
+    expected = dedupe_segments(remove_zero_length_segments([s for segs in by_room.values() for s in segs]))
+
+    table = carve_openings(build_room_wall_table(rooms), openings)
+    table = dedupe_segments(remove_zero_length_segments(table))
+
+    assert isinstance(table, WallSegmentTable)
+    assert table.to_segments() == expected
+    assert sum(s.opening is not None for s in table) == sum(s.opening is not None for s in expected)
+
+
+def test_table_round_trip_and_views():
+    window = WindowOpening(1, "north", (1.0, 2.0))
+    segments = [
+        WallSegment(0, "south", 0, 0, 4, 0, 3.0, 0.2),
+        WallSegment(1, "north", 0, 2, 2, 2, 3.0, 0.2, window),
+        WallSegment(1, "east", 2, 2, 2, 2, 3.0, 0.2),
+    ]
+    table = WallSegmentTable.from_segments(segments)
+    assert list(table) == segments
+    view = table[:2]
+    assert np.shares_memory(view.x1, table.x1)
+    assert view[1].opening == window
+    assert len(remove_zero_length_segments(table)) == 2
+
+    joined = WallSegmentTable.concat([table, table[1:2]])
+    assert joined[3] == segments[1]
+    assert len(dedupe_segments(joined)) == 3
+
+
+def test_fused_table_matches_fused_objects():
+    rooms, corridor = generate_floorplan(30, 24, 9, 0)
+    openings = _floor_openings(rooms, corridor)
+    adjacency = build_adjacency(rooms)
+
+    by_room, moved = fuse_shared_walls(build_room_wall_segments(rooms), openings, adjacency)
+    table, table_moved = fuse_shared_walls(build_room_wall_table(rooms), openings, adjacency)
+    assert table.to_segments() == [s for segs in by_room.values() for s in segs]
+    assert table_moved == moved
+
+    carved = carve_openings(table, table_moved)
+    expected = carve_openings(by_room, moved)
+    assert carved.to_segments() == [s for segs in expected.values() for s in segs]
+
+
+def test_planned_floors_keep_walls_columnar():
+    plan = plan_building(BuildingSpec(width=30, depth=24, floors=2, seed=9))
+    assert all(isinstance(floor.walls, WallSegmentTable) for floor in plan.floors)
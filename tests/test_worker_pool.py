@@ -0,0 +1,62 @@
+import sys
+from pathlib import Path
+
+from engine.worker_pool import WorkerPool
+
+FAKE_WORKER = [sys.executable, str(Path(__file__).parent / "fixtures" / "fake_worker.py")]
+
+
+def test_map_keeps_order_and_reuses_warm_workers():
+    with WorkerPool(size=2, command=FAKE_WORKER) as pool:
+        results = pool.map({"command": "create_wall", "id": i} for i in range(10))
+    assert [r["id"] for r in results] == list(range(10))
+    assert all(r["status"] == "success" and "duration_ms" in r for r in results)
+    assert len({r["pid"] for r in results}) == 2
+    assert pool.stats == {"jobs": 10, "recycled": 0, "crashed": 0}
+
+
+def test_workers_recycled_after_job_and_memory_limits():
+    with WorkerPool(size=1, command=FAKE_WORKER, max_jobs=2, max_rss_mb=100) as pool:
+        pids = [pool.submit({"command": "create_wall"})["pid"] for _ in range(4)]
+        assert pids[0] == pids[1] != pids[2] == pids[3]
+        heavy = pool.submit({"command": "create_wall", "rss_mb": 500})
+        assert pool.submit({"command": "create_wall"})["pid"] != heavy["pid"]
+    assert pool.stats["recycled"] == 3
+
+
+def test_crashed_and_hung_workers_are_restarted():
+    with WorkerPool(size=1, command=FAKE_WORKER, job_timeout=0.5) as pool:
+        crashed = pool.submit({"command": "crash", "id": "c"})
+        assert crashed["status"] == "error" and crashed["id"] == "c"
+        assert "exited with code 3" in crashed["message"]
+        hung = pool.submit({"command": "sleep", "seconds": 5})
+        assert "timed out" in hung["message"]
+        assert pool.submit({"command": "create_wall"})["status"] == "success"
+    assert pool.stats["crashed"] == 2
+
+
+def test_close_stops_workers_that_are_busy():
+    import threading
+    import time
+
+    pool = WorkerPool(size=1, command=FAKE_WORKER, job_timeout=30)
+    (worker,) = pool._workers
+    results = []
+    job = threading.Thread(target=lambda: results.append(pool.submit({"command": "sleep", "seconds": 30})))
+    job.start()
+    time.sleep(0.5)
+    pool.close()
+    job.join(10)
+    assert not job.is_alive() and worker.proc.poll() is not None
+    assert results[0]["status"] == "error" and not pool._workers
+
+
+def test_failed_replacement_drops_the_slot():
+    import pytest
+
+    with WorkerPool(size=1, command=FAKE_WORKER) as pool:
+        pool.command = [str(Path(__file__).parent / "fixtures" / "missing_blender")]
+        assert pool.submit({"command": "crash"})["status"] == "error"
+        assert pool.size == 0 and not pool._workers
+        with pytest.raises(RuntimeError, match="no workers left"):
+            pool.submit({"command": "create_wall"})